@@ -21,6 +21,7 @@ def validate(
     limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     limit_rows: Optional[int] = None,
     parallel: bool = False,
+    aggregate: bool = False,
     # Deprecated
     resource_name: Optional[str] = None,
     **options: Any,
@@ -64,6 +65,7 @@ def validate(
         checklist,
         name=name,
         parallel=parallel,
+        aggregate=aggregate,
         limit_rows=limit_rows,
         limit_errors=limit_errors,
     )
@@ -25,6 +25,7 @@ def test_analyze_package():
         "fieldStats",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -39,6 +40,7 @@ def test_analyze_package():
         "fieldStats",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -53,6 +55,7 @@ def test_analyze_package():
         "fieldStats",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -73,6 +76,7 @@ def test_analyze_package_detailed():
         "correlations",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -88,6 +92,7 @@ def test_analyze_package_detailed():
         "correlations",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -103,6 +108,7 @@ def test_analyze_package_detailed():
         "correlations",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -2,6 +2,8 @@ import sys
 
 import pytest
 
+from frictionless import settings
+from frictionless.analyzer import analyzer as analyzer_module
 from frictionless.resources import TableResource
 
 pytestmark = pytest.mark.skipif(
@@ -23,6 +25,7 @@ def test_analyze_resource():
         "fieldStats",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -48,6 +51,7 @@ def test_analyze_resource_detailed():
         "correlations",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "md5",
         "sha256",
         "bytes",
@@ -134,10 +138,6 @@ def test_analyze_resource_detailed_descriptive_statistics_with_outliers():
     assert analysis["fieldStats"]["average_grades"]["outliers"] == [10000.0]
 
 
-@pytest.mark.skipif(
-    sys.version_info >= (3, 12),
-    reason="Fix for Python3.12+ (possible bug to investigate)",
-)
 def test_analyze_resource_detailed_descriptive_statistics_variables_correlation():
     resource = TableResource(path="data/analysis-data.csv")
     analysis = resource.analyze(detailed=True)
@@ -147,22 +147,15 @@ def test_analyze_resource_detailed_descriptive_statistics_variables_correlation(
         "house_area",
         "average_grades",
     ]
-    assert (
-        analysis["correlations"]["average_grades"][0]["fieldName"] == "parent_age"
-        and analysis["correlations"]["average_grades"][0]["corr"] == -0.09401771232099933
-    )
-    assert (
-        analysis["correlations"]["average_grades"][1]["fieldName"] == "parent_salary"
-        and analysis["correlations"]["average_grades"][1]["corr"] == 0.4241304392492213
-    )
-    assert (
-        analysis["correlations"]["average_grades"][2]["fieldName"] == "house_area"
-        and analysis["correlations"]["average_grades"][2]["corr"] == 0.14354348594097088
-    )
-    assert (
-        analysis["correlations"]["average_grades"][3]["fieldName"] == "average_grades"
-        and analysis["correlations"]["average_grades"][3]["corr"] == 1.0
-    )
+    correlations = analysis["correlations"]["average_grades"]
+    assert correlations[0]["fieldName"] == "parent_age"
+    assert correlations[0]["corr"] == pytest.approx(-0.09401771232099933)
+    assert correlations[1]["fieldName"] == "parent_salary"
+    assert correlations[1]["corr"] == pytest.approx(0.4241304392492213)
+    assert correlations[2]["fieldName"] == "house_area"
+    assert correlations[2]["corr"] == pytest.approx(0.14354348594097088)
+    assert correlations[3]["fieldName"] == "average_grades"
+    assert correlations[3]["corr"] == 1.0
 
 
 def test_analyze_resource_detailed_non_numeric_summary():
@@ -200,6 +193,7 @@ def test_analyze_resource_with_empty_rows():
         "fieldStats",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "fields",
         "rows",
     ]
@@ -217,6 +211,7 @@ def test_analyze_resource_detailed_with_empty_rows():
         "fieldStats",
         "averageRecordSizeInBytes",
         "timeTaken",
+        "timeTakenByPhase",
         "fields",
         "rows",
     ]
@@ -245,3 +240,55 @@ def test_analyze_resource_detailed_with_invalid_data():
     assert analysis["rowsWithNullValues"] == 3
     assert analysis["notNullRows"] == 1
     assert analysis["variableTypes"] == {"integer": 3, "string": 1}
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("limit", [100, 3])
+def test_analyze_resource_detailed_integer_outliers(monkeypatch, numpy, limit):
+    if not numpy:
+        monkeypatch.setattr(analyzer_module, "get_numpy", lambda: None)
+    monkeypatch.setattr(settings, "DEFAULT_EXACT_STATS_SIZE", limit)
+    data = [["id"], [1], [2], [3], [2], [3], [1], [1000]]
+    resource = TableResource(data=data)
+    analysis = resource.analyze(detailed=True)
+    outliers = analysis["fieldStats"]["id"]["outliers"]
+    assert outliers == [1000]
+    assert type(outliers[0]) is int
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("limit", [100, 3])
+@pytest.mark.parametrize("large", [2**60 + 1, 2**70 + 1])
+def test_analyze_resource_detailed_integer_outliers_exact(
+    monkeypatch, numpy, limit, large
+):
+    if not numpy:
+        monkeypatch.setattr(analyzer_module, "get_numpy", lambda: None)
+    monkeypatch.setattr(settings, "DEFAULT_EXACT_STATS_SIZE", limit)
+    data = [["id"], [1], [2], [None], [3], [2], [3], [1], [large]]
+    resource = TableResource(data=data)
+    analysis = resource.analyze(detailed=True)
+    assert analysis["fieldStats"]["id"]["outliers"] == [large]
+
+
+def test_analyze_resource_detailed_estimated_statistics(monkeypatch):
+    exact = TableResource(path="data/analysis-data.csv").analyze(detailed=True)
+    monkeypatch.setattr(settings, "DEFAULT_EXACT_STATS_SIZE", 3)
+    resource = TableResource(path="data/analysis-data.csv")
+    analysis = resource.analyze(detailed=True)
+    stats = analysis["fieldStats"]["average_grades"]
+    assert stats["mean"] == pytest.approx(exact["fieldStats"]["average_grades"]["mean"])
+    assert stats["stdev"] == pytest.approx(exact["fieldStats"]["average_grades"]["stdev"])
+    assert stats["median"] == exact["fieldStats"]["average_grades"]["median"]
+    assert stats["mode"] == 86.79
+    assert stats["missingValues"] == 2
+    assert stats["outliers"] == [10000.0]
+    correlations = analysis["correlations"]["average_grades"]
+    assert [item["fieldName"] for item in correlations] == [
+        "parent_age",
+        "parent_salary",
+        "house_area",
+        "average_grades",
+    ]
+    for item, expected in zip(correlations, exact["correlations"]["average_grades"]):
+        assert item["corr"] == pytest.approx(expected["corr"])
@@ -0,0 +1,149 @@
+import pickle
+import random
+import statistics
+
+import pytest
+
+from frictionless.analyzer import summary as summary_module
+from frictionless.analyzer.summary import (
+    CellLog,
+    CorrelationMatrix,
+    Digest,
+    DistinctCount,
+    FrequentValues,
+    Moments,
+    NumericSummary,
+)
+
+# General
+
+
+def test_numeric_summary_exact():
+    values = [1, 5, 2, 8, 2, 9, 4]
+    summary = NumericSummary()
+    for value in values:
+        summary.add(value)
+    assert summary.exact
+    assert summary.count == 7
+    assert summary.mean() == statistics.mean(values)
+    assert summary.median() == statistics.median(values)
+    assert summary.mode() == 2
+    assert summary.most_common() == (2, 2)
+    assert summary.stdev() == statistics.stdev(values)
+    assert summary.quantiles() == statistics.quantiles(values)
+    assert summary.minimum() == 1
+    assert summary.maximum() == 9
+    assert summary.unique() == 6
+
+
+def test_numeric_summary_estimated():
+    generator = random.Random(0)
+    values = [generator.gauss(100, 10) for _ in range(20000)] + [42.0] * 500
+    summary = NumericSummary(limit=1000)
+    for value in values:
+        summary.add(value)
+    assert not summary.exact
+    assert summary.count == len(values)
+    assert summary.mean() == pytest.approx(statistics.mean(values))
+    assert summary.stdev() == pytest.approx(statistics.stdev(values))
+    assert summary.median() == pytest.approx(statistics.median(values), rel=0.01)
+    assert summary.quantiles() == pytest.approx(statistics.quantiles(values), rel=0.01)
+    assert summary.mode() == 42.0
+    assert summary.minimum() == min(values)
+    assert summary.maximum() == max(values)
+    assert summary.unique() == pytest.approx(20001, rel=0.05)
+
+
+@pytest.mark.parametrize("limit", [10, 100000])
+def test_numeric_summary_merge(limit):
+    values = [float(number % 97) for number in range(5000)]
+    summaries = [NumericSummary(limit=limit) for _ in range(3)]
+    for index, value in enumerate(values):
+        summaries[index % 3].add(value)
+    summary = NumericSummary(limit=limit)
+    for part in summaries:
+        summary.merge(pickle.loads(pickle.dumps(part)))
+    assert summary.count == 5000
+    assert summary.mean() == pytest.approx(statistics.mean(values))
+    assert summary.stdev() == pytest.approx(statistics.stdev(values))
+    assert summary.median() == pytest.approx(statistics.median(values), abs=1)
+    assert summary.unique() == pytest.approx(97, rel=0.05)
+
+
+def test_moments_merge():
+    left, right, whole = Moments(), Moments(), Moments()
+    for value in range(100):
+        (left if value < 30 else right).add(value)
+        whole.add(value)
+    left.merge(right)
+    assert left.count == 100
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.variance == pytest.approx(statistics.variance(range(100)))
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_correlation_matrix(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(summary_module, "get_numpy", lambda: None)
+    nan = float("nan")
+    xs = [1.0, 2.0, 3.0, 4.0, nan, 5.0, 6.0]
+    ys = [2.0, 1.0, 4.0, 3.0, 9.0, 7.0, 5.0]
+    zs = [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+    matrix = CorrelationMatrix(["x", "y", "z"])
+    matrix.update({"x": xs[:3], "y": ys[:3], "z": zs[:3]})
+    matrix.update({"x": xs[3:], "y": ys[3:], "z": zs[3:]})
+    complete = [(x, y) for x, y in zip(xs, ys) if x == x]
+    expected = statistics.correlation(*zip(*complete))  # type: ignore
+    assert matrix.correlation("x", "y") == pytest.approx(expected)
+    assert matrix.correlation("y", "x") == pytest.approx(expected)
+    assert matrix.correlation("x", "x") == 1.0
+    assert matrix.correlation("x", "z") is None
+
+
+def test_correlation_matrix_merge():
+    generator = random.Random(0)
+    xs = [generator.gauss(1e6, 1) for _ in range(1000)]
+    ys = [x * 2 + generator.gauss(0, 1) for x in xs]
+    parts = [CorrelationMatrix(["x", "y"]) for _ in range(2)]
+    parts[0].update({"x": xs[:300], "y": ys[:300]})
+    parts[1].update({"x": [x + 0.0 for x in xs[300:]], "y": ys[300:]})
+    matrix = CorrelationMatrix(["x", "y"])
+    for part in parts:
+        matrix.merge(pickle.loads(pickle.dumps(part)))
+    expected = statistics.correlation(xs, ys)
+    assert matrix.correlation("x", "y") == pytest.approx(expected, rel=1e-9)
+
+
+def test_digest():
+    digest = Digest()
+    for value in range(10001):
+        digest.add(float(value))
+    assert digest.quantile(0.5) == pytest.approx(5000, rel=0.01)
+    assert digest.quantile(0.99) == pytest.approx(9900, rel=0.01)
+    assert len(digest.centroids()) < 1000
+
+
+def test_frequent_values():
+    frequent = FrequentValues(size=10)
+    for value in range(10000):
+        frequent.add(value % 1000)
+        frequent.add("hit")
+    assert frequent.most_common()[0] == "hit"  # type: ignore
+
+
+def test_distinct_count():
+    left, right = DistinctCount(), DistinctCount()
+    for value in range(50000):
+        left.add(value)
+        right.add(value + 25000)
+    left.merge(right)
+    assert left.count() == pytest.approx(75000, rel=0.05)
+
+
+def test_cell_log():
+    log = CellLog(chunk_size=2)
+    for row_number in range(2, 7):
+        log.append(row_number, row_number * 10)
+    assert list(log) == [(2, 20), (3, 30), (4, 40), (5, 50), (6, 60)]
+    assert list(log) == [(2, 20), (3, 30), (4, 40), (5, 50), (6, 60)]
+    log.close()
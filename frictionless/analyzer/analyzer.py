@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-import statistics
-from collections import Counter
+from array import array
 from decimal import Decimal
 from math import nan
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import attrs
 
-from .. import helpers
+from .. import helpers, settings
 from . import types
+from .summary import CorrelationMatrix, NumericSummary, get_numpy
 
 if TYPE_CHECKING:
     from ..resources import TableResource
@@ -32,29 +42,61 @@ class Analyzer:
         analysis_report["fieldStats"] = {}
 
         # Iterate rows
-        columns_data: Dict[str, List[Any]] = {}
+        phase = helpers.Timer()
+        timings: Dict[str, float] = {}
         numeric = ["integer", "numeric", "number"]
         with resource:
+            # Prepare accumulators
+            # The numeric columns are collected into typed blocks; the whole
+            # columns are kept while the statistics can be exact, then the blocks
+            # are summarized in one pass (see `NumericSummary`/`CorrelationMatrix`)
+            limit = settings.DEFAULT_EXACT_STATS_SIZE
+            fields = resource.schema.fields
+            numeric_names = [f.name for f in fields if f.type in numeric]
+            uncategorical = [*numeric, "boolean"]
+            categorical_names = [f.name for f in fields if f.type not in uncategorical]
+            summaries = {name: NumericSummary(limit=limit) for name in numeric_names}
+            categories: Dict[str, Set[Any]] = {name: set() for name in categorical_names}
+            integers = {f.name for f in fields if f.type == "integer"}
+            matrix = CorrelationMatrix(numeric_names)
+            block, exacts = _create_block(numeric_names, integers)
+            exact = True
+
             for row in resource.row_stream:
-                null_columns = 0
-                for field_name in row:
-                    field = resource.schema.get_field(field_name)
-                    cell = field.read_cell(row.get(field_name))[0]
-                    if field.name not in columns_data:
-                        columns_data[field.name] = []
-                    if cell is None:
-                        if field.type in numeric:
-                            cell = nan
-                        null_columns += 1
-                    if isinstance(cell, Decimal):
-                        cell = float(cell)
-                    columns_data[field.name].append(cell)
-                if null_columns > 0:
+                # The row is already cast so the cells are not read again
+                cells = dict(zip(row.field_names, row.to_list()))
+                if None in cells.values():
                     analysis_report["rowsWithNullValues"] += 1  # type: ignore
+                if not detailed:
+                    continue
+                for name in numeric_names:
+                    cell = cells.get(name)
+                    if cell is None:
+                        block[name].append(nan)
+                        if name in integers:
+                            exacts[name].append(0)
+                        continue
+                    summaries[name].add(
+                        float(cell) if isinstance(cell, Decimal) else cell
+                    )
+                    block[name].append(cell)
+                    if name in integers:
+                        _append_exact(exacts, name, cell)
+                for name in categorical_names:
+                    categories[name].add(cells.get(name))
+                if numeric_names and len(block[numeric_names[0]]) > limit:
+                    matrix.update(block)
+                    block, exacts = _create_block(numeric_names, integers)
+                    exact = False
+        timings["read"] = phase.time
 
         # Field/Column Stats
-        if columns_data and detailed:
+        if resource.stats.rows and detailed:
+            phase = helpers.Timer()
+            if numeric_names and len(block[numeric_names[0]]):
+                matrix.update(block)
             analysis_report["correlations"] = {}
+            outliers: Dict[str, Tuple[List[Any], Any, Any]] = {}
             for field in resource.schema.fields:
                 analysis_report["fieldStats"][field.name] = {}
 
@@ -63,67 +105,66 @@ class Analyzer:
                 analysis_report["variableTypes"][field.type] += 1  # type: ignore
 
                 # summary - categorical data
-                if field.type not in [*numeric, "boolean"]:
+                if field.name in categories:
                     analysis_report["fieldStats"][field.name]["type"] = "categorical"
-                    analysis_report["fieldStats"][field.name]["values"] = set(
-                        columns_data[field.name]
-                    )
+                    analysis_report["fieldStats"][field.name]["values"] = categories[
+                        field.name
+                    ]
 
                 # descriptive statistics - numeric data
-                if field.type in numeric:
+                if field.name in summaries:
                     analysis_report["fieldStats"][field.name]["type"] = "numeric"
-                    rows_without_nan_values = [
-                        cell for cell in columns_data[field.name] if cell is not nan
-                    ]
+                    summary = summaries[field.name]
 
                     # skip rows with nan values
-                    if len(rows_without_nan_values) < 2:
+                    if summary.count < 2:
                         continue
 
+                    column = block[field.name] if exact else None
                     analysis_report["fieldStats"][field.name].update(  # type: ignore
-                        _statistics(rows_without_nan_values)  # type: ignore
+                        _statistics(summary, column)  # type: ignore
                     )
                     analysis_report["fieldStats"][field.name]["outliers"] = []
                     analysis_report["fieldStats"][field.name]["missingValues"] = (
-                        resource.stats.rows - len(rows_without_nan_values)  # type: ignore
+                        resource.stats.rows - summary.count  # type: ignore
                     )
 
-                    # calculate correlation between variables(columns/fields)
-                    for field_y in resource.schema.fields:
-                        if field_y.type in numeric:
-                            # filter rows with nan values, correlation return nan if any of the
-                            # row has nan value.
-                            var_x: List[Any] = []
-                            var_y: List[Any] = []
-                            for cell_x, cell_y in zip(
-                                columns_data[field.name], columns_data[field_y.name]
-                            ):
-                                if nan not in [cell_x, cell_y]:
-                                    var_x.append(cell_x)
-                                    var_y.append(cell_y)
-
-                            # check for at least 2 data points for correlation calculation
-                            if len(var_x) > 2:
-                                if field.name not in analysis_report["correlations"]:
-                                    analysis_report["correlations"][field.name] = []
-                                correlation_result = {  # type: ignore
-                                    "fieldName": field_y.name,
-                                    "corr": statistics.correlation(var_x, var_y),  # type: ignore
-                                }
-                                analysis_report["correlations"][field.name].append(  # type: ignore
-                                    correlation_result
-                                )
-
-                    # calculate outliers
+                    # correlation between variables(columns/fields)
+                    # (pairwise-complete: rows with nan values are ignored per pair)
+                    for name_y in numeric_names:
+                        correlation = matrix.correlation(field.name, name_y)
+                        if correlation is not None:
+                            if field.name not in analysis_report["correlations"]:
+                                analysis_report["correlations"][field.name] = []
+                            correlation_result = {  # type: ignore
+                                "fieldName": name_y,
+                                "corr": correlation,
+                            }
+                            analysis_report["correlations"][field.name].append(  # type: ignore
+                                correlation_result
+                            )
+
+                    # outliers are found after all the bounds are known
                     lower_bound, upper_bound = analysis_report["fieldStats"][field.name][  # type: ignore
                         "bounds"
                     ]
-                    for cell in columns_data[field.name]:
-                        if cell is not nan:
-                            if not lower_bound < cell < upper_bound:
-                                analysis_report["fieldStats"][field.name][  # type: ignore
-                                    "outliers"
-                                ].append(cell)
+                    outliers[field.name] = (
+                        analysis_report["fieldStats"][field.name]["outliers"],  # type: ignore
+                        lower_bound,
+                        upper_bound,
+                    )
+            timings["statistics"] = phase.time
+
+            # calculate outliers
+            # The columns are read again if they were not kept
+            phase = helpers.Timer()
+            if exact:
+                _find_outliers(outliers, [(block, exacts)])
+            elif outliers:
+                names = list(outliers)
+                blocks = _read_blocks(resource, names, integers, size=limit)
+                _find_outliers(outliers, blocks)
+            timings["outliers"] = phase.time
 
         analysis_report["notNullRows"] = (  # type: ignore
             resource.stats.rows - analysis_report["rowsWithNullValues"]  # type: ignore
@@ -134,54 +175,124 @@ class Analyzer:
                 resource.stats.bytes / resource.stats.rows
             )  # type: ignore
         analysis_report["timeTaken"] = timer.time
+        analysis_report["timeTakenByPhase"] = timings
+        # Hashes are already reported as the md5/sha256 stats
+        filter = lambda a, v: v is not None and a.name != "hashes"  # type: ignore
         return {
             **analysis_report,
-            **attrs.asdict(resource.stats, filter=lambda _, v: v is not None),
+            **attrs.asdict(resource.stats, filter=filter),  # type: ignore
         }
 
 
 # Internal
 
 
-def _common_values(data: Union[float, int]) -> Union[float, int]:
-    """Finds highly common data with frequency
+Block = Tuple[Dict[str, "array[float]"], Dict[str, Any]]
 
-    Args:
-        data (float|int): data
-
-    Returns:
-        (float|int): highly common element and its count
-    """
-    column = Counter(data)  # type: ignore
-    common_value = column.most_common(1)  # type: ignore
-    if common_value and common_value[0][1] > 1:
-        return common_value[0][0]  # type: ignore
-    return None  # type: ignore
 
+def _create_block(names: List[str], integers: Set[str]) -> Block:
+    """Create typed numeric columns
 
-def _statistics(data: Union[float, int]) -> Dict[str, Any]:
+    The integer fields are also kept exactly (floats lose precision
+    above 2**53) with 0 for the nulls marked as NaN in the float columns.
+    """
+    columns = {name: array("d") for name in names}
+    exacts = {name: array("q") for name in names if name in integers}
+    return columns, exacts
+
+
+def _append_exact(exacts: Dict[str, Any], name: str, cell: int) -> None:
+    """Append an exact integer switching to a list out of the int64 range"""
+    try:
+        exacts[name].append(cell)
+    except OverflowError:
+        exacts[name] = list(exacts[name])
+        exacts[name].append(cell)
+
+
+def _read_blocks(
+    resource: TableResource, names: List[str], integers: Set[str], *, size: int
+) -> Iterator[Block]:
+    """Read the numeric columns of a resource again by blocks"""
+    with resource.to_copy() as copy:
+        columns, exacts = _create_block(names, integers)
+        for row in copy.row_stream:  # type: ignore
+            for name in names:
+                cell = row[name]
+                columns[name].append(cell if cell is not None else nan)
+                if name in exacts:
+                    _append_exact(exacts, name, cell if cell is not None else 0)
+            if len(columns[names[0]]) >= size:
+                yield columns, exacts
+                columns, exacts = _create_block(names, integers)
+        yield columns, exacts
+
+
+def _find_outliers(
+    outliers: Dict[str, Tuple[List[Any], Any, Any]],
+    blocks: Iterable[Block],
+) -> None:
+    """Collect the cells out of the bounds
+
+    The cells of the integer fields are taken from the exact columns.
+    """
+    numpy = get_numpy()
+    for columns, exacts in blocks:
+        for name, (items, lower_bound, upper_bound) in outliers.items():
+            column = columns[name]
+            exact = exacts.get(name)
+            if numpy:
+                values = numpy.frombuffer(column, dtype=float)
+                mask = (values <= lower_bound) | (values >= upper_bound)
+                if exact is None:
+                    items.extend(values[mask].tolist())
+                    continue
+                items.extend(exact[position] for position in numpy.flatnonzero(mask))
+                continue
+            for position, cell in enumerate(column):
+                if cell == cell and not lower_bound < cell < upper_bound:
+                    items.append(cell if exact is None else exact[position])
+
+
+def _statistics(
+    summary: NumericSummary, column: Optional[array[float]] = None
+) -> Dict[str, Any]:
     """Calculate the descriptive statistics of the data
 
     Args:
-        data (float|int): data
+        summary (NumericSummary): summary of the data
+        column (array?): the whole column to compute vectorized quantiles
 
     Returns:
         dict : statistics of the data
     """
+    most_common = summary.most_common()
     resource_stats: Dict[str, Any] = {}
-    resource_stats["mean"] = statistics.mean(data)  # type: ignore
-    resource_stats["median"] = statistics.median(data)  # type: ignore
-    resource_stats["mode"] = _common_values(data)
-    resource_stats["variance"] = statistics.variance(data)  # type: ignore
-    resource_stats["quantiles"] = statistics.quantiles(data)  # type: ignore
-    resource_stats["stdev"] = statistics.stdev(data)  # type: ignore
-    resource_stats["max"] = max(data)  # type: ignore
-    resource_stats["min"] = min(data)  # type: ignore
+    resource_stats["mean"] = summary.mean()
+    resource_stats["median"] = summary.median()
+    resource_stats["mode"] = (
+        most_common[0] if most_common and most_common[1] > 1 else None
+    )
+    resource_stats["variance"] = summary.variance()
+    resource_stats["quantiles"] = _quantiles(summary, column)
+    resource_stats["stdev"] = summary.stdev()
+    resource_stats["max"] = summary.maximum()
+    resource_stats["min"] = summary.minimum()
     resource_stats["bounds"] = _find_bounds(resource_stats["quantiles"])  # type: ignore
-    resource_stats["uniqueValues"] = len(set(data))  # type: ignore
+    resource_stats["uniqueValues"] = summary.unique()
     return resource_stats
 
 
+def _quantiles(summary: NumericSummary, column: Optional[array[float]]) -> List[Any]:
+    """Calculate the quartiles (as `statistics.quantiles` does)"""
+    numpy = get_numpy()
+    if numpy is None or column is None:
+        return summary.quantiles()
+    values = numpy.frombuffer(column, dtype=float)
+    values = values[~numpy.isnan(values)]
+    return numpy.quantile(values, [0.25, 0.5, 0.75], method="weibull").tolist()
+
+
 def _find_bounds(quartiles: List[Any]):
     """Calculate the higher and lower bound of distribution
 
@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import pickle
+import statistics
+import tempfile
+from collections import Counter
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .. import settings
+from ..exception import FrictionlessException
+from ..platform import platform
+
+# NOTE:
+# The summaries keep the values as they are until they reach the exact limit
+# so the statistics of usual tables are the same as computed by `statistics`.
+# After that, they switch to constant-memory one-pass sketches. All the
+# accumulators are picklable and mergeable to be used for parallel chunks
+
+
+class Moments:
+    """One-pass count, mean, variance, minimum and maximum (Welford)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: Moments) -> None:
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance"""
+        if self.count < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        return self.m2 / (self.count - 1)
+
+
+class Digest:
+    """Mergeable quantile sketch (t-digest with the merging algorithm)
+
+    Parameters:
+        compression (int): bigger values give more accurate quantiles
+    """
+
+    def __init__(self, *, compression: int = 100):
+        self.__compression = compression
+        self.__means: List[float] = []
+        self.__weights: List[float] = []
+        self.__buffer: List[Tuple[float, float]] = []
+        self.__total = 0.0
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self.__buffer.append((value, weight))
+        self.__total += weight
+        if len(self.__buffer) >= self.__compression * 10:
+            self.__compress()
+
+    def merge(self, other: Digest) -> None:
+        for mean, weight in other.centroids():
+            self.add(mean, weight)
+
+    def centroids(self) -> List[Tuple[float, float]]:
+        self.__compress()
+        return list(zip(self.__means, self.__weights))
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile from 0 to 1"""
+        centroids = self.centroids()
+        if not centroids:
+            raise statistics.StatisticsError("quantile requires at least one data point")
+        target = q * self.__total
+        cumulative = 0.0
+        previous: Optional[Tuple[float, float]] = None
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                if previous is None:
+                    return mean
+                span = center - previous[1]
+                return previous[0] + (mean - previous[0]) * (target - previous[1]) / span
+            previous = (mean, center)
+            cumulative += weight
+        return centroids[-1][0]
+
+    # Internal
+
+    def __compress(self):
+        if not self.__buffer:
+            return
+        items = sorted(list(zip(self.__means, self.__weights)) + self.__buffer)
+        self.__means, self.__weights, self.__buffer = [], [], []
+        cumulative = 0.0
+        for mean, weight in items:
+            if self.__weights:
+                size = self.__weights[-1] + weight
+                q = (cumulative + size / 2) / self.__total
+                if size <= 4 * self.__total * q * (1 - q) / self.__compression:
+                    self.__means[-1] += (mean - self.__means[-1]) * weight / size
+                    self.__weights[-1] = size
+                    continue
+                cumulative += self.__weights[-1]
+            self.__means.append(mean)
+            self.__weights.append(weight)
+
+
+class FrequentValues:
+    """Mergeable heavy hitters sketch (Misra-Gries)
+
+    Parameters:
+        size (int): number of the tracked values
+    """
+
+    def __init__(self, *, size: int = 100):
+        self.__size = size
+        self.__counters: Dict[Any, int] = {}
+
+    def add(self, value: Any, count: int = 1) -> None:
+        self.__counters[value] = self.__counters.get(value, 0) + count
+        if len(self.__counters) > self.__size * 2:
+            self.__shrink()
+
+    def merge(self, other: FrequentValues) -> None:
+        for value, count in other.__counters.items():
+            self.add(value, count)
+
+    def most_common(self) -> Optional[Tuple[Any, int]]:
+        """Most common value and its (lower bound) count"""
+        if not self.__counters:
+            return None
+        return max(self.__counters.items(), key=lambda item: item[1])
+
+    # Internal
+
+    def __shrink(self):
+        threshold = sorted(self.__counters.values(), reverse=True)[self.__size]
+        counters = self.__counters.items()
+        self.__counters = {v: c - threshold for v, c in counters if c > threshold}
+
+
+class DistinctCount:
+    """Mergeable distinct values estimator (HyperLogLog)
+
+    Parameters:
+        precision (int): log2 of the number of registers
+    """
+
+    def __init__(self, *, precision: int = 12):
+        self.__precision = precision
+        self.__registers = bytearray(1 << precision)
+
+    def add(self, value: Any) -> None:
+        digest = hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest()
+        number = int.from_bytes(digest, "big")
+        width = 64 - self.__precision
+        index = number >> width
+        rank = width - (number & ((1 << width) - 1)).bit_length() + 1
+        if rank > self.__registers[index]:
+            self.__registers[index] = rank
+
+    def merge(self, other: DistinctCount) -> None:
+        for index, rank in enumerate(other.__registers):
+            if rank > self.__registers[index]:
+                self.__registers[index] = rank
+
+    def count(self) -> int:
+        size = len(self.__registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0**-rank for rank in self.__registers)
+        zeros = self.__registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+
+class NumericSummary:
+    """Mergeable descriptive statistics of a numeric column
+
+    The values are kept until there are more than `limit` of them;
+    then the statistics are estimated by one-pass sketches (see `exact`).
+
+    Parameters:
+        limit (int): maximum number of values to compute exact statistics
+    """
+
+    def __init__(self, *, limit: int = settings.DEFAULT_EXACT_STATS_SIZE):
+        self.__limit = limit
+        self.__values: Optional[List[Any]] = []
+        self.__moments = Moments()
+        self.__digest = Digest()
+        self.__frequent = FrequentValues()
+        self.__distinct = DistinctCount()
+
+    @property
+    def count(self) -> int:
+        if self.__values is not None:
+            return len(self.__values)
+        return self.__moments.count
+
+    @property
+    def exact(self) -> bool:
+        """Whether the statistics are exact"""
+        return self.__values is not None
+
+    def add(self, value: Any) -> None:
+        if self.__values is not None:
+            self.__values.append(value)
+            if len(self.__values) > self.__limit:
+                self.__estimate()
+            return
+        value = float(value)
+        self.__moments.add(value)
+        self.__digest.add(value)
+        self.__frequent.add(value)
+        self.__distinct.add(value)
+
+    def merge(self, other: NumericSummary) -> None:
+        if other.__values is not None:
+            for value in other.__values:
+                self.add(value)
+            return
+        if self.__values is not None:
+            self.__estimate()
+        self.__moments.merge(other.__moments)
+        self.__digest.merge(other.__digest)
+        self.__frequent.merge(other.__frequent)
+        self.__distinct.merge(other.__distinct)
+
+    def mean(self) -> Any:
+        if self.__values is not None:
+            return statistics.mean(self.__values)
+        if not self.__moments.count:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return self.__moments.mean
+
+    def median(self) -> Any:
+        if self.__values is not None:
+            return statistics.median(self.__values)
+        return self.__digest.quantile(0.5)
+
+    def mode(self) -> Any:
+        if self.__values is not None:
+            return statistics.mode(self.__values)
+        item = self.__frequent.most_common()
+        if item is None:
+            raise statistics.StatisticsError("no mode for empty data")
+        return item[0]
+
+    def most_common(self) -> Optional[Tuple[Any, int]]:
+        """Most common value and its count"""
+        if self.__values is not None:
+            items = Counter(self.__values).most_common(1)
+            return items[0] if items else None
+        return self.__frequent.most_common()
+
+    def variance(self) -> Any:
+        if self.__values is not None:
+            return statistics.variance(self.__values)
+        return self.__moments.variance
+
+    def stdev(self) -> Any:
+        if self.__values is not None:
+            return statistics.stdev(self.__values)
+        return math.sqrt(self.__moments.variance)
+
+    def quantiles(self, n: int = 4) -> List[Any]:
+        if self.__values is not None:
+            return statistics.quantiles(self.__values, n=n)
+        if self.__moments.count < 2:
+            raise statistics.StatisticsError("must have at least two data points")
+        return [self.__digest.quantile(index / n) for index in range(1, n)]
+
+    def minimum(self) -> Any:
+        if self.__values is not None:
+            return min(self.__values)
+        return self.__moments.minimum
+
+    def maximum(self) -> Any:
+        if self.__values is not None:
+            return max(self.__values)
+        return self.__moments.maximum
+
+    def unique(self) -> int:
+        if self.__values is not None:
+            return len(set(self.__values))
+        return self.__distinct.count()
+
+    # Internal
+
+    def __estimate(self):
+        values = self.__values or []
+        self.__values = None
+        for value in values:
+            self.add(value)
+
+
+class CorrelationMatrix:
+    """Mergeable Pearson's correlations of numeric columns
+
+    The correlations are pairwise-complete: every pair of columns uses
+    the rows where both cells are not NaN. The columns are added by blocks
+    which are summarized by NumPy if it's installed. The sums are shifted
+    by the first value of every column to keep them accurate.
+
+    Parameters:
+        names (str[]): column names
+    """
+
+    def __init__(self, names: List[str]):
+        size = len(names)
+        self.names = list(names)
+        self.__shift: Optional[List[float]] = None
+        self.__count = [[0.0] * size for _ in range(size)]
+        self.__sum = [[0.0] * size for _ in range(size)]
+        self.__squares = [[0.0] * size for _ in range(size)]
+        self.__products = [[0.0] * size for _ in range(size)]
+
+    def update(self, columns: Dict[str, Sequence[float]]) -> None:
+        """Add a block of rows
+
+        Parameters:
+            columns (dict): columns of the same length indexed by name (NaN for nulls)
+        """
+        block = [columns[name] for name in self.names]
+        if self.__shift is None:
+            self.__shift = [next((c for c in cells if c == c), 0.0) for cells in block]
+        numpy = get_numpy()
+        if numpy:
+            sums = self.__update_numpy(block, numpy)
+        else:
+            sums = self.__update_python(block)
+        self.__add(sums, [0.0] * len(self.names))
+
+    def merge(self, other: CorrelationMatrix) -> None:
+        if other.__shift is None:
+            return
+        if self.__shift is None:
+            self.__shift = list(other.__shift)
+        offsets = [a - b for a, b in zip(other.__shift, self.__shift)]
+        sums = (other.__count, other.__sum, other.__squares, other.__products)
+        self.__add(sums, offsets)
+
+    def correlation(self, x: str, y: str) -> Optional[float]:
+        """Correlation of two columns or None if it's not defined
+
+        It requires at least three complete pairs and non-constant columns.
+        """
+        i, j = self.names.index(x), self.names.index(y)
+        count = self.__count[i][j]
+        if count <= 2:
+            return None
+        sum_x, sum_y = self.__sum[i][j], self.__sum[j][i]
+        variance_x = self.__squares[i][j] - sum_x * sum_x / count
+        variance_y = self.__squares[j][i] - sum_y * sum_y / count
+        covariance = self.__products[i][j] - sum_x * sum_y / count
+        if variance_x <= 0 or variance_y <= 0:
+            return None
+        if i == j:
+            return 1.0
+        correlation = covariance / math.sqrt(variance_x * variance_y)
+        return max(-1.0, min(1.0, correlation))
+
+    # Internal
+
+    def __update_numpy(self, block: List[Sequence[float]], numpy: Any):
+        values = numpy.array(block, dtype=float).T - numpy.array(self.__shift)
+        mask = ~numpy.isnan(values)
+        values = numpy.where(mask, values, 0.0)
+        weights = mask.astype(float)
+        return (
+            (weights.T @ weights).tolist(),
+            (values.T @ weights).tolist(),
+            ((values * values).T @ weights).tolist(),
+            (values.T @ values).tolist(),
+        )
+
+    def __update_python(self, block: List[Sequence[float]]):
+        size = len(self.names)
+        shift = self.__shift or [0.0] * size
+        count = [[0.0] * size for _ in range(size)]
+        totals = [[0.0] * size for _ in range(size)]
+        squares = [[0.0] * size for _ in range(size)]
+        products = [[0.0] * size for _ in range(size)]
+        for row in zip(*block):
+            cells = [(i, c - shift[i]) for i, c in enumerate(row) if c == c]
+            for i, x in cells:
+                for j, y in cells:
+                    count[i][j] += 1
+                    totals[i][j] += x
+                    squares[i][j] += x * x
+                    products[i][j] += x * y
+        return count, totals, squares, products
+
+    def __add(self, sums: Tuple[List[List[float]], ...], offsets: List[float]):
+        # Sums shifted by other values are moved to this matrix's shift
+        count, totals, squares, products = sums
+        for i, a in enumerate(offsets):
+            for j, b in enumerate(offsets):
+                n, sx, sy = count[i][j], totals[i][j], totals[j][i]
+                self.__count[i][j] += n
+                self.__sum[i][j] += sx + a * n
+                self.__squares[i][j] += squares[i][j] + 2 * a * sx + a * a * n
+                self.__products[i][j] += products[i][j] + a * sy + b * sx + a * b * n
+
+
+class CellLog:
+    """Append-only log of row numbers and cells spilled to disk by chunks
+
+    It's used to report the rows violating statistics only known
+    after reading the whole table (e.g. deviated values).
+
+    Parameters:
+        chunk_size (int): number of entries kept in memory
+    """
+
+    def __init__(self, *, chunk_size: int = settings.DEFAULT_BUFFER_SIZE):
+        self.__chunk_size = chunk_size
+        self.__chunk: List[Tuple[int, Any]] = []
+        self.__file: Optional[IO[bytes]] = None
+
+    def append(self, row_number: int, cell: Any) -> None:
+        self.__chunk.append((row_number, cell))
+        if len(self.__chunk) >= self.__chunk_size:
+            if self.__file is None:
+                self.__file = tempfile.TemporaryFile()
+            pickle.dump(self.__chunk, self.__file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.__chunk = []
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        if self.__file is not None:
+            self.__file.seek(0)
+            while True:
+                try:
+                    yield from pickle.load(self.__file)
+                except EOFError:
+                    break
+            self.__file.seek(0, 2)
+        yield from self.__chunk
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        self.__chunk = []
+
+
+def get_numpy() -> Optional[Any]:
+    """Get NumPy if it's installed"""
+    try:
+        return platform.numpy
+    except FrictionlessException:
+        return None
@@ -12,7 +12,7 @@ from ..system import system
 if TYPE_CHECKING:
     from ..error import Error
     from ..resource import Resource
-    from ..table import Row
+    from ..table import Row, RowBatch
 
 
 # TODO: add support for validate_package/etc?
@@ -95,6 +95,20 @@ class Check(Metadata):
         """
         yield from []
 
+    def validate_batch(self, batch: RowBatch) -> Iterable[Error]:
+        """Called to validate the given batch of rows (in batch mode)
+
+        By default, it calls `validate_row` for every row of the batch.
+
+        Parameters:
+            batch (RowBatch): table row batch
+
+        Yields:
+            Error: found errors
+        """
+        for row in batch:
+            yield from self.validate_row(row)
+
     def validate_end(self) -> Iterable[Error]:
         """Called to validate the resource before closing
 
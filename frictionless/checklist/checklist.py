@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, List, Optional, Union
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Set, Union
 
 import attrs
 
 from .. import errors, settings
 from ..checks import baseline
+from ..error import ErrorRecord
 from ..exception import FrictionlessException
 from ..metadata import Metadata
 from .check import Check
@@ -140,11 +141,24 @@ class Checklist(Metadata):
     # Match
 
     def match(self, error: errors.Error) -> bool:
-        if isinstance(error, errors.DataError):
-            if error.type not in self.scope:
+        # Error records are only created for row/cell errors
+        if isinstance(error, (errors.DataError, ErrorRecord)):
+            if error.type not in self.__get_match_scope():
                 return False
         return True
 
+    def __get_match_scope(self) -> Set[str]:
+        # Matching is done for every error so the scope is cached
+        key = (
+            tuple(map(id, self.checks)),
+            tuple(self.pick_errors),
+            tuple(self.skip_errors),
+        )
+        if self.__dict__.get("_match_key") != key:
+            self._match_key = key
+            self._match_scope = set(self.scope)
+        return self._match_scope
+
     # Metadata
 
     metadata_type = "checklist"
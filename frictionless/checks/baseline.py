@@ -11,7 +11,7 @@ from ..platform import platform
 if TYPE_CHECKING:
     from ..error import Error
     from ..resource import Resource
-    from ..table import Row
+    from ..table import Row, RowBatch
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -68,15 +68,16 @@ class baseline(Check):
     def validate_row(self, row: Row) -> Iterable[Error]:
         yield from row.errors  # type: ignore
 
+    def validate_batch(self, batch: RowBatch) -> Iterable[Error]:
+        yield from batch.errors
+
     def validate_end(self) -> Iterable[Error]:
         # Hash
         if self.resource.hash:
             algorithm, expected = helpers.parse_resource_hash_v1(self.resource.hash)
             actual = None
-            if algorithm == "md5":
-                actual = self.resource.stats.md5
-            elif algorithm == "sha256":
-                actual = self.resource.stats.sha256
+            if algorithm in ["md5", "sha256"]:
+                actual = self.resource.stats.hashes.get(algorithm)
             if actual and actual != expected:
                 note = 'expected is "%s" and actual is "%s"'
                 note = note % (expected, actual)
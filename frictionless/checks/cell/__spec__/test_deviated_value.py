@@ -1,4 +1,4 @@
-from frictionless import Checklist, Resource, checks
+from frictionless import Checklist, Resource, checks, settings
 
 # General
 
@@ -99,3 +99,15 @@ def test_validate_deviated_value_incorrect_average():
             'deviated value check supports only average functions "mean, median, mode"',
         ],
     ]
+
+
+def test_validate_deviated_value_estimated(monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_EXACT_STATS_SIZE", 5)
+    source = [["temperature"], [1], [-2], [7], [0], [1], [2], [5], [-4], [100], [8], [3]]
+    resource = Resource(source)
+    check = checks.deviated_value(field_name="temperature", average="median")
+    report = resource.validate(Checklist(checks=[check]))
+    assert report.flatten(["type"]) == [["deviated-value"]]
+    assert report.task.errors[0].note.startswith(
+        'value "100" in row at position "10" and field "temperature" is deviated'
+    )
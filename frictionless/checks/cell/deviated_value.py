@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import statistics
-from typing import TYPE_CHECKING, Any, Iterable, List
+from typing import TYPE_CHECKING, Iterable
 
 import attrs
 
-from ... import errors
+from ... import errors, settings
+from ...analyzer.summary import CellLog, NumericSummary
 from ...checklist import Check
 
 if TYPE_CHECKING:
@@ -17,9 +17,9 @@ if TYPE_CHECKING:
 DEFAULT_INTERVAL = 3
 DEFAULT_AVERAGE = "mean"
 AVERAGE_FUNCTIONS = {
-    "mean": statistics.mean,
-    "median": statistics.median,
-    "mode": statistics.mode,
+    "mean": NumericSummary.mean,
+    "median": NumericSummary.median,
+    "mode": NumericSummary.mode,
 }
 
 
@@ -53,8 +53,10 @@ class deviated_value(Check):
 
     def connect(self, resource: Resource):
         super().connect(resource)
-        self.__cells: List[Any] = []
-        self.__row_numbers: List[int] = []
+        # The statistics are computed in one pass while the cells are
+        # logged (spilling to disk for big tables) to report the deviated ones
+        self.__summary = NumericSummary(limit=settings.DEFAULT_EXACT_STATS_SIZE)
+        self.__cells = CellLog()
         self.__average_function = AVERAGE_FUNCTIONS.get(self.average)
 
     # Validate
@@ -75,31 +77,34 @@ class deviated_value(Check):
     def validate_row(self, row: Row) -> Iterable[Error]:
         cell = row[self.field_name]
         if cell is not None:
-            self.__cells.append(cell)
-            self.__row_numbers.append(row.row_number)
+            self.__summary.add(cell)
+            self.__cells.append(row.row_number, cell)
         yield from []
 
     def validate_end(self) -> Iterable[Error]:
-        if len(self.__cells) < 2:
+        if self.__summary.count < 2:
+            self.__cells.close()
             return
 
         # Prepare interval
         try:
-            stdev = statistics.stdev(self.__cells)
-            average = self.__average_function(self.__cells)  # type: ignore
+            stdev = self.__summary.stdev()
+            average = self.__average_function(self.__summary)  # type: ignore
             minimum = average - stdev * self.interval
             maximum = average + stdev * self.interval
         except Exception as exception:
             note = 'calculation issue "%s"' % exception
             yield errors.DeviatedValueError(note=note)
+            self.__cells.close()
             return
 
         # Check values
-        for row_number, cell in zip(self.__row_numbers, self.__cells):
+        for row_number, cell in self.__cells:
             if not (minimum <= cell <= maximum):
                 note = 'value "%s" in row at position "%s" and field "%s" is deviated "[%.2f, %.2f]"'
                 note = note % (cell, row_number, self.field_name, minimum, maximum)
                 yield errors.DeviatedValueError(note=note)
+        self.__cells.close()
 
     # Metadata
 
@@ -1,4 +1,8 @@
-from frictionless import Checklist, Resource, checks
+import tempfile
+
+import pytest
+
+from frictionless import Checklist, Detector, Resource, Schema, checks
 
 # General
 
@@ -17,3 +21,58 @@ def test_validate_duplicate_row_valid():
     checklist = Checklist.from_descriptor({"checks": [{"type": "duplicate-row"}]})
     report = resource.validate(checklist)
     assert report.flatten(["rowNumber", "fieldNumber", "type"]) == []
+
+
+@pytest.mark.parametrize("index", ["memory", "compact", "disk"])
+@pytest.mark.parametrize("prefilter", [0, 1])
+def test_validate_duplicate_row_index(index, prefilter):
+    resource = Resource("data/duplicate-rows.csv")
+    checklist = Checklist(checks=[checks.duplicate_row(index=index, prefilter=prefilter)])
+    report = resource.validate(checklist)
+    assert report.flatten(["rowNumber", "fieldNumber", "type", "note"]) == [
+        [4, None, "duplicate-row", 'the same as row at position "2"'],
+    ]
+
+
+def test_validate_duplicate_row_raw_cells():
+    source = [["id", "name"], [1, "a"], ["x", "a"], ["y", "a"], ["x", "a"]]
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "name", "type": "string"},
+            ]
+        }
+    )
+    resource = Resource(source, schema=schema)
+    checklist = Checklist(checks=[checks.duplicate_row()])
+    report = resource.validate(checklist)
+    assert report.flatten(["rowNumber", "type"]) == [
+        [3, "type-error"],
+        [4, "type-error"],
+        [5, "type-error"],
+        [5, "duplicate-row"],
+    ]
+
+
+def test_validate_duplicate_row_disk_spill():
+    source = [["id"]] + [[number % 3000] for number in range(6000)]
+    detector = Detector(integrity_memory=0)
+    resource = Resource(source, detector=detector)
+    checklist = Checklist(checks=[checks.duplicate_row(index="disk", prefilter=1)])
+    report = resource.validate(checklist, limit_errors=10000)
+    assert len(report.flatten(["rowNumber"])) == 3000
+    assert report.task.errors[0].note == 'the same as row at position "2"'
+
+
+def test_validate_duplicate_row_disk_spill_limit_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    source = [["id"]] + [[number % 3000] for number in range(6000)]
+    detector = Detector(integrity_memory=0)
+    resource = Resource(source, detector=detector)
+    checklist = Checklist(checks=[checks.duplicate_row(index="disk")])
+    report = resource.validate(checklist, limit_errors=10)
+    assert len(report.flatten(["rowNumber"])) == 10
+    assert report.task.warnings == ["reached error limit: 10"]
+    del checklist
+    assert list(tmp_path.iterdir()) == []
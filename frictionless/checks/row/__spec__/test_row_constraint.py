@@ -40,8 +40,8 @@ def test_validate_row_constraint_incorrect_constraint():
     )
     report = resource.validate(checklist)
     assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
-        [2, None, "row-constraint"],
-        [2, None, "row-constraint"],
+        [None, None, "check-error"],
+        [None, None, "check-error"],
         [2, None, "row-constraint"],
     ]
 
@@ -57,3 +57,23 @@ def test_validate_row_constraint_list_in_formula_issue_817():
     )
     report = resource.validate(checklist)
     assert report.valid
+
+
+def test_validate_row_constraint_batch():
+    source = [
+        ["row", "salary", "bonus"],
+        [2, 1000, 200],
+        [3, 2500, 500],
+        [4, 1300, 500],
+        [5, 5000, 1000],
+        [6],
+    ]
+    resource = Resource(source)
+    checklist = Checklist(checks=[checks.row_constraint(formula="salary == bonus * 5")])
+    report = resource.validate(checklist, batch=True)
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [4, None, "row-constraint"],
+        [6, 2, "missing-cell"],
+        [6, 3, "missing-cell"],
+        [6, None, "row-constraint"],
+    ]
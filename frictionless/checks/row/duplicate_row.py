@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import hashlib
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Optional
 
 import attrs
 
 from ... import errors
 from ...checklist import Check
+from ...table.index import BloomFilter, create_integrity_index, hash_key
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -18,26 +18,58 @@ class duplicate_row(Check):
     """Check for duplicate rows
 
     This check can be enabled using the `checks` parameter
-    for the `validate` function.
+    for the `validate` function. Rows are compared by a 128-bit
+    hash of their raw cells so the cells are not type casted.
 
     """
 
     type = "duplicate-row"
     Errors = [errors.DuplicateRowError]
 
+    index: Optional[str] = None
+    """
+    Index keeping the hashed rows: "memory", "compact" or "disk".
+    By default, the resource's `detector.integrity_index` is used.
+    """
+
+    prefilter: int = 0
+    """
+    Size in MB of a Bloom filter placed before the index (0 to disable it).
+    Only the rows found in the filter are looked up in the index
+    which saves the disk lookups for a spilled "disk" index.
+    """
+
     # Connect
 
     def connect(self, resource: Resource):
         super().connect(resource)
-        self.__memory: Dict[str, int] = {}
+        self.__index = create_integrity_index(
+            self.index or resource.detector.integrity_index,
+            memory=resource.detector.integrity_memory,
+        )
+        self.__filter = BloomFilter(memory=self.prefilter) if self.prefilter else None
 
     # Validate
 
     def validate_row(self, row: Row):
-        text = ",".join(map(str, row.values()))
-        hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        match = self.__memory.get(hash)
+        high, low = hash_key(tuple(row.cells))
+        if self.__filter and not self.__filter.add_hash(high, low):
+            self.__index.insert_hash(high, low, row.row_number)
+            return
+        match = self.__index.update_hash(high, low, row.row_number)
         if match:
             note = 'the same as row at position "%s"' % match
             yield errors.DuplicateRowError.from_row(row, note=note)
-        self.__memory[hash] = row.row_number
+
+    def validate_end(self):
+        self.__index.close()
+        yield from []
+
+    # Metadata
+
+    metadata_profile_patch = {
+        "properties": {
+            "index": {"type": "string", "enum": ["memory", "compact", "disk"]},
+            "prefilter": {"type": "integer"},
+        },
+    }
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
-from ... import errors
+from ... import errors, helpers
 from ...checklist import Check
 
 if TYPE_CHECKING:
-    from ...table import Row
+    from ...resource import Resource
+    from ...table import Row, RowBatch
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -25,20 +25,50 @@ class row_constraint(Check):
     simpleeval library is used.
     """
 
-    # Validate
+    # Connect
 
-    def validate_row(self, row: Row):
+    def connect(self, resource: Resource):
+        super().connect(resource)
+        # NOTE:
+        # The formula is compiled here (not in `validate_start`) because
+        # parallel validation connects the checks without starting them
+        self.__compiled: Optional[helpers.Formula] = None
+        self.__problem: Optional[str] = None
         try:
             # This call should be considered as a safe expression evaluation
             # https://github.com/danthedeckie/simpleeval
-            # NOTE: review EvalWithCompoundTypes/sync with steps
-            evalclass = simpleeval.EvalWithCompoundTypes  # type: ignore
-            assert evalclass(names=row).eval(self.formula)  # type: ignore
+            self.__compiled = helpers.Formula(self.formula)
+        except Exception as exception:
+            self.__problem = str(exception)
+
+    # Validate
+
+    def validate_start(self):
+        if self.__problem is not None:
+            note = 'row constraint formula "%s" is not valid: %s'
+            yield errors.CheckError(note=note % (self.formula, self.__problem))
+
+    def validate_row(self, row: Row):
+        if self.__compiled is None:
+            return
+        try:
+            assert self.__compiled.evaluate(row)
         except Exception:
-            yield errors.RowConstraintError.from_row(
-                row,
-                note='the row constraint to conform is "%s"' % self.formula,
-            )
+            yield self.__create_error(row)
+
+    def validate_batch(self, batch: RowBatch):
+        if self.__compiled is None:
+            return
+        results = self.__compiled.evaluate_batch(batch.columns, length=len(batch))
+        for index, result in enumerate(results):
+            if isinstance(result, Exception) or not result:
+                yield self.__create_error(batch[index])
+
+    def __create_error(self, row: Row):
+        return errors.RowConstraintError.from_row(
+            row,
+            note='the row constraint to conform is "%s"' % self.formula,
+        )
 
     # Metadata
 
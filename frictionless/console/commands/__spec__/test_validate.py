@@ -28,6 +28,17 @@ def test_console_validate_invalid():
     assert actual.stdout.count("INVALID")
 
 
+def test_console_validate_aggregate():
+    actual = runner.invoke(
+        console, "validate data/invalid.csv --json --aggregate --limit-errors 3"
+    )
+    expect = validate("data/invalid.csv", aggregate=True, limit_errors=3)
+    assert actual.exit_code == 1
+    descriptor = json.loads(actual.stdout)
+    assert descriptor["tasks"][0]["summary"]["errors"] == 8
+    assert no_time(descriptor) == no_time(expect.to_descriptor())
+
+
 def test_console_validate_header_rows():
     actual = runner.invoke(console, "validate data/table.csv --json --header-rows '1,2'")
     expect = validate("data/table.csv", dialect=Dialect(header_rows=[1, 2]))
@@ -48,6 +48,7 @@ def console_describe(
     field_confidence: float = common.field_confidence,
     field_float_numbers: bool = common.field_float_numbers,
     field_missing_values: str = common.field_missing_values,
+    schema_sampling: str = common.schema_sampling,
     # Command
     basepath: str = common.basepath,
     # TODO: allow cherry-picking stats for adding to a descriptor
@@ -100,6 +101,7 @@ def console_describe(
             field_confidence=field_confidence,
             field_float_numbers=field_float_numbers,
             field_missing_values=field_missing_values,
+            schema_sampling=schema_sampling,
         )
 
         # Describe source
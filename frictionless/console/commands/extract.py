@@ -55,6 +55,7 @@ def console_extract(
     field_confidence: float = common.field_confidence,
     field_float_numbers: bool = common.field_float_numbers,
     field_missing_values: str = common.field_missing_values,
+    schema_sampling: str = common.schema_sampling,
     schema_sync: bool = common.schema_sync,
     # Command
     valid: bool = common.valid_rows,
@@ -115,6 +116,7 @@ def console_extract(
             field_confidence=field_confidence,
             field_float_numbers=field_float_numbers,
             field_missing_values=field_missing_values,
+            schema_sampling=schema_sampling,
             schema_sync=schema_sync,
         )
 
@@ -48,6 +48,7 @@ def console_validate(
     field_confidence: float = common.field_confidence,
     field_float_numbers: bool = common.field_float_numbers,
     field_missing_values: str = common.field_missing_values,
+    schema_sampling: str = common.schema_sampling,
     schema_sync: bool = common.schema_sync,
     # Checklist
     checklist: str = common.checklist,
@@ -56,6 +57,7 @@ def console_validate(
     skip_errors: str = common.skip_errors,
     # Command
     parallel: bool = common.parallel,
+    aggregate: bool = common.aggregate,
     limit_rows: int = common.limit_rows,
     limit_errors: int = common.limit_errors,
     yaml: bool = common.yaml,
@@ -110,6 +112,7 @@ def console_validate(
             field_confidence=field_confidence,
             field_float_numbers=field_float_numbers,
             field_missing_values=field_missing_values,
+            schema_sampling=schema_sampling,
             schema_sync=schema_sync,
         )
 
@@ -150,6 +153,7 @@ def console_validate(
             checklist_obj,
             name=name,
             parallel=parallel,
+            aggregate=aggregate,
             limit_rows=limit_rows,
             limit_errors=limit_errors,
         )
@@ -227,6 +227,11 @@ field_missing_values = Option(
     help="Comma-separated list of missing values",
 )
 
+schema_sampling = Option(
+    default=None,
+    help='Sample rows for schema inference from the "head", "full" table or a "reservoir"',
+)
+
 schema_sync = Option(
     default=None,
     hidden=True,
@@ -273,6 +278,11 @@ parallel = Option(
     help="Enable multiprocessing",
 )
 
+aggregate = Option(
+    default=False,
+    help="Count all the errors by type and field (see the task's summary)",
+)
+
 output_path = Option(
     default=None,
     help="Specify the output file path explicitly (e.g. package.yaml)",
@@ -109,6 +109,7 @@ def create_detector(
     field_confidence: Optional[float] = None,
     field_float_numbers: Optional[bool] = None,
     field_missing_values: Optional[str] = None,
+    schema_sampling: Optional[str] = None,
     schema_sync: Optional[bool] = None,
 ) -> Detector:
     # Detector
@@ -144,6 +145,10 @@ def create_detector(
             field_missing_values
         )
 
+    # Schema sampling
+    if schema_sampling is not None:
+        detector.schema_sampling = schema_sampling
+
     # Schema sync
     if schema_sync is not None:
         detector.schema_sync = schema_sync
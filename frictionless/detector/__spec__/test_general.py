@@ -1,6 +1,10 @@
+import hashlib
+import os
+from typing import Any, List
+
 import pytest
 
-from frictionless import Detector
+from frictionless import Detector, FrictionlessException, helpers, settings, system
 from frictionless.resources import TableResource
 
 # General
@@ -156,6 +160,29 @@ def test_detector_set_field_missing_values():
     assert detector.field_missing_values == ["", "70"]
 
 
+def test_detector_set_hashing():
+    detector = Detector(hashing=["blake2b"])
+    assert detector.hashing == ["blake2b"]
+    detector.hashing = []
+    assert detector.hashing == []
+
+
+def test_detector_detect_hashing():
+    detector = Detector(hashing=[])
+    resource = TableResource(path="data/table.csv", hash="md5:hash")
+    assert detector.detect_hashing(resource) == ["md5"]
+
+
+def test_detector_detect_hashing_not_supported():
+    detector = Detector(hashing=["bad"])
+    resource = TableResource(path="data/table.csv")
+    with pytest.raises(FrictionlessException) as excinfo:
+        detector.detect_hashing(resource)
+    error = excinfo.value.error
+    assert error.type == "detector-error"
+    assert error.note == 'hashing algorithm "bad" is not supported'
+
+
 def test_detector_set_schema_sync():
     detector = Detector(schema_sync=True)
     assert detector.schema_sync is True
@@ -183,6 +210,153 @@ def test_detector_true_false_values():
         ]
 
 
+def test_detector_set_schema_sampling():
+    detector = Detector(schema_sampling="full")
+    assert detector.schema_sampling == "full"
+    detector.schema_sampling = "reservoir"
+    assert detector.schema_sampling == "reservoir"
+
+
+def test_detector_schema_sampling_not_supported():
+    detector = Detector(schema_sampling="bad")
+    resource = TableResource(path="data/table.csv", detector=detector)
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.open()
+    error = excinfo.value.error
+    assert error.type == "detector-error"
+    assert error.note == 'schema sampling "bad" is not supported'
+
+
+def test_schema_from_field_scores():
+    labels = ["id", "age", "name"]
+    sample = [
+        ["1", "39", "Paul"],
+        ["2", "23", "Jimmy"],
+        ["3", "36", "Jane"],
+        ["4", "N/A", "Judy"],
+    ]
+    detector = Detector(field_confidence=0.5)
+    scores = detector.create_field_scores()
+    scores.update(sample[:2])
+    scores.update(sample[2:])
+    schema = detector.detect_schema(sample, labels=labels, scores=scores)
+    assert scores.rows == 4
+    assert schema.to_descriptor() == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "age", "type": "integer"},
+            {"name": "name", "type": "string"},
+        ],
+    }
+
+
+def test_schema_from_field_scores_merge():
+    detector = Detector()
+    first = detector.create_field_scores()
+    first.update([["1", ""], ["2", "a"]])
+    second = detector.create_field_scores()
+    second.update([["3", "b", "true"]])
+    second.merge(rows=first.rows, missing=first.missing, failures=first.failures)
+    assert second.rows == 3
+    assert second.missing == [0, 1, 0]
+    schema = detector.detect_schema([["1"]], labels=["a", "b", "c"], scores=second)
+    assert schema.to_descriptor() == {
+        "fields": [
+            {"name": "a", "type": "integer"},
+            {"name": "b", "type": "string"},
+            {"name": "c", "type": "boolean"},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "sampling, type",
+    [("head", "integer"), ("full", "string"), ("reservoir", "string")],
+)
+def test_detector_schema_sampling(tmpdir, sampling, type):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 1001):
+            id = number if number <= 500 or number % 2 else f"id{number}"
+            file.write(f"{id},name{number}\n")
+    detector = Detector(schema_sampling=sampling, field_confidence=1)
+    with system.use_context(trusted=True):
+        with TableResource(path=path, detector=detector) as resource:
+            assert resource.schema.get_field("id").type == type
+            assert resource.schema.get_field("name").type == "string"
+            assert len(resource.read_rows()) == 1000
+            assert resource.stats.rows == 1000
+
+
+@pytest.mark.parametrize("sampling", ["full", "reservoir"])
+def test_detector_schema_sampling_same_as_head(sampling):
+    data = [["id", "age"]]
+    data += [[str(n), "bad" if n % 10 == 0 else str(n)] for n in range(1, 21)]
+    detector = Detector(schema_sampling="head")
+    with TableResource(data=data, detector=detector) as resource:
+        head = resource.schema.to_descriptor()
+    detector = Detector(schema_sampling=sampling)
+    with TableResource(data=data, detector=detector) as resource:
+        assert resource.schema.to_descriptor() == head
+    assert head == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "age", "type": "string"},
+        ]
+    }
+
+
+def test_detector_schema_sampling_full_small_table():
+    detector = Detector(schema_sampling="full")
+    with TableResource(path="data/table.csv", detector=detector) as resource:
+        assert resource.schema.to_descriptor() == {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "name", "type": "string"},
+            ]
+        }
+
+
+def test_detector_schema_sampling_full_stats(tmpdir, monkeypatch):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 1001):
+            file.write(f"{number},name{number}\n")
+    passes: List[Any] = []
+    monkeypatch.setattr(helpers, "pass_through", lambda it: passes.append(it))
+    detector = Detector(schema_sampling="full")
+    with system.use_context(trusted=True):
+        resource = TableResource(path=path, detector=detector)
+        resource.infer(stats=True)
+    assert passes == []
+    assert resource.stats.rows == 1000
+    assert resource.stats.bytes == os.path.getsize(path)
+    with open(path, "rb") as file:
+        assert resource.stats.md5 == hashlib.md5(file.read()).hexdigest()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_detector_schema_sampling_full_parallel(tmpdir, monkeypatch, parallel):
+    monkeypatch.setattr(settings, "DEFAULT_CHUNK_SIZE", 1000)
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 1001):
+            id = number if number < 1000 else "last"
+            file.write(f"{id},name{number}\n")
+    detector = Detector(
+        schema_sampling="full", schema_parallel=parallel, field_confidence=1
+    )
+    with system.use_context(trusted=True):
+        resource = TableResource(path=path, detector=detector)
+        resource.infer(stats=True)
+    assert resource.schema.get_field("id").type == "string"
+    assert resource.stats.rows == 1000
+    assert resource.stats.bytes == os.path.getsize(path)
+
+
 # Bugs
 
 
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import codecs
+import hashlib
 import os
 from copy import copy, deepcopy
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import attrs
 
-from .. import helpers, settings
+from .. import errors, helpers, settings
 from ..dialect import Dialect
+from ..exception import FrictionlessException
 from ..fields import AnyField
 from ..metadata import Metadata
 from ..platform import platform
 from ..schema import Field, Schema
+from .scores import FieldScores, is_field_selected
 
 if TYPE_CHECKING:
     from .. import types
@@ -107,6 +110,48 @@ class Detector:
     It defaults to `["false", "False", "FALSE", "0"]`
     """
 
+    hashing: List[str] = attrs.field(
+        factory=settings.DEFAULT_HASHING.copy,
+    )
+    """
+    Hashing algorithms to calculate while reading the data.
+    Any `hashlib` algorithm (e.g. "blake2b") or `xxhash` algorithm
+    (e.g. "xxh3_64", requires `frictionless[xxhash]`) can be used.
+    An empty list disables hashing. Extracting rows from a closed resource
+    doesn't hash the data as its stats are not returned.
+    It defaults to `["md5", "sha256"]`
+    """
+
+    schema_sampling: str = settings.DEFAULT_SCHEMA_SAMPLING
+    """
+    How the rows are sampled for schema inference: "head" scores the
+    first `sample_size` rows, "full" streams all the rows keeping only
+    per-field score counters and "reservoir" scores `sample_size` rows
+    sampled uniformly across the table. The "full" and "reservoir" modes
+    read the whole table on opening the resource.
+    It defaults to "head"
+    """
+
+    schema_parallel: bool = False
+    """
+    Whether to infer the schema in the "full" mode splitting a local CSV/TSV file
+    into chunks processed in parallel (if the file is big enough to be split).
+    """
+
+    integrity_index: str = settings.DEFAULT_INTEGRITY_INDEX
+    """
+    Index of the seen keys for the unique and primary key checks:
+    "memory" keeps the keys as they are, "compact" keeps fixed-width hashed keys
+    and "disk" moves the hashed keys to a temporary database on reaching
+    the `integrity_memory` budget. It defaults to "memory"
+    """
+
+    integrity_memory: int = settings.DEFAULT_LIMIT_MEMORY
+    """
+    Memory budget in MB shared by the "disk" integrity indexes
+    of a table. It defaults to 1000
+    """
+
     schema_sync: bool = False
     """
     Whether to sync the schema.
@@ -191,6 +236,32 @@ class Detector:
         resource.format = resource.format or format
         resource.compression = resource.compression or compression
 
+    # Hashing
+
+    def detect_hashing(self, resource: Resource) -> List[str]:
+        """Detect hashing algorithms to calculate while reading the resource
+
+        The algorithm of the resource's `hash` is always calculated
+        as it's needed to validate the resource.
+
+        Parameters:
+            resource (Resource): resource
+
+        Returns:
+            str[]: hashing algorithms
+        """
+        hashing = list(self.hashing)
+        if resource.hash:
+            algorithm, _ = helpers.parse_resource_hash_v1(resource.hash)
+            if algorithm in ["md5", "sha256"] and algorithm not in hashing:
+                hashing.append(algorithm)
+        for algorithm in hashing:
+            if not algorithm.startswith("xxh"):
+                if algorithm not in hashlib.algorithms_available:
+                    note = f'hashing algorithm "{algorithm}" is not supported'
+                    raise FrictionlessException(errors.DetectorError(note=note))
+        return hashing
+
     # Encoding
 
     def detect_encoding(
@@ -308,6 +379,7 @@ class Detector:
         labels: Optional[List[str]] = None,
         schema: Optional[Schema] = None,
         field_candidates: List[Dict[str, Any]] = settings.DEFAULT_FIELD_CANDIDATES,
+        scores: Optional[FieldScores] = None,
         **options: Any,
     ) -> Schema:
         """Detect schema from fragment
@@ -316,6 +388,8 @@ class Detector:
             fragment (any[][]): data fragment
             labels? (str[]): data labels
             schema? (Schema): data schema
+            scores? (FieldScores): scores to use instead of the fragment's ones
+                (see `create_field_scores`)
 
         Returns:
             Schema: schema
@@ -359,21 +433,24 @@ class Detector:
                     schema.add_field(field)
                 return schema
 
+            # Infer fields (scores)
+            if scores is not None:
+                scored_fields: List[Field] = []
+                for index, name in enumerate(names):
+                    field = scores.select(index, confidence=self.field_confidence)
+                    if field:
+                        field = field.to_copy()
+                        field.name = name
+                        field.schema = schema
+                    else:
+                        field = AnyField(name=name, schema=schema)
+                    scored_fields.append(field)
+                schema.fields = scored_fields
+                return self.__patch_schema(schema)
+
             # Prepare runners
             runners: List[List[Any]] = []
-            runner_fields: List[Field] = []  # we use shared fields
-            for candidate in field_candidates:
-                descriptor = candidate.copy()
-                descriptor["name"] = "shared"
-                field = Field.from_descriptor(descriptor)
-                if field.type == "number" and self.field_float_numbers:
-                    field.float_number = True  # type: ignore
-                elif field.type == "boolean":
-                    if self.field_true_values != settings.DEFAULT_TRUE_VALUES:
-                        field.true_values = self.field_true_values  # type: ignore
-                    if self.field_false_values != settings.DEFAULT_FALSE_VALUES:
-                        field.false_values = self.field_false_values  # type: ignore
-                runner_fields.append(field)
+            runner_fields = self.__create_runner_fields(field_candidates)
             for index, name in enumerate(names):
                 runners.append([])
                 for field in runner_fields:
@@ -397,8 +474,10 @@ class Detector:
                         if not is_field_missing_value:
                             _, notes = runner["field"].read_cell(source)
                             runner["score"] += 1 if not notes else -1
-                        if max_score[index] > 0 and runner["score"] >= (
-                            max_score[index] * self.field_confidence
+                        if is_field_selected(
+                            runner["score"],
+                            max_score[index],
+                            confidence=self.field_confidence,
                         ):
                             field = runner["field"].to_copy()
                             field.name = name
@@ -413,7 +492,45 @@ class Detector:
                     fields[index] = AnyField(name=name, schema=schema)  # type: ignore
             schema.fields = fields  # type: ignore
 
-        # Patch schema
+        return self.__patch_schema(schema)
+
+    def create_field_scores(
+        self,
+        *,
+        field_candidates: List[Dict[str, Any]] = settings.DEFAULT_FIELD_CANDIDATES,
+    ) -> FieldScores:
+        """Create field scores to infer a schema incrementally
+
+        Parameters:
+            field_candidates (dict[]): type descriptors ordered by priority
+
+        Returns:
+            FieldScores: field scores to update with the table's rows
+        """
+        return FieldScores(
+            self.__create_runner_fields(field_candidates),
+            missing_values=self.field_missing_values,
+        )
+
+    def __create_runner_fields(
+        self, field_candidates: List[Dict[str, Any]]
+    ) -> List[Field]:
+        runner_fields: List[Field] = []  # we use shared fields
+        for candidate in field_candidates:
+            descriptor = candidate.copy()
+            descriptor["name"] = "shared"
+            field = Field.from_descriptor(descriptor)
+            if field.type == "number" and self.field_float_numbers:
+                field.float_number = True  # type: ignore
+            elif field.type == "boolean":
+                if self.field_true_values != settings.DEFAULT_TRUE_VALUES:
+                    field.true_values = self.field_true_values  # type: ignore
+                if self.field_false_values != settings.DEFAULT_FALSE_VALUES:
+                    field.false_values = self.field_false_values  # type: ignore
+            runner_fields.append(field)
+        return runner_fields
+
+    def __patch_schema(self, schema: Schema) -> Schema:
         if self.schema_patch:
             patch = deepcopy(self.schema_patch)
             patch_fields = patch.pop("fields", {})
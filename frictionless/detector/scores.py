@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional
+
+if TYPE_CHECKING:
+    from .. import types
+    from ..schema import Field
+
+
+class FieldScores:
+    """Per-field scores of the field candidates
+
+    > Constructor of this object is not Public API
+
+    It's an incremental version of the schema inference algorithm: instead of
+    keeping the rows, only the number of missing values and the number
+    of cells not matching every candidate type are counted for every field.
+    The counters don't depend on the order of the rows so the scores
+    of different parts of the table can be merged.
+
+    Parameters:
+        fields (Field[]): field candidates ordered by priority
+        missing_values (str[]): values considered as missing
+    """
+
+    def __init__(self, fields: List[Field], *, missing_values: List[str]):
+        self.fields = fields
+        self.missing_values = frozenset(missing_values)
+        self.rows: int = 0
+        self.missing: List[int] = []
+        self.failures: List[List[int]] = []
+        self.__readers = [field.create_column_reader() for field in fields]
+
+    def update(self, fragment: types.IFragment) -> None:
+        """Score a fragment of the table
+
+        Parameters:
+            fragment (any[][]): data fragment
+        """
+        if not fragment:
+            return
+        width = max(map(len, fragment))
+        while len(self.missing) < width:
+            self.missing.append(0)
+            self.failures.append([0] * len(self.fields))
+        for index in range(width):
+            column = [cells[index] if len(cells) > index else None for cells in fragment]
+            cells = [cell for cell in column if not self.__is_missing(cell)]
+            self.missing[index] += len(column) - len(cells)
+            failures = self.failures[index]
+            for position, reader in enumerate(self.__readers):
+                _, notes = reader(cells)
+                failures[position] += len(notes)
+        self.rows += len(fragment)
+
+    def merge(self, *, rows: int, missing: List[int], failures: List[List[int]]):
+        """Merge counters of another part of the table
+
+        Parameters:
+            rows (int): number of scored rows
+            missing (int[]): number of missing values per field
+            failures (int[][]): number of failed cells per field and candidate
+        """
+        while len(self.missing) < len(missing):
+            self.missing.append(0)
+            self.failures.append([0] * len(self.fields))
+        for index, count in enumerate(missing):
+            self.missing[index] += count
+            for position, failed in enumerate(failures[index]):
+                self.failures[index][position] += failed
+        self.rows += rows
+
+    def select(self, index: int, *, confidence: float) -> Optional[Field]:
+        """Select the first candidate satisfying the confidence
+
+        It's the rule of the "head" sampling: the number of the non-missing
+        cells matching a candidate minus the number of the failed ones
+        has to reach `confidence` of the non-missing cells
+        (see `is_field_selected`). Note that the "head" sampling selects
+        a candidate as soon as the rule is met so a few failures at the end
+        of the sample might be not taken into account.
+
+        Parameters:
+            index (int): field position
+            confidence (float): infer confidence
+
+        Returns:
+            Field?: field candidate
+        """
+        missing = self.missing[index] if index < len(self.missing) else 0
+        failures = self.failures[index] if index < len(self.failures) else None
+        total = self.rows - missing
+        if total <= 0:
+            return None
+        for position, field in enumerate(self.fields):
+            failed = failures[position] if failures else 0
+            if is_field_selected(total - 2 * failed, total, confidence=confidence):
+                return field
+        return None
+
+    # Internal
+
+    def __is_missing(self, cell: Any) -> bool:
+        return isinstance(cell, str) and cell in self.missing_values
+
+
+def is_field_selected(score: int, max_score: int, *, confidence: float) -> bool:
+    """Check whether a field candidate's score satisfies the confidence
+
+    Parameters:
+        score (int): number of the matching cells minus the failed ones
+        max_score (int): number of the non-missing cells
+        confidence (float): infer confidence
+
+    Returns:
+        bool: whether the candidate is selected
+    """
+    return max_score > 0 and score >= max_score * confidence
@@ -1 +1,2 @@
 from .error import Error
+from .record import ErrorRecord
@@ -0,0 +1,122 @@
+import pickle
+
+from frictionless import Checklist, FrictionlessException, Schema, errors
+from frictionless.error import ErrorRecord
+from frictionless.resources import TableResource
+
+# General
+
+
+def test_error_record():
+    cells = [1, None, "c"]
+    record = ErrorRecord(
+        errors.TypeError,
+        note="type is integer",
+        cells=cells,
+        row_number=2,
+        field_number=3,
+        field_name="name",
+        source="c",
+    )
+    error = errors.TypeError(
+        note="type is integer",
+        cells=["1", "", "c"],
+        row_number=2,
+        cell="c",
+        field_name="name",
+        field_number=3,
+    )
+    assert record.type == "type-error"
+    assert record.tags == ["#table", "#row", "#cell"]
+    assert record.cells == ["1", "", "c"]
+    assert record.message == error.message
+    assert record.to_descriptor() == error.to_descriptor()
+    assert record.to_error() == error
+    assert record == error
+
+
+def test_error_record_isinstance():
+    record = ErrorRecord(
+        errors.TypeError,
+        note="note",
+        cells=["a"],
+        row_number=2,
+        field_number=1,
+        field_name="id",
+        source="a",
+    )
+    assert isinstance(record, ErrorRecord)
+    assert isinstance(record, errors.TypeError)
+    assert isinstance(record, errors.CellError)
+    assert isinstance(record, errors.Error)
+    assert not isinstance(record, errors.ConstraintError)
+
+
+def test_error_record_exception():
+    record = ErrorRecord(errors.BlankRowError, note="", cells=[None], row_number=3)
+    exception = FrictionlessException(record)
+    assert exception.error is record
+    assert str(exception).startswith(f"[blank-row] {record.message}")
+
+
+def test_error_record_row_error():
+    record = ErrorRecord(errors.BlankRowError, note="", cells=[None], row_number=3)
+    assert (
+        record.to_descriptor()
+        == errors.BlankRowError(note="", cells=[""], row_number=3).to_descriptor()
+    )
+
+
+def test_error_record_pickle():
+    record = ErrorRecord(errors.BlankRowError, note="", cells=[None], row_number=3)
+    assert record.to_error()
+    copy = pickle.loads(pickle.dumps(record))
+    assert copy.row_number == 3
+    assert copy.to_descriptor() == record.to_descriptor()
+
+
+# Validate
+
+
+def test_error_record_validate():
+    data = [["id", "name"], ["a", "x"], ["2"]]
+    schema = Schema.from_descriptor(
+        {"fields": [{"name": "id", "type": "integer"}, {"name": "name"}]}
+    )
+    resource = TableResource(data=data, schema=schema)
+    report = resource.validate()
+    assert all(isinstance(error, ErrorRecord) for error in report.task.errors)
+    assert isinstance(report.task.errors[0], errors.TypeError)
+    assert isinstance(report.task.errors[1], errors.MissingCellError)
+    assert report.flatten(["rowNumber", "fieldNumber", "type", "cell"]) == [
+        [2, 1, "type-error", "a"],
+        [3, 2, "missing-cell", ""],
+    ]
+    assert report.to_descriptor()["tasks"][0]["errors"][0]["message"] == (
+        'Type error in the cell "a" in row "2" and field "id" at position "1": '
+        'type is "integer/default"'
+    )
+
+
+def test_error_record_validate_skip_errors():
+    data = [["id", "name"], ["a", "x"], ["2"]]
+    schema = Schema.from_descriptor(
+        {"fields": [{"name": "id", "type": "integer"}, {"name": "name"}]}
+    )
+    resource = TableResource(data=data, schema=schema)
+    report = resource.validate(Checklist(skip_errors=["type-error"]))
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [3, 2, "missing-cell"],
+    ]
+
+
+def test_error_record_row_errors():
+    data = [["id", "name"], ["a", "x"]]
+    schema = Schema.from_descriptor(
+        {"fields": [{"name": "id", "type": "integer"}, {"name": "name"}]}
+    )
+    with TableResource(data=data, schema=schema) as resource:
+        row = next(resource.row_stream)
+        assert len(row.errors) == 1
+        assert isinstance(row.errors[0], errors.CellError)
+        assert row.errors[0].type == "type-error"
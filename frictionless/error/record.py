@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional, Type
+
+from .. import helpers, types
+
+if TYPE_CHECKING:
+    from .error import Error
+
+
+class ErrorRecord:
+    """Compact record of a row or cell error
+
+    > Constructor of this object is not Public API
+
+    Creating an error object for every invalid cell is expensive as it
+    converts all the row's cells to strings and renders the error message.
+    A record only keeps the error class, the error's location, and a
+    reference to the row's cells. It can be used as an error: the class
+    properties, message, and descriptor are rendered by the record itself
+    and everything else is taken from the error object created on request.
+    A record is an instance of its error class for `isinstance` checks.
+
+    Parameters:
+        Error (type): error class (a subclass of `RowError`)
+        note (str): note
+        cells (any[]): row's cells (not copied)
+        row_number (int): row number
+        field_number (int?): field number (for cell errors)
+        field_name (str?): field name (for cell errors)
+        source (any): cell's source value (for cell errors)
+    """
+
+    __slots__ = [
+        "Error",
+        "note",
+        "row_cells",
+        "row_number",
+        "field_number",
+        "field_name",
+        "source",
+        "__error",
+    ]
+
+    def __init__(
+        self,
+        Error: Type[Error],
+        *,
+        note: str,
+        cells: List[Any],
+        row_number: int,
+        field_number: Optional[int] = None,
+        field_name: Optional[str] = None,
+        source: Any = None,
+    ):
+        self.Error = Error
+        self.note = note
+        self.row_cells = cells
+        self.row_number = row_number
+        self.field_number = field_number
+        self.field_name = field_name
+        self.source = source
+        self.__error: Optional[Error] = None
+
+    @property
+    def __class__(self) -> Type[Error]:  # type: ignore
+        return self.Error
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.to_error(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ErrorRecord):
+            other = other.to_error()
+        return self.to_error() == other
+
+    def __repr__(self) -> str:
+        return repr(self.to_error())
+
+    def __reduce__(self):
+        # The class is given explicitly as `__class__` is the error class
+        return (object.__new__, (ErrorRecord,), self.__getstate__())
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__[:-1]}
+
+    def __setstate__(self, state: Any):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.__error = None
+
+    # Class properties
+
+    @property
+    def type(self) -> str:
+        return self.Error.type
+
+    @property
+    def title(self) -> str:
+        return self.Error.title
+
+    @property
+    def description(self) -> str:
+        return self.Error.description
+
+    @property
+    def template(self) -> str:
+        return self.Error.template
+
+    @property
+    def tags(self) -> List[str]:
+        return self.Error.tags
+
+    # Cells
+
+    @property
+    def cells(self) -> List[str]:
+        return [str(cell) if cell is not None else "" for cell in self.row_cells]
+
+    @property
+    def cell(self) -> str:
+        return str(self.source)
+
+    @property
+    def message(self) -> str:
+        return self.to_descriptor()["message"]
+
+    # Convert
+
+    def to_descriptor(self, *, validate: bool = False) -> types.IDescriptor:
+        """Export the record as an error descriptor
+
+        Parameters:
+            validate (bool): validate the descriptor
+
+        Returns:
+            dict: error descriptor
+        """
+        if validate:
+            return self.to_error().to_descriptor(validate=True)
+        descriptor: types.IDescriptor = {
+            "type": self.Error.type,
+            "title": self.Error.title,
+            "description": self.Error.description,
+            "message": "",
+            "tags": list(self.Error.tags),
+            "note": self.note,
+            "cells": self.cells,
+            "rowNumber": self.row_number,
+        }
+        if self.field_number is not None:
+            descriptor["cell"] = self.cell
+            descriptor["fieldName"] = self.field_name
+            descriptor["fieldNumber"] = self.field_number
+        descriptor["message"] = helpers.safe_format(self.Error.template, descriptor)
+        return descriptor
+
+    def to_descriptor_source(self) -> types.IDescriptor:
+        return self.to_descriptor()
+
+    def to_dict(self) -> types.IDescriptor:
+        return self.to_descriptor()
+
+    def to_error(self) -> Error:
+        """Create an error object from the record (it's created only once)
+
+        Returns:
+            Error: error
+        """
+        if self.__error is None:
+            options: Any = dict(
+                note=self.note, cells=self.cells, row_number=self.row_number
+            )
+            if self.field_number is not None:
+                options.update(
+                    cell=self.cell,
+                    field_name=self.field_name,
+                    field_number=self.field_number,
+                )
+            self.__error = self.Error(**options)
+        return self.__error
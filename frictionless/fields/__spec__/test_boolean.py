@@ -60,6 +60,13 @@ def test_boolean_read_cell(format, source, target, options):
     assert cell == target
 
 
+def test_boolean_read_column():
+    field = Field.from_descriptor({"name": "name", "type": "boolean"})
+    values, notes = field.read_column(["true", "0", "", "yes", True])
+    assert values == [True, False, None, None, True]
+    assert notes == {3: {"type": 'type is "boolean/default"'}}
+
+
 @pytest.mark.parametrize(
     "source, target, options",
     [
@@ -47,3 +47,12 @@ def test_date_read_cell(format, source, target, recwarn):
     assert cell == target
     if not format.startswith("fmt:"):
         assert recwarn.list == []
+
+
+@pytest.mark.parametrize("format", ["default", "%Y-%m-%d"])
+def test_date_read_column(format):
+    field = Field.from_descriptor({"name": "name", "type": "date", "format": format})
+    cells = ["2019-01-01", "2019-1-1", "2019-02-30", "", date(2019, 1, 2)]
+    values, notes = field.read_column(cells)
+    assert values == [date(2019, 1, 1), date(2019, 1, 1), None, None, date(2019, 1, 2)]
+    assert notes == {2: {"type": f'type is "date/{format}"'}}
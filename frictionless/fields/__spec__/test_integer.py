@@ -43,3 +43,16 @@ def test_integer_read_cell(format, source, target, options):
     field = Field.from_descriptor(descriptor)
     cell, notes = field.read_cell(source)
     assert cell == target
+
+
+def test_integer_read_column():
+    field = Field.from_descriptor(
+        {"name": "name", "type": "integer", "constraints": {"minimum": 1}}
+    )
+    values, notes = field.read_column(["1", " 02 ", "", "3.14", "0", True, 4.0])
+    assert values == [1, 2, None, None, 0, None, 4]
+    assert notes == {
+        3: {"type": 'type is "integer/default"'},
+        4: {"minimum": 'constraint "minimum" is "1"'},
+        5: {"type": 'type is "integer/default"'},
+    }
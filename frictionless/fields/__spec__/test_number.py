@@ -110,6 +110,17 @@ def test_number_read_cell(format, source, target, options):
     assert cell == target
 
 
+def test_number_read_column():
+    field = Field.from_descriptor({"name": "name", "type": "number"})
+    values, notes = field.read_column(["1.5", " 2 ", "", "string"])
+    assert values == [Decimal("1.5"), Decimal("2"), None, None]
+    assert notes == {3: {"type": 'type is "number/default"'}}
+    field = Field.from_descriptor({"name": "name", "type": "number", "groupChar": ","})
+    values, notes = field.read_column(["1,000.5", "2"])
+    assert values == [Decimal("1000.5"), Decimal("2")]
+    assert notes == {}
+
+
 # Bugs
 
 
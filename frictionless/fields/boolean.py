@@ -48,6 +48,22 @@ class BooleanField(Field):
 
         return value_reader
 
+    def create_value_column_reader(self):
+        value_reader = self.create_value_reader()
+        mapping: Dict[str, bool] = {}
+        for value in self.true_values:
+            mapping[value] = True
+        for value in self.false_values:
+            mapping[value] = False
+
+        # Create reader
+        def value_column_reader(cells: List[Any]):
+            if all(type(cell) is str for cell in cells):
+                return list(map(mapping.get, cells))
+            return list(map(value_reader, cells))
+
+        return value_column_reader
+
     # Write
 
     def create_value_writer(self):
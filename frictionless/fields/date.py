@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import re
 from datetime import date, datetime
-from typing import Any
+from typing import Any, List
 
 import attrs
 
@@ -54,6 +55,29 @@ class DateField(Field):
 
         return value_reader
 
+    def create_value_column_reader(self):
+        if self.format != "default":
+            return super().create_value_column_reader()
+        value_reader = self.create_value_reader()
+
+        # Create pattern
+        # For these strings "date.fromisoformat" is equal to the default pattern
+        pattern = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+        # Create reader
+        def iso_value_reader(cell: Any):
+            if type(cell) is str and pattern.fullmatch(cell):
+                try:
+                    return date.fromisoformat(cell)
+                except ValueError:
+                    return None
+            return value_reader(cell)
+
+        def value_column_reader(cells: List[Any]):
+            return list(map(iso_value_reader, cells))
+
+        return value_column_reader
+
     # Write
 
     def create_value_writer(self):
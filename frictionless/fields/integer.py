@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import Any
+from typing import Any, List
 
 import attrs
 
@@ -63,6 +63,21 @@ class IntegerField(Field):
 
         return value_reader
 
+    def create_value_column_reader(self):
+        value_reader = self.create_value_reader()
+
+        # Create reader
+        def value_column_reader(cells: List[Any]):
+            # Cast the cells in bulk as "int" accepts the same strings
+            if self.bare_number and all(type(cell) is str for cell in cells):
+                try:
+                    return list(map(int, cells))
+                except Exception:
+                    pass
+            return list(map(value_reader, cells))
+
+        return value_column_reader
+
     # Write
 
     def create_value_writer(self):
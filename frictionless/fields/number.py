@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import Any
+from typing import Any, List
 
 import attrs
 
@@ -102,6 +102,24 @@ class NumberField(Field):
 
         return value_reader
 
+    def create_value_column_reader(self):
+        value_reader = self.create_value_reader()
+        properties = ["group_char", "decimal_char", "bare_number"]
+        processed = bool(set(properties).intersection(self.list_defined()))
+        Primary = float if self.float_number else Decimal
+
+        # Create reader
+        def value_column_reader(cells: List[Any]):
+            # Cast the cells in bulk as the constructor accepts the same strings
+            if not processed and all(type(cell) is str for cell in cells):
+                try:
+                    return list(map(Primary, cells))
+                except Exception:
+                    pass
+            return list(map(value_reader, cells))
+
+        return value_column_reader
+
     # Write
 
     # TODO: optimize
@@ -1,3 +1,4 @@
+from . import chunks as chunks
 from .control import CsvControl as CsvControl
 from .parser import CsvParser as CsvParser
 from .plugin import CsvPlugin as CsvPlugin
@@ -0,0 +1,67 @@
+import csv
+import hashlib
+
+from frictionless.formats.csv import chunks
+
+# General
+
+
+def test_csv_split_chunks(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    text = 'id,name\n1,"a\nb"\n2,"c ""d"""\r\n3,e\n4,"f,\ng"\n5,h'
+    with open(path, "w", newline="") as file:
+        file.write(text)
+    result = chunks.split_chunks(path, chunk_size=8, skip_records=1)
+    assert result
+    assert result.bytes == len(text)
+    records = []
+    row_number = 2
+    for chunk in result.chunks:
+        chunk_records = list(chunks.read_chunk(path, chunk, encoding="utf-8", config={}))
+        assert chunk.row_number == row_number
+        assert chunk.records == len(chunk_records)
+        row_number += chunk.records
+        records.extend(chunk_records)
+    assert len(result.chunks) > 1
+    assert records == list(csv.reader(text.splitlines(keepends=True)))[1:]
+
+
+def test_csv_split_chunks_hashers(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    text = "id,name\n1,english\n2,german\n"
+    with open(path, "w", newline="") as file:
+        file.write(text)
+    hashers = {"md5": hashlib.md5()}
+    result = chunks.split_chunks(path, chunk_size=8, skip_records=1, hashers=hashers)
+    assert result
+    assert result.hashes == {"md5": hashlib.md5(text.encode()).hexdigest()}
+
+
+def test_csv_split_chunks_small_blocks(tmpdir, mocker):
+    path = str(tmpdir.join("table.csv"))
+    text = "id,name\n" + "".join(f'{n},"name\n{n}"\n' for n in range(100))
+    with open(path, "w", newline="") as file:
+        file.write(text)
+    mocker.patch.object(chunks, "BLOCK_SIZE", 7)
+    result = chunks.split_chunks(path, chunk_size=50, skip_records=1)
+    assert result
+    assert sum(chunk.records for chunk in result.chunks) == 100
+    for chunk in result.chunks:
+        chunk_records = list(chunks.read_chunk(path, chunk, encoding="utf-8", config={}))
+        assert chunk.records == len(chunk_records)
+        assert chunk_records[0][1] == f"name\n{chunk.row_number - 2}"
+
+
+def test_csv_split_chunks_unbalanced_quotes(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w", newline="") as file:
+        file.write('id,name\n1,"a\n2,b\n')
+    assert chunks.split_chunks(path, chunk_size=4, skip_records=1) is None
+
+
+def test_csv_split_chunks_not_supported_encoding(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w", encoding="utf-16") as file:
+        file.write("id,name\n1,a\n")
+    result = chunks.split_chunks(path, chunk_size=4, encoding="utf-16")
+    assert result is None
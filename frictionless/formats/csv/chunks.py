@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import csv
+import io
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# NOTE:
+# Chunks are found with a plain quote-parity scan (as most parallel CSV readers do).
+# It's exact for RFC 4180 files but a stray quote in an unquoted cell might
+# shift the boundaries; for this reason consumers must verify the record counts
+
+BLOCK_SIZE = 1048576
+
+
+class CsvChunk(NamedTuple):
+    """Byte range of a CSV file aligned on record boundaries"""
+
+    start: int
+    end: int
+    row_number: int
+    """Row number of the first record in the chunk"""
+    records: int
+    """Number of records in the chunk (as parsed by Python's `csv`)"""
+
+
+class CsvChunks(NamedTuple):
+    """Result of splitting a CSV file into chunks"""
+
+    chunks: List[CsvChunk]
+    bytes: int
+    hashes: Dict[str, str]
+
+
+def split_chunks(
+    path: str,
+    *,
+    chunk_size: int,
+    skip_records: int = 0,
+    quote_char: str = '"',
+    encoding: str = "utf-8",
+    hashers: Optional[Dict[str, Any]] = None,
+) -> Optional[CsvChunks]:
+    """Split a CSV file into byte ranges aligned on record boundaries
+
+    The file is read only once: while searching for the boundaries
+    the bytes are also hashed, so the caller gets the file stats for free.
+
+    Parameters:
+        path: local path to the file
+        chunk_size: approximate size of every chunk in bytes
+        skip_records: records to skip before the first chunk (e.g. header rows)
+        quote_char: quote char of the CSV dialect (empty string for no quoting)
+        encoding: encoding of the file
+        hashers: hash objects (e.g. `hashlib`'s ones) indexed by algorithm
+
+    Returns:
+        CsvChunks?: chunks or None if the file can't be split
+    """
+    quote = encode_char(quote_char, encoding=encoding)
+    newline = encode_char("\n", encoding=encoding)
+    if quote is None or newline is None:
+        return None
+
+    # Prepare state
+    chunks: List[CsvChunk] = []
+    hashers = hashers or {}
+    quoted = False
+    offset = 0
+    records = 0
+    start: Optional[int] = 0 if not skip_records else None
+    start_records = skip_records
+    target = chunk_size
+
+    # Scan blocks
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(BLOCK_SIZE)
+            if not block:
+                break
+            for hasher in hashers.values():
+                hasher.update(block)
+
+            # Find boundaries
+            cursor = 0
+            state = quoted
+            while True:
+                if start is None:
+                    index, state = find_record_end(
+                        block, cursor, quoted=state, quote=quote
+                    )
+                    if index == -1:
+                        break
+                    cursor = index + 1
+                    count, _ = count_records(block[:cursor], quoted=quoted, quote=quote)
+                    if records + count >= skip_records:
+                        start = offset + cursor
+                        target = start + chunk_size
+                    continue
+                if offset + len(block) <= target:
+                    break
+                if cursor < target - offset:
+                    if quote:
+                        state ^= bool(block.count(quote, cursor, target - offset) % 2)
+                    cursor = target - offset
+                index, state = find_record_end(block, cursor, quoted=state, quote=quote)
+                if index == -1:
+                    break
+                cursor = index + 1
+                count, _ = count_records(block[:cursor], quoted=quoted, quote=quote)
+                end = offset + cursor
+                chunk = CsvChunk(
+                    start, end, start_records + 1, records + count - start_records
+                )
+                chunks.append(chunk)
+                start = end
+                start_records = records + count
+                target = start + chunk_size
+
+            # Update state
+            count, quoted = count_records(block, quoted=quoted, quote=quote)
+            records += count
+            offset += len(block)
+
+    # Last chunk
+    if start is None or quoted:
+        return None
+    if start < offset:
+        count = records - start_records
+        with open(path, "rb") as file:
+            file.seek(offset - 1)
+            if file.read(1) != b"\n":
+                count += 1
+        chunks.append(CsvChunk(start, offset, start_records + 1, count))
+
+    hashes = {name: hasher.hexdigest() for name, hasher in hashers.items()}
+    return CsvChunks(chunks, offset, hashes)
+
+
+def read_chunk(
+    path: str,
+    chunk: CsvChunk,
+    *,
+    encoding: str,
+    newline: Optional[str] = "",
+    config: Dict[str, Any],
+) -> Iterator[List[str]]:
+    """Read a chunk's records with Python's `csv`
+
+    Parameters:
+        path: local path to the file
+        chunk: chunk to read
+        encoding: encoding of the file
+        newline: newline mode of the text stream
+        config: keyword arguments for `csv.reader`
+
+    Yields:
+        str[]: records
+    """
+    raw = ByteRangeStream(path, start=chunk.start, end=chunk.end)
+    with io.TextIOWrapper(io.BufferedReader(raw), encoding, newline=newline) as text:
+        yield from csv.reader(text, **config)
+
+
+def create_config(dialect: csv.Dialect) -> Dict[str, Any]:
+    """Create picklable `csv.reader` options from a Python's dialect"""
+    names = ["delimiter", "doublequote", "escapechar", "lineterminator"]
+    names += ["quotechar", "quoting", "skipinitialspace"]
+    return {name: getattr(dialect, name) for name in names}
+
+
+# Internal
+
+
+QUOTED_PATTERNS: Dict[bytes, re.Pattern[bytes]] = {}
+
+
+def encode_char(char: str, *, encoding: str) -> Optional[bytes]:
+    """Encode a char if the encoding keeps it as a single ASCII byte"""
+    if not char:
+        return b""
+    try:
+        # Compare after the first char as some encodings prepend a BOM
+        bytes = ("\n" + char).encode(encoding)
+        if len(char) == 1 and bytes.endswith(("\n" + char).encode("ascii")):
+            return char.encode("ascii")
+    except (LookupError, UnicodeError):
+        pass
+    return None
+
+
+def count_records(block: bytes, *, quoted: bool, quote: bytes) -> Tuple[int, bool]:
+    """Count newlines outside of quotes returning the final quoting state"""
+    if not quote or quote not in block:
+        return (block.count(b"\n") if not quoted else 0), quoted
+    if quoted:
+        index = block.find(quote)
+        block = block[index + 1 :]
+    quoted = bool(block.count(quote) % 2)
+    if quoted:
+        block = block[: block.rfind(quote)]
+    pattern = QUOTED_PATTERNS.get(quote)
+    if pattern is None:
+        escaped = re.escape(quote)
+        pattern = re.compile(escaped + b"[^" + escaped + b"]*" + escaped)
+        QUOTED_PATTERNS[quote] = pattern
+    return pattern.sub(b"", block).count(b"\n"), quoted
+
+
+def find_record_end(
+    block: bytes, position: int, *, quoted: bool, quote: bytes
+) -> Tuple[int, bool]:
+    """Find the next newline outside of quotes returning its index (-1 if none)
+    and the quoting state at this index (or the block's end)"""
+    while True:
+        if quoted:
+            index = block.find(quote, position)
+            if index == -1:
+                return -1, True
+            position = index + 1
+            quoted = False
+        newline = block.find(b"\n", position)
+        index = block.find(quote, position) if quote else -1
+        if newline == -1:
+            if index != -1:
+                quoted = bool(block.count(quote, index) % 2)
+            return -1, quoted
+        if index == -1 or newline < index:
+            return newline, False
+        position = index + 1
+        quoted = True
+
+
+class ByteRangeStream(io.RawIOBase):
+    """Raw byte stream limited to a range of a local file"""
+
+    def __init__(self, path: str, *, start: int, end: int):
+        self.__file = open(path, "rb")
+        self.__file.seek(start)
+        self.__remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self.__remaining)
+        if size <= 0:
+            return 0
+        count = self.__file.readinto(memoryview(buffer)[:size])
+        self.__remaining -= count
+        return count
+
+    def close(self):
+        self.__file.close()
+        super().close()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import atexit
 import datetime
-import hashlib
 import os
 import shutil
 import tempfile
@@ -10,7 +9,7 @@ import warnings
 from itertools import chain
 from typing import TYPE_CHECKING, Any, List
 
-from .... import errors
+from .... import errors, helpers
 from ....exception import FrictionlessException
 from ....platform import platform
 from ....resource import Resource
@@ -131,14 +130,16 @@ class XlsxParser(Parser):
         if self.resource.normpath and not self.resource.remote:
             stat = os.stat(self.resource.normpath)
             self.resource.stats.bytes = stat.st_size
-            md5 = hashlib.new("md5")
-            sha256 = hashlib.new("sha256")
-            with open(self.resource.normpath, "rb") as file:
-                for chunk in iter(lambda: file.read(4096), b""):
-                    md5.update(chunk)
-                    sha256.update(chunk)
-                self.resource.stats.md5 = md5.hexdigest()
-                self.resource.stats.sha256 = sha256.hexdigest()
+            hashing = self.resource.detector.detect_hashing(self.resource)
+            hashers = {name: helpers.create_hasher(name) for name in hashing}
+            if hashers:
+                with open(self.resource.normpath, "rb") as file:
+                    for chunk in iter(lambda: file.read(4096), b""):
+                        for hasher in hashers.values():
+                            hasher.update(chunk)
+            self.resource.stats.set_hashes(
+                {name: hasher.hexdigest() for name, hasher in hashers.items()}
+            )
 
     # Write
 
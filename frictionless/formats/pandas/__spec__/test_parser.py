@@ -7,7 +7,7 @@ import pandas as pd
 from dateutil.tz import tzoffset, tzutc
 from pandas.api.types import is_datetime64_any_dtype
 
-from frictionless import Package, Schema, validate
+from frictionless import Package, Schema, settings, validate
 from frictionless.resources import TableResource
 
 # Infer dtype from real DataFrame as the type is depending on pandas' version
@@ -91,6 +91,25 @@ def test_pandas_parser_from_dataframe_with_primary_key_having_datetime():
         ]
 
 
+def test_pandas_parser_read_by_slices(monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_BATCH_SIZE", 2)
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "date": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+            "name": ["english", np.nan, "中国人"],
+        }
+    ).set_index("id")
+    with TableResource(data=df) as resource:
+        assert resource.schema.primary_key == ["id"]
+        assert resource.read_cells() == [
+            ["id", "date", "name"],
+            [1, datetime(2020, 1, 1), "english"],
+            [2, datetime(2020, 1, 2), None],
+            [3, datetime(2020, 1, 3), "中国人"],
+        ]
+
+
 # Write
 
 
@@ -117,6 +136,22 @@ def test_pandas_parser_nan_in_integer_resource_column():
     assert list(df.dtypes) == [pd.Int64Dtype(), np.dtype("float64"), STRING_DTYPE]
 
 
+def test_pandas_parser_missing_values_round_trip():
+    source = TableResource(
+        data=[
+            ["int", "boolean", "date", "string"],
+            ["1", "true", "2020-01-01", "a"],
+            ["", "", "", "b"],
+        ]
+    )
+    df = source.to_pandas()
+    df["boolean"] = df["boolean"].astype("boolean")
+    target = TableResource(data=df)
+    assert target.read_cells()[2] == [None, None, None, "b"]
+    report = target.validate()
+    assert report.valid
+
+
 def test_pandas_parser_nan_in_integer_csv_column():
     # see issue 1109
     res = TableResource(path="data/issue-1109.csv")
@@ -237,6 +272,44 @@ def test_pandas_parser_write_timezone():
         ]
 
 
+def test_pandas_parser_write_typed_columns():
+    source = TableResource(
+        data=[
+            ["id", "name", "ratio", "flag"],
+            [1, "english", 1.5, True],
+            [2, "中国人", 2.5, False],
+        ]
+    )
+    target = source.to_pandas()
+    assert list(target.dtypes) == [
+        np.dtype("int64"),
+        STRING_DTYPE,
+        np.dtype("float64"),
+        np.dtype("bool"),
+    ]
+    assert target.to_dict("records") == [
+        {"id": 1, "name": "english", "ratio": 1.5, "flag": True},
+        {"id": 2, "name": "中国人", "ratio": 2.5, "flag": False},
+    ]
+
+
+def test_pandas_parser_write_chunksize():
+    source = TableResource(path="data/table.csv")
+    target = source.to_pandas(chunksize=1)
+    dataframes = list(target)
+    assert len(dataframes) == 2
+    assert dataframes[0].to_dict("records") == [{"id": 1, "name": "english"}]
+    assert dataframes[1].to_dict("records") == [{"id": 2, "name": "中国人"}]
+
+
+def test_pandas_parser_write_chunksize_with_remainder():
+    data = [["id"]] + [[number] for number in range(5)]
+    target = TableResource(data=data).to_pandas(chunksize=2)
+    dataframes = list(target)
+    assert [len(dataframe) for dataframe in dataframes] == [2, 2, 1]
+    assert pd.concat(dataframes)["id"].tolist() == [0, 1, 2, 3, 4]
+
+
 # Bugs
 
 
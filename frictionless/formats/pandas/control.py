@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import attrs
 
 from ...dialect import Control
@@ -10,3 +12,17 @@ class PandasControl(Control):
     """Pandas dialect representation"""
 
     type = "pandas"
+
+    chunksize: Optional[int] = None
+    """
+    Number of rows of every written dataframe. If set, the written data
+    is an iterator of dataframes so the memory usage is bounded by the chunk.
+    """
+
+    # Metadata
+
+    metadata_profile_patch = {
+        "properties": {
+            "chunksize": {"type": "integer"},
+        },
+    }
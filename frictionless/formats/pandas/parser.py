@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import datetime
 import decimal
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from dateutil.tz import tzoffset
 
-from ... import types
+from ... import settings, types
 from ...platform import platform
 from ...schema import Field, Schema
 from ...system import Parser
+from .control import PandasControl
 
 if TYPE_CHECKING:
     from ...resources import TableResource
@@ -34,7 +36,6 @@ class PandasParser(Parser):
     # Read
 
     def read_cell_stream_create(self):
-        np = platform.numpy
         pd = platform.pandas
         assert isinstance(self.resource.data, pd.DataFrame)
         dataframe = self.resource.data
@@ -45,21 +46,47 @@ class PandasParser(Parser):
             self.resource.schema = schema
 
         # Lists
+        # The dataframe is converted by slices of columns (not by rows)
         yield schema.field_names
-        for pk, item in dataframe.iterrows():  # type: ignore
-            cells: List[Any] = []
+        size = settings.DEFAULT_BATCH_SIZE
+        for start in range(0, len(dataframe), size):  # type: ignore
+            stop = start + size
+            columns: List[List[Any]] = []
             for field in schema.fields:
                 if field.name in schema.primary_key:
-                    pk = pk if isinstance(pk, tuple) else [pk]  # type: ignore
-                    value = pk[schema.primary_key.index(field.name)]  # type: ignore
+                    level = schema.primary_key.index(field.name)
+                    series = dataframe.index.get_level_values(level)[start:stop]  # type: ignore
                 else:
-                    value = item.to_dict()[field.name]
-                if value is np.nan:
-                    value = None
-                elif isinstance(value, pd.Timestamp):
-                    value = value.to_pydatetime()  # type: ignore
-                cells.append(value)
-            yield cells
+                    position = dataframe.columns.get_loc(field.name)  # type: ignore
+                    series = dataframe.iloc[start:stop, position]  # type: ignore
+                values = self.__read_convert_values(series, pd=pd)  # type: ignore
+                columns.append(values)
+            if not columns:
+                yield from ([] for _ in range(len(dataframe.index[start:stop])))  # type: ignore
+            yield from map(list, zip(*columns))
+
+    def __read_convert_values(self, series: Any, *, pd: Any):
+        pdc = platform.pandas_core_dtypes_api
+
+        dtype = series.dtype  # type: ignore
+
+        # NumPy floats keep NaN (it's a number) while missing values of
+        # other dtypes (NA, NaT, None) are read as None
+        if pdc.is_float_dtype(dtype) and not pdc.is_extension_array_dtype(dtype):  # type: ignore
+            return series.tolist()  # type: ignore
+        mask = series.notna()  # type: ignore
+        if not mask.all():  # type: ignore
+            series = series.astype(object).where(mask, None)  # type: ignore
+        elif pdc.is_numeric_dtype(dtype) or pdc.is_bool_dtype(dtype):  # type: ignore
+            return series.tolist()  # type: ignore
+
+        # Python values
+        result: List[Any] = []
+        for value in series.tolist():  # type: ignore
+            if isinstance(value, pd.Timestamp):
+                value = value.to_pydatetime()  # type: ignore
+            result.append(value)
+        return result
 
     def __read_convert_schema(self):
         dataframe = self.resource.data
@@ -121,56 +148,52 @@ class PandasParser(Parser):
     # Write
 
     def write_row_stream(self, source: TableResource):
+        control = PandasControl.from_dialect(self.resource.dialect)
+        dataframes = self.__write_dataframes(source, chunksize=control.chunksize)
+        self.resource.data = dataframes if control.chunksize else next(dataframes)
+
+    def __write_dataframes(self, source: TableResource, *, chunksize: Optional[int]):
+        # NOTE:
+        # The rows are read in columnar batches so no row objects are created
+        # and every column is cast to a typed array when a dataframe is created
+        with source:
+            names = source.schema.field_names
+            columns: Dict[str, List[Any]] = {name: [] for name in names}
+            length = 0
+            for batch in source.batch_stream:
+                for name in names:
+                    columns[name].extend(batch.columns[name])
+                length += len(batch)
+                while chunksize and length >= chunksize:
+                    chunk = {name: items[:chunksize] for name, items in columns.items()}
+                    columns = {name: items[chunksize:] for name, items in columns.items()}
+                    length -= chunksize
+                    yield self.__write_dataframe(source, chunk)
+            if not chunksize or length:
+                yield self.__write_dataframe(source, columns)
+
+    def __write_dataframe(self, source: TableResource, cells: Dict[str, List[Any]]):
         np = platform.numpy
         pd = platform.pandas
 
         # Get data/index
-        data_rows: List[Tuple[Any]] = []
-        index_rows: List[Tuple[Any]] = []
-        fixed_types = {}
-        with source:
-            for row in source.row_stream:
-                data_values: List[Any] = []
-                index_values: List[Any] = []
-                for field in source.schema.fields:
-                    value = row[field.name]
-                    if isinstance(value, float) and np.isnan(value):
-                        value = None
-                    if isinstance(value, decimal.Decimal):
-                        value = float(value)
-                    # Convert to UTC for timezone aware datetime
-                    # From version 0.24 pandas preserves the dateutil object and doesn't by default
-                    # convert to "UTC"
-                    # https://github.com/pandas-dev/pandas/issues/25423#issuecomment-485784044
-                    if isinstance(value, datetime.datetime) and value.tzinfo:
-                        value = value.astimezone(datetime.timezone.utc)
-                    # For datetime.time having zero offset from UTC, the tzinfo is set to tzutc() which
-                    # causes error while reading.
-                    if isinstance(value, datetime.time) and value.tzinfo:
-                        value = value.replace(
-                            tzinfo=tzoffset(
-                                datetime.timezone.utc,
-                                value.utcoffset().total_seconds(),  # type: ignore
-                            )
-                        )
-                    # http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na
-                    if value is None and field.type in ("number", "integer"):
-                        fixed_types[field.name] = "number"
-                        value = np.nan
-                    if field.name in source.schema.primary_key:
-                        index_values.append(value)
-                    else:
-                        data_values.append(value)
-
-                if len(source.schema.primary_key) == 1:
-                    index_rows.append(index_values[0])
-                elif len(source.schema.primary_key) > 1:
-                    index_rows.append(tuple(index_values))
-                data_rows.append(tuple(data_values))
+        primary_key = source.schema.primary_key
+        data_columns: Dict[str, Any] = {}
+        index_columns: Dict[str, List[Any]] = {}
+        for field in source.schema.fields:
+            values = cells[field.name]
+            if field.name in primary_key:
+                convert = partial(self.__write_convert_value, field, np=np)
+                index_columns[field.name] = list(map(convert, values))
+            else:
+                data_columns[field.name] = self.__write_convert_column(field, values)
+        index_rows: List[Any] = []
+        if len(primary_key) == 1:
+            index_rows = index_columns[primary_key[0]]
+        elif len(primary_key) > 1:
+            index_rows = list(zip(*(index_columns[name] for name in primary_key)))
 
         # Create index
-        pd = platform.pandas
-
         index = None
         if source.schema.primary_key:
             if len(source.schema.primary_key) == 1:
@@ -194,7 +217,7 @@ class PandasParser(Parser):
                 columns.append(field.name)
 
         # Create/set dataframe
-        dataframe = pd.DataFrame(data_rows, index=index, columns=columns)
+        dataframe = pd.DataFrame(data_columns, index=index, columns=columns)
 
         # This step will see if there is any column for which the schema is defined
         # as 'integer' but Pandas inferred it as a float. This can happen if there
@@ -218,7 +241,55 @@ class PandasParser(Parser):
             ):
                 dataframe[field.name] = pd.to_datetime(dataframe[field.name])
 
-        self.resource.data = dataframe
+        return dataframe
+
+    def __write_convert_column(self, field: Field, values: List[Any]):
+        np = platform.numpy
+        pd = platform.pandas
+
+        # Typed arrays
+        # Other columns (and ints overflowing int64) are left for pandas to infer
+        if values and field.type == "integer":
+            try:
+                if None in values:
+                    return pd.array(values, dtype="Int64")  # type: ignore
+                return np.array(values, dtype=np.int64)  # type: ignore
+            except (OverflowError, TypeError, ValueError):
+                pass
+        if values and field.type == "number":
+            if not all(type(value) is int or value is None for value in values):
+                return np.array(values, dtype=np.float64)  # type: ignore
+        if values and field.type == "boolean" and None not in values:
+            return np.array(values, dtype=np.bool_)  # type: ignore
+
+        # Python values
+        convert = partial(self.__write_convert_value, field, np=np)
+        return list(map(convert, values))
+
+    def __write_convert_value(self, field: Field, value: Any, *, np: Any):
+        if isinstance(value, float) and np.isnan(value):
+            value = None
+        if isinstance(value, decimal.Decimal):
+            value = float(value)
+        # Convert to UTC for timezone aware datetime
+        # From version 0.24 pandas preserves the dateutil object and doesn't by default
+        # convert to "UTC"
+        # https://github.com/pandas-dev/pandas/issues/25423#issuecomment-485784044
+        if isinstance(value, datetime.datetime) and value.tzinfo:
+            value = value.astimezone(datetime.timezone.utc)
+        # For datetime.time having zero offset from UTC, the tzinfo is set to tzutc() which
+        # causes error while reading.
+        if isinstance(value, datetime.time) and value.tzinfo:
+            value = value.replace(
+                tzinfo=tzoffset(
+                    datetime.timezone.utc,
+                    value.utcoffset().total_seconds(),  # type: ignore
+                )
+            )
+        # http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na
+        if value is None and field.type in ("number", "integer"):
+            value = np.nan
+        return value
 
     def __write_convert_type(self, type: Optional[str] = None):
         np = platform.numpy
@@ -2,7 +2,7 @@ import datetime
 
 import pytest
 
-from frictionless import formats
+from frictionless import Schema, formats, system
 from frictionless.resources import TableResource
 
 # Read
@@ -36,6 +36,59 @@ def test_parquet_parser_columns():
         ]
 
 
+def test_parquet_parser_filters():
+    control = formats.ParquetControl(filters=[("id", "=", 2)])
+    with TableResource(path="data/table.parq", control=control) as resource:
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_parquet_parser_row_groups(tmpdir):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmpdir.join("table.parq"))
+    table = pa.table(
+        {
+            "id": pa.array([1, 2, None], type=pa.int32()),
+            "date": [datetime.date(2020, 1, 1), None, datetime.date(2020, 1, 3)],
+            "tags": [["a"], [], None],
+        }
+    )
+    pq.write_table(table, path, row_group_size=1)
+    with system.use_context(trusted=True):
+        with TableResource(path=path) as resource:
+            assert resource.schema.to_descriptor() == {
+                "fields": [
+                    {"name": "id", "type": "integer"},
+                    {"name": "date", "type": "date"},
+                    {"name": "tags", "type": "array"},
+                ]
+            }
+            assert resource.read_cells() == [
+                ["id", "date", "tags"],
+                [1, datetime.date(2020, 1, 1), ["a"]],
+                [2, None, []],
+                [None, datetime.date(2020, 1, 3), None],
+            ]
+
+
+def test_parquet_parser_pandas_index(tmpdir):
+    pd = pytest.importorskip("pandas")
+    path = str(tmpdir.join("table.parq"))
+    df = pd.DataFrame({"id": [1, 2], "name": ["english", "中国人"]})
+    df.set_index("id").to_parquet(path)
+    with system.use_context(trusted=True):
+        with TableResource(path=path) as resource:
+            assert resource.schema.primary_key == ["id"]
+            assert resource.header == ["id", "name"]
+            assert resource.read_rows() == [
+                {"id": 1, "name": "english"},
+                {"id": 2, "name": "中国人"},
+            ]
+
+
 @pytest.mark.ci
 def test_parquet_parser_remote():
     with TableResource(
@@ -77,3 +130,137 @@ def test_parquet_parser_write_datetime_field_with_timezone(tmpdir):
                 )
             }
         ]
+
+
+def test_parquet_parser_write_row_groups(tmpdir):
+    pq = pytest.importorskip("pyarrow.parquet")
+    data = [["id", "name"]] + [[str(index), f"name{index}"] for index in range(5)]
+    control = formats.ParquetControl(row_group_size=2, compression="gzip")
+    source = TableResource(data=data)
+    target = TableResource(path=str(tmpdir.join("table.parq")), control=control)
+    source.write(target)
+    metadata = pq.ParquetFile(target.normpath).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).num_rows == 2
+    assert metadata.row_group(0).column(0).compression == "GZIP"
+    with target:
+        assert target.read_rows() == [
+            {"id": index, "name": f"name{index}"} for index in range(5)
+        ]
+
+
+def test_parquet_parser_write_types(tmpdir):
+    source = TableResource(
+        data=[
+            ["number", "date", "datetime", "year", "duration"],
+            ["1.5", "2020-01-01", "2020-01-01T10:00:00", "2020", "P1Y"],
+            ["", "", "", "", ""],
+        ],
+        schema=Schema.from_descriptor(
+            {
+                "fields": [
+                    {"name": "number", "type": "number"},
+                    {"name": "date", "type": "date"},
+                    {"name": "datetime", "type": "datetime"},
+                    {"name": "year", "type": "year"},
+                    {"name": "duration", "type": "duration"},
+                ]
+            }
+        ),
+    )
+    target = TableResource(path=str(tmpdir.join("table.parq")))
+    source.write(target)
+    with target:
+        assert target.schema.to_descriptor() == {
+            "fields": [
+                {"name": "number", "type": "number"},
+                {"name": "date", "type": "date"},
+                {"name": "datetime", "type": "datetime"},
+                {"name": "year", "type": "integer"},
+                {"name": "duration", "type": "string"},
+            ]
+        }
+        assert target.read_cells()[1:] == [
+            [
+                1.5,
+                datetime.date(2020, 1, 1),
+                datetime.datetime(2020, 1, 1, 10),
+                2020,
+                "P1Y",
+            ],
+            [None, None, None, None, None],
+        ]
+
+
+def test_parquet_parser_write_categories(tmpdir):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    control = formats.ParquetControl(categories=["name"])
+    source = TableResource(path="data/table.csv")
+    target = TableResource(path=str(tmpdir.join("table.parq")), control=control)
+    source.write(target)
+    arrow_schema = pq.ParquetFile(target.normpath).schema_arrow
+    assert pa.types.is_dictionary(arrow_schema.field("name").type)
+    with target:
+        assert target.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_parquet_parser_write_null_first_row_group(tmpdir):
+    data = [["array", "object", "datetime"], [None, None, None], [None, None, None]]
+    data.append([[1, "a"], {"key": 1}, "2020-01-01T10:00:00Z"])
+    control = formats.ParquetControl(row_group_size=2)
+    source = TableResource(
+        data=data,
+        schema=Schema.from_descriptor(
+            {
+                "fields": [
+                    {"name": "array", "type": "array"},
+                    {"name": "object", "type": "object"},
+                    {"name": "datetime", "type": "datetime"},
+                ]
+            }
+        ),
+    )
+    target = TableResource(path=str(tmpdir.join("table.parq")), control=control)
+    source.write(target)
+    with target:
+        assert target.schema.to_descriptor() == {
+            "fields": [
+                {"name": "array", "type": "array"},
+                {"name": "object", "type": "object"},
+                {"name": "datetime", "type": "datetime"},
+            ]
+        }
+        assert target.read_rows() == [
+            {"array": None, "object": None, "datetime": None},
+            {"array": None, "object": None, "datetime": None},
+            {
+                "array": [1, "a"],
+                "object": {"key": 1},
+                "datetime": datetime.datetime(2020, 1, 1, 10),
+            },
+        ]
+
+
+def test_parquet_parser_write_array_item_type(tmpdir):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    source = TableResource(
+        data=[["array"], ["[1, 2]"], [None]],
+        schema=Schema.from_descriptor(
+            {
+                "fields": [
+                    {"name": "array", "type": "array", "arrayItem": {"type": "integer"}}
+                ]
+            }
+        ),
+    )
+    target = TableResource(path=str(tmpdir.join("table.parq")))
+    source.write(target)
+    arrow_schema = pq.ParquetFile(target.normpath).schema_arrow
+    assert arrow_schema.field("array").type == pa.list_(pa.int64())
+    with target:
+        assert target.read_cells()[1:] == [[[1, 2]], [None]]
@@ -6,6 +6,7 @@ import attrs
 
 from ... import helpers
 from ...dialect import Control
+from . import settings
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -29,7 +30,8 @@ class ParquetControl(Control):
     """
     List of columns that should be returned as Pandas Category-type column.
     The second example specifies the number of expected labels for that column.
-    For example: categories=['col1'] or categories={'col1': 12}
+    For example: categories=['col1'] or categories={'col1': 12}. On writing,
+    these columns are stored as dictionary-encoded (categorical) columns.
     """
 
     filters: Optional[Any] = False
@@ -38,6 +40,18 @@ class ParquetControl(Control):
     For example: [('col3', 'in', [1, 2, 3, 4])])
     """
 
+    compression: str = settings.DEFAULT_COMPRESSION
+    """
+    Compression codec used for writing. It can be "snappy", "gzip",
+    "brotli", "zstd", "lz4" or "none". Default value is "snappy".
+    """
+
+    row_group_size: int = settings.DEFAULT_ROW_GROUP_SIZE
+    """
+    Number of rows in a row group used for writing. Rows are written
+    row group by row group so it also limits the memory usage.
+    """
+
     # Convert
 
     def to_python(self):
@@ -55,5 +69,7 @@ class ParquetControl(Control):
             "columns": {"type": "array", "items": {"type": "string"}},
             "categories": {},
             "filters": {},
+            "compression": {"type": "string"},
+            "rowGroupSize": {"type": "integer"},
         },
     }
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import datetime
+from typing import Any, Dict, List, Tuple, Union
+
 from ... import types
 from ...platform import platform
 from ...resources import TableResource
+from ...schema import Field, Schema
 from ...system import Parser
 from .control import ParquetControl
 
@@ -26,6 +30,7 @@ class ParquetParser(Parser):
     # Read
 
     def read_cell_stream_create(self) -> types.ICellStream:
+        pq = platform.pyarrow_parquet
         control = ParquetControl.from_dialect(self.resource.dialect)
         handle = self.resource.normpath
         if self.resource.remote:
@@ -33,22 +38,289 @@ class ParquetParser(Parser):
                 self.resource.normpath, "rb", is_text=False
             )
             handle = handles.handle
-        pq = platform.pyarrow_parquet
-        table = pq.read_table(
-            handle,
-            columns=control.columns,
-            filters=control.filters or None,
-        )
-        df = table.to_pandas(categories=control.categories or None)
-        with TableResource(data=df, format="pandas") as resource:
-            yield from resource.cell_stream
+
+        # NOTE:
+        # The file is read by row groups converting Arrow columns to Python lists
+        # once per batch so only one row group is kept in memory. Dictionary
+        # (categorical) columns are read as their values
+
+        with pq.ParquetFile(handle) as file:  # type: ignore
+            arrow_schema = file.schema_arrow  # type: ignore
+
+            # Prepare columns
+            index, hidden = self.__read_pandas_index(arrow_schema)
+            if control.columns:
+                index, hidden = {}, []
+            if control.filters:
+                # Range indexes can't be aligned with the filtered rows
+                index = {k: v for k, v in index.items() if isinstance(v, str)}
+            columns = control.columns or [
+                name
+                for name in arrow_schema.names
+                if name not in index.values() and name not in hidden
+            ]
+            sources = [*index.values(), *columns]
+            read_columns = [source for source in sources if isinstance(source, str)]
+
+            # Schema
+            if not self.resource.schema:
+                schema = Schema()
+                for name, source in [*index.items(), *zip(columns, columns)]:
+                    type = "integer"
+                    if isinstance(source, str):
+                        arrow_field = arrow_schema.field(source)  # type: ignore
+                        type = self.__read_convert_type(arrow_field)
+                    field = Field.from_descriptor({"name": name, "type": type})
+                    if name in index:
+                        field.required = True
+                        schema.primary_key.append(name)
+                    schema.add_field(field)
+                self.resource.schema = schema
+
+            # Lists
+            yield [*index, *columns]
+            if control.filters:
+                ds = platform.pyarrow_dataset
+                native = handle
+                if isinstance(native, str):
+                    native = platform.pyarrow.OSFile(native)  # type: ignore
+                fragment = ds.ParquetFileFormat().make_fragment(native)  # type: ignore
+                expression = pq.filters_to_expression(control.filters)  # type: ignore
+                batches = fragment.to_batches(columns=read_columns, filter=expression)  # type: ignore
+            else:
+                batches = file.iter_batches(columns=read_columns)  # type: ignore
+            offset = 0
+            for batch in batches:  # type: ignore
+                length: int = batch.num_rows  # type: ignore
+                lists: List[List[Any]] = []
+                for source in sources:
+                    if isinstance(source, str):
+                        lists.append(batch.column(source).to_pylist())  # type: ignore
+                    else:
+                        lists.append(list(source[offset : offset + length]))
+                offset += length
+                yield from map(list, zip(*lists))
+
+    def __read_pandas_index(
+        self, arrow_schema: Any
+    ) -> Tuple[Dict[str, Union[str, range]], List[str]]:
+        """Read the index of a dataframe saved by pandas
+
+        Named index columns are mapped to their names and range indexes are mapped
+        to ranges as they are not saved as columns. Unnamed index columns are
+        returned separately to be skipped (as pandas does).
+        """
+        index: Dict[str, Union[str, range]] = {}
+        hidden: List[str] = []
+        metadata = arrow_schema.pandas_metadata or {}  # type: ignore
+        names = {item["field_name"]: item["name"] for item in metadata.get("columns", [])}
+        for item in metadata.get("index_columns", []):
+            if isinstance(item, str):
+                name = names.get(item)
+                if name is None:
+                    hidden.append(item)
+                    continue
+                index[name] = item
+            elif item.get("kind") == "range" and item.get("name") is not None:
+                index[item["name"]] = range(item["start"], item["stop"], item["step"])
+        return index, hidden
+
+    def __read_convert_type(self, arrow_field: Any) -> str:
+        pa = platform.pyarrow
+        arrow_type = arrow_field.type  # type: ignore
+
+        # Metadata
+        metadata = arrow_field.metadata or {}  # type: ignore
+        type = metadata.get(TYPE_METADATA.encode())  # type: ignore
+        if type:
+            return type.decode()  # type: ignore
+
+        # Mapping
+        if pa.types.is_dictionary(arrow_type):  # type: ignore
+            arrow_type = arrow_type.value_type  # type: ignore
+        if pa.types.is_boolean(arrow_type):  # type: ignore
+            return "boolean"
+        elif pa.types.is_integer(arrow_type):  # type: ignore
+            return "integer"
+        elif pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):  # type: ignore
+            return "number"
+        elif pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):  # type: ignore
+            return "string"
+        elif pa.types.is_timestamp(arrow_type):  # type: ignore
+            return "datetime"
+        elif pa.types.is_date(arrow_type):  # type: ignore
+            return "date"
+        elif pa.types.is_time(arrow_type):  # type: ignore
+            return "time"
+        elif pa.types.is_duration(arrow_type):  # type: ignore
+            return "duration"
+        elif pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):  # type: ignore
+            return "array"
+        elif pa.types.is_fixed_size_list(arrow_type):  # type: ignore
+            return "array"
+        elif pa.types.is_struct(arrow_type):  # type: ignore
+            return "object"
+
+        # Default
+        return "any"
 
     # Write
 
     def write_row_stream(self, source: TableResource):
-        import pyarrow as pa  # type: ignore[reportMissingTypeStubs]
+        control = ParquetControl.from_dialect(self.resource.dialect)
+        size = control.row_group_size
 
+        # NOTE:
+        # Rows are written by row groups converting columnar batches to Arrow
+        # arrays so only one row group is kept in memory. The Arrow schema is
+        # created from the fields so every row group has the same types
+
+        writer = None
+        try:
+            with source:
+                names = source.schema.field_names
+                columns: Dict[str, List[Any]] = {name: [] for name in names}
+                length = 0
+                for batch in source.batch_stream:
+                    for name in names:
+                        columns[name].extend(batch.columns[name])
+                    length += len(batch)
+                    while length >= size:
+                        group = {name: items[:size] for name, items in columns.items()}
+                        columns = {name: items[size:] for name, items in columns.items()}
+                        length -= size
+                        writer = self.__write_row_group(writer, source, group)
+                if writer is None or length:
+                    writer = self.__write_row_group(writer, source, columns)
+        finally:
+            if writer is not None:
+                writer.close()  # type: ignore
+
+    def __write_row_group(
+        self, writer: Any, source: TableResource, columns: Dict[str, List[Any]]
+    ) -> Any:
+        pa = platform.pyarrow
         pq = platform.pyarrow_parquet
-        df = source.to_pandas()
-        table = pa.Table.from_pandas(df)  # type: ignore[reportUnknownMemberType]
-        pq.write_table(table, self.resource.normpath)
+        control = ParquetControl.from_dialect(self.resource.dialect)
+
+        # Create schema
+        arrow_schema = writer.schema if writer else None  # type: ignore
+        if arrow_schema is None:
+            arrow_schema = self.__write_create_schema(source.schema, columns)
+
+        # Create arrays
+        arrays: List[Any] = []
+        for index, field in enumerate(source.schema.fields):
+            type = arrow_schema.field(index).type  # type: ignore
+            values = self.__write_convert_values(field, columns[field.name], type)
+            arrays.append(pa.array(values, type=type))  # type: ignore
+
+        # Write table
+        table = pa.Table.from_arrays(arrays, schema=arrow_schema)  # type: ignore
+        if writer is None:
+            writer = pq.ParquetWriter(  # type: ignore
+                self.resource.normpath,
+                arrow_schema,
+                compression=control.compression,
+            )
+        writer.write_table(table, row_group_size=control.row_group_size)  # type: ignore
+        return writer
+
+    def __write_create_schema(self, schema: Schema, columns: Dict[str, List[Any]]) -> Any:
+        pa = platform.pyarrow
+        control = ParquetControl.from_dialect(self.resource.dialect)
+        categories = control.categories or []
+        arrow_fields: List[Any] = []
+        for field in schema.fields:
+            type = self.__write_convert_type(field, columns[field.name])
+            metadata = None
+            if type is None:
+                # Types without an Arrow counterpart are stored as JSON or
+                # text keeping the field type to be read back
+                type = pa.string()  # type: ignore
+                metadata = {TYPE_METADATA: field.type}
+            if field.name in categories:
+                type = pa.dictionary(pa.int32(), type)  # type: ignore
+            arrow_fields.append(pa.field(field.name, type, metadata=metadata))  # type: ignore
+        return pa.schema(arrow_fields)  # type: ignore
+
+    def __write_convert_type(self, field: Field, values: List[Any]) -> Any:
+        pa = platform.pyarrow
+
+        # Timezone
+        # It's not a part of the field so it's taken from the first value
+        if field.type == "datetime":
+            for value in values:
+                if value is not None:
+                    tz = "UTC" if value.tzinfo else None
+                    return pa.timestamp("us", tz=tz)  # type: ignore
+            return pa.timestamp("us")  # type: ignore
+
+        # Mapping
+        mapping = {
+            "boolean": pa.bool_(),  # type: ignore
+            "date": pa.date32(),  # type: ignore
+            "integer": pa.int64(),  # type: ignore
+            "number": pa.float64(),  # type: ignore
+            "string": pa.string(),  # type: ignore
+            "time": pa.time64("us"),  # type: ignore
+            "year": pa.int64(),  # type: ignore
+        }
+
+        # Arrays
+        if field.type == "array":
+            array_item = getattr(field, "array_item", None) or {}
+            item_type = mapping.get(array_item.get("type"))  # type: ignore
+            if item_type is not None:
+                return pa.list_(item_type)  # type: ignore
+
+        # Unknown types
+        if field.type not in mapping:
+            return None if field.type in JSON_TYPES else pa.string()  # type: ignore
+
+        return mapping[field.type]
+
+    def __write_convert_values(
+        self, field: Field, values: List[Any], type: Any
+    ) -> List[Any]:
+        pa = platform.pyarrow
+        if pa.types.is_dictionary(type):  # type: ignore
+            type = type.value_type  # type: ignore
+        if field.type == "number":
+            return [float(value) if value is not None else None for value in values]
+        if field.type == "time":
+            return [
+                value.replace(tzinfo=None) if value is not None else None
+                for value in values
+            ]
+        if field.type == "datetime":
+            return [
+                convert_timezone(value, aware=bool(type.tz))  # type: ignore
+                if value is not None
+                else None
+                for value in values
+            ]
+        if pa.types.is_string(type) and field.type != "string":  # type: ignore
+            writer = field.create_cell_writer()
+            return [writer(value)[0] if value is not None else None for value in values]
+        return values
+
+
+# Internal
+
+# Types stored as JSON strings with the field type in the Arrow metadata
+JSON_TYPES = ["array", "object"]
+
+TYPE_METADATA = "frictionless:type"
+
+
+def convert_timezone(value: Any, *, aware: bool) -> Any:
+    # Aware values are stored in UTC and naive values are taken as UTC
+    # if the column is aware (it's defined by the first value)
+    if not isinstance(value, datetime.datetime):
+        return value
+    if aware and value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    if not aware and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+# General
+
+DEFAULT_COMPRESSION = "snappy"
+DEFAULT_ROW_GROUP_SIZE = 100000
@@ -4,6 +4,7 @@ import pytest
 import sqlalchemy as sa
 
 from frictionless import Package, formats
+from frictionless.formats.sql.loader import write_copy_cell
 from frictionless.resources import TableResource
 
 # General
@@ -285,3 +286,91 @@ def test_sql_adapter_max_parameters_issue_1196(sqlite_url, sqlite_max_variable_n
         resource.write(
             sqlite_url, control=formats.SqlControl(table="test_max_param_table")
         )
+
+
+# Bulk
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_sql_adapter_write_batch_size(sqlite_url, batch_size):
+    data = [["id", "name"]] + [[str(number), f"name{number}"] for number in range(5)]
+    control = formats.SqlControl(table="table", batch_size=batch_size)
+    with TableResource(data=data) as resource:
+        resource.write(sqlite_url, control=control)
+    target = TableResource(path=sqlite_url, control=formats.SqlControl(table="table"))
+    assert target.read_rows() == [
+        {"id": number, "name": f"name{number}"} for number in range(5)
+    ]
+
+
+def test_sql_adapter_write_commit_size_checkpoint(sqlite_url):
+    engine = sa.create_engine(sqlite_url)
+    data = [["id"]] + [[str(number)] for number in range(10)]
+    resource = TableResource(data=data)
+    resource.infer()
+    control = formats.SqlControl(batch_size=2, commit_size=3)
+    adapter = formats.SqlAdapter(engine, control=control)
+    adapter.write_schema(resource.schema, table_name="table")
+
+    # Interrupt the load
+    checkpoints = []
+
+    def interrupted_row_stream():
+        for row in resource.row_stream:
+            if row.row_number == 9:
+                raise RuntimeError("interrupted")
+            yield row
+
+    with resource:
+        with pytest.raises(RuntimeError):
+            adapter.write_row_stream(
+                interrupted_row_stream(),
+                table_name="table",
+                on_commit=checkpoints.append,
+            )
+    assert checkpoints == [4, 7]
+    with engine.begin() as conn:
+        assert conn.execute(sa.text('SELECT id FROM "table"')).scalars().all() == [
+            0,
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+    # Resume the load
+    with resource:
+        adapter.write_row_stream(
+            resource.row_stream,
+            table_name="table",
+            on_commit=checkpoints.append,
+            checkpoint=checkpoints[-1],
+        )
+    assert checkpoints == [4, 7, 10, 11]
+    with engine.begin() as conn:
+        ids = conn.execute(sa.text('SELECT id FROM "table"')).scalars().all()
+        assert ids == list(range(10))
+
+
+def test_sql_adapter_write_bulk_pragmas(sqlite_url):
+    engine = sa.create_engine(sqlite_url)
+    control = formats.SqlControl(table="table", bulk_pragmas=True)
+    with TableResource(path="data/table.csv") as resource:
+        resource.write(sqlite_url, control=control)
+    with engine.begin() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+    target = TableResource(path=sqlite_url, control=formats.SqlControl(table="table"))
+    assert target.read_rows() == [
+        {"id": 1, "name": "english"},
+        {"id": 2, "name": "中国人"},
+    ]
+
+
+def test_sql_adapter_write_copy_cell():
+    assert write_copy_cell(None) == ""
+    assert write_copy_cell("") == '""'
+    assert write_copy_cell('a "b", c') == '"a ""b"", c"'
+    assert write_copy_cell(True) == '"true"'
+    assert write_copy_cell(datetime.date(2020, 1, 1)) == '"2020-01-01"'
+    assert write_copy_cell({"a": 1}, as_json=True) == '"{""a"": 1}"'
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Generator, List, Optional
 
 from ...package import Package
 from ...platform import platform
@@ -9,6 +9,7 @@ from ...resource import Resource
 from ...system import Adapter, PublishResult
 from . import settings
 from .control import SqlControl
+from .loader import SqlLoader
 from .mapper import SqlMapper
 
 if TYPE_CHECKING:
@@ -145,19 +146,26 @@ class SqlAdapter(Adapter):
         *,
         table_name: str,
         on_row: Optional[Callable[[Row], None]] = None,
+        on_commit: Optional[Callable[[int], None]] = None,
+        checkpoint: Optional[int] = None,
     ) -> None:
-        sa = platform.sqlalchemy
-        with self.engine.begin() as conn:
-            buffer: List[Dict[str, Any]] = []
-            table = self.metadata.tables[table_name]
+        """Write rows to a table in batches (see `SqlControl.batch_size`)
+
+        Parameters:
+            row_stream (Row[]): rows to write
+            table_name (str): name of the table
+            on_row (func?): callback called for every written row
+            on_commit (func?): callback called with the number of the last
+                committed row (see `SqlControl.commit_size`)
+            checkpoint (int?): number of the last committed row of an
+                interrupted load; the rows up to it are skipped
+        """
+        with SqlLoader(
+            self, table_name=table_name, checkpoint=checkpoint, on_commit=on_commit
+        ) as loader:
             for row in row_stream:
-                buffer.append(self.mapper.write_row(row))
-                if len(buffer) > settings.BUFFER_SIZE:
-                    conn.execute(sa.insert(table), buffer)
-                    buffer.clear()
-                on_row(row) if on_row else None
-            if len(buffer):
-                conn.execute(sa.insert(table), buffer)
+                if loader.write_row(row):
+                    on_row(row) if on_row else None
 
     def write_resource_with_metadata(
         self,
@@ -166,24 +174,14 @@ class SqlAdapter(Adapter):
         table_name: str,
         on_row: Optional[Callable[[Row], None]] = None,
     ) -> Report:
-        sa = platform.sqlalchemy
-        with self.engine.begin() as conn:
+        with SqlLoader(self, table_name=table_name, with_metadata=True) as loader:
             # Write row
             def process_row(row: Row):
-                buffer.append(self.mapper.write_row(row, with_metadata=True))
-                if len(buffer) > settings.BUFFER_SIZE:
-                    conn.execute(sa.insert(table), buffer)
-                    buffer.clear()
+                loader.write_row(row)
                 on_row(row) if on_row else None
 
             # Validate/iterate
-            buffer: List[Dict[str, Any]] = []
-            table = self.metadata.tables[table_name]
-            report = resource.validate(on_row=process_row)
-            if len(buffer):
-                conn.execute(sa.insert(table), buffer)
-
-            return report
+            return resource.validate(on_row=process_row)
 
 
 # Internal
@@ -5,6 +5,7 @@ from typing import Optional
 import attrs
 
 from ...dialect import Control
+from . import settings
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -54,6 +55,32 @@ class SqlControl(Control):
     _rowNumber or _rowValid
     """
 
+    batch_size: int = settings.BUFFER_SIZE
+    """
+    Number of rows sent to the database at once while writing.
+    The rows of a batch are inserted by a single driver-level call.
+    """
+
+    commit_size: Optional[int] = None
+    """
+    Number of rows written between commits. By default, all the rows
+    are written in one transaction. Periodic commits make it possible
+    to resume an interrupted load (see `SqlAdapter.write_row_stream`).
+    """
+
+    bulk_pragmas: bool = False
+    """
+    Relax SQLite's durability while writing by setting
+    `journal_mode=MEMORY` and `synchronous=OFF`. The previous
+    values are restored after the load. Ignored for other databases.
+    """
+
+    copy: bool = False
+    """
+    Write rows to PostgreSQL using `COPY FROM STDIN` in CSV format.
+    It requires the psycopg or psycopg2 driver and is ignored otherwise.
+    """
+
     # Metadata
 
     metadata_profile_patch = {
@@ -65,5 +92,9 @@ class SqlControl(Control):
             "namespace": {"type": "string"},
             "basepath": {"type": "string"},
             "withMetadata": {"type": "boolean"},
+            "batchSize": {"type": "integer"},
+            "commitSize": {"type": "integer"},
+            "bulkPragmas": {"type": "boolean"},
+            "copy": {"type": "boolean"},
         },
     }
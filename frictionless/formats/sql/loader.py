@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from ...platform import platform
+from . import settings
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection, RootTransaction
+
+    from ...table import Row
+    from .adapter import SqlAdapter
+    from .control import SqlControl
+
+
+class SqlLoader:
+    """Bulk writer of rows to a SQL table
+
+    > Constructor of this object is not Public API
+
+    Rows are converted to tuples and sent in batches of `control.batch_size`
+    using the fastest method supported by the driver:
+    - PostgreSQL `COPY FROM STDIN` in CSV format (if `control.copy` is set)
+    - driver-level `executemany` of a pre-compiled insert for positional drivers
+    - SQLAlchemy's insert with dictionaries for the other drivers
+
+    If `control.commit_size` is set the rows are committed periodically
+    and `on_commit` is called with the number of the last committed row.
+    Passing this number as `checkpoint` resumes an interrupted load.
+    """
+
+    def __init__(
+        self,
+        adapter: SqlAdapter,
+        *,
+        table_name: str,
+        with_metadata: bool = False,
+        checkpoint: Optional[int] = None,
+        on_commit: Optional[Callable[[int], None]] = None,
+    ):
+        self.adapter = adapter
+        self.control: SqlControl = adapter.control
+        self.table = adapter.metadata.tables[table_name]
+        self.with_metadata = with_metadata
+        self.checkpoint = checkpoint
+        self.on_commit = on_commit
+        self.__buffer: List[Tuple[Any, ...]] = []
+        self.__uncommitted = 0
+        self.__row_number: Optional[int] = None
+        self.__flush: Optional[Callable[[], None]] = None
+        self.__pragmas: List[Tuple[str, Any]] = []
+        self.__conn: Optional[Connection] = None
+        self.__transaction: Optional[RootTransaction] = None
+
+    def __enter__(self):
+        self.__conn = self.adapter.engine.connect()
+        if self.control.bulk_pragmas and self.__conn.dialect.name == "sqlite":
+            self.__pragmas = self.__set_pragmas(settings.BULK_PRAGMAS)
+        self.__transaction = self.__conn.begin()
+        return self
+
+    def __exit__(self, type, value, traceback):  # type: ignore
+        assert self.__conn and self.__transaction
+        try:
+            if type is None:
+                self.commit()
+            self.__transaction.rollback()
+            if self.__pragmas:
+                self.__set_pragmas(self.__pragmas)
+        finally:
+            self.__conn.close()
+
+    # Write
+
+    def write_row(self, row: Row) -> bool:
+        """Buffer a row and write the buffer if it's full
+
+        Parameters:
+            row (Row): row to write
+
+        Returns:
+            bool: False if the row is skipped being before the checkpoint
+        """
+        if self.checkpoint and row.row_number <= self.checkpoint:
+            return False
+        if not self.__flush:
+            self.__flush = self.__create_flush(row)
+        values = self.adapter.mapper.write_row_values(
+            row, with_metadata=self.with_metadata
+        )
+        self.__buffer.append(values)
+        self.__row_number = row.row_number
+        self.__uncommitted += 1
+        if len(self.__buffer) >= self.control.batch_size:
+            self.flush()
+        if self.control.commit_size and self.__uncommitted >= self.control.commit_size:
+            self.commit()
+        return True
+
+    def flush(self) -> None:
+        """Write the buffered rows"""
+        if self.__buffer and self.__flush:
+            self.__flush()
+            self.__buffer = []
+
+    def commit(self) -> None:
+        """Write the buffered rows and commit the transaction"""
+        assert self.__conn and self.__transaction
+        self.flush()
+        if self.__uncommitted:
+            self.__transaction.commit()
+            self.__transaction = self.__conn.begin()
+            self.__uncommitted = 0
+            if self.on_commit and self.__row_number is not None:
+                self.on_commit(self.__row_number)
+
+    # Internal
+
+    def __set_pragmas(self, pragmas: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+        # Pragmas like journal_mode can't be changed inside a transaction
+        assert self.__conn
+        previous: List[Tuple[str, Any]] = []
+        for name, value in pragmas:
+            previous.append(
+                (name, self.__conn.exec_driver_sql(f"PRAGMA {name}").scalar())
+            )
+            self.__conn.exec_driver_sql(f"PRAGMA {name}={value}")
+        self.__conn.commit()
+        return previous
+
+    def __create_flush(self, row: Row) -> Callable[[], None]:
+        assert self.__conn
+        sa = platform.sqlalchemy
+        dialect = self.__conn.dialect
+        names = list(row.field_names)
+        if self.with_metadata:
+            names = settings.METADATA_IDENTIFIERS + names
+        columns = [self.table.c[name] for name in names]
+
+        # PostgreSQL: COPY
+        if self.control.copy and dialect.name == "postgresql":
+            cursor = self.__conn.connection.dbapi_connection.cursor()  # type: ignore
+            if hasattr(cursor, "copy") or hasattr(cursor, "copy_expert"):
+                return self.__create_copy_flush(cursor, columns)
+
+        # Positional drivers: executemany
+        insert = sa.insert(self.table)
+        compiled = insert.compile(dialect=dialect, column_keys=names)
+        if compiled.positional and compiled.positiontup is not None:
+            sql = str(compiled)
+            order = [names.index(name) for name in compiled.positiontup]
+            processors = [
+                (index, column.type.dialect_impl(dialect).bind_processor(dialect))
+                for index, column in enumerate(columns)
+            ]
+            processors = [item for item in processors if item[1]]
+
+            def flush_executemany():
+                assert self.__conn
+                params: List[Tuple[Any, ...]] = []
+                for values in self.__buffer:
+                    values = list(values)
+                    for index, process in processors:
+                        if values[index] is not None:
+                            values[index] = process(values[index])  # type: ignore
+                    params.append(tuple(values[index] for index in order))
+                self.__conn.exec_driver_sql(sql, params)  # type: ignore
+
+            return flush_executemany
+
+        # Other drivers: SQLAlchemy
+        def flush_insert():
+            assert self.__conn
+            items = [dict(zip(names, values)) for values in self.__buffer]
+            self.__conn.execute(insert, items)
+
+        return flush_insert
+
+    def __create_copy_flush(self, cursor: Any, columns: List[Any]) -> Callable[[], None]:
+        sa = platform.sqlalchemy
+        preparer = self.adapter.engine.dialect.identifier_preparer
+        sql = "COPY %s (%s) FROM STDIN WITH (FORMAT csv)" % (
+            preparer.format_table(self.table),
+            ", ".join(preparer.quote(column.name) for column in columns),
+        )
+        as_json = [isinstance(column.type, sa.JSON) for column in columns]
+
+        def flush_copy():
+            lines: List[str] = []
+            for values in self.__buffer:
+                cells = [
+                    write_copy_cell(value, as_json=as_json[index])
+                    for index, value in enumerate(values)
+                ]
+                lines.append(",".join(cells) + "\n")
+            text = "".join(lines)
+            if hasattr(cursor, "copy"):
+                with cursor.copy(sql) as copy:
+                    copy.write(text)
+            else:
+                cursor.copy_expert(sql, io.StringIO(text))
+
+        return flush_copy
+
+
+# Internal
+
+
+def write_copy_cell(value: Any, *, as_json: bool = False) -> str:
+    """Write a value as a PostgreSQL CSV cell (an unquoted empty cell is NULL)"""
+    if value is None:
+        return ""
+    if as_json:
+        value = json.dumps(value)
+    elif isinstance(value, bool):
+        value = "true" if value else "false"
+    elif not isinstance(value, str):
+        value = str(value)
+    return '"%s"' % value.replace('"', '""')
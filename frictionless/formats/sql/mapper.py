@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type
 
 from ...platform import platform
 from ...schema import Field, Schema
@@ -318,27 +318,39 @@ class SqlMapper(Mapper):
 
     def write_row(self, row: Row, *, with_metadata: bool = False) -> Dict[str, Any]:
         """Convert frictionless Row to a sqlalchemy Item for insertion"""
-        sa = platform.sqlalchemy
         item = {}
         if with_metadata:
             item["_rowNumber"] = row.row_number
             item["_rowValid"] = row.valid
         for field in row.fields:
-            cell = row[field.name]
-            if cell is not None:
-                column_type = self.write_type(field.type)  # type: ignore
-                if field.type != "string" and column_type is sa.Text:
-                    cell, _ = field.write_cell(cell)
-                elif field.type in ["object", "geojson"]:
-                    cell = json.dumps(cell)
-                elif field.type == "datetime":
-                    if cell.tzinfo is not None:
-                        dt = cell.astimezone(timezone.utc)
-                        cell = dt.replace(tzinfo=None)
-                elif field.type == "time":
-                    if cell.tzinfo is not None:
-                        dt = datetime.combine(date.min, cell)
-                        dt = dt.astimezone(timezone.utc)
-                        cell = dt.time()
-            item[field.name] = cell
+            item[field.name] = self.write_cell(row[field.name], field=field)
         return item  # type: ignore
+
+    def write_row_values(
+        self, row: Row, *, with_metadata: bool = False
+    ) -> Tuple[Any, ...]:
+        """Convert frictionless Row to a tuple of values ordered as the table columns"""
+        values = [self.write_cell(row[field.name], field=field) for field in row.fields]
+        if with_metadata:
+            values = [row.row_number, row.valid] + values
+        return tuple(values)
+
+    def write_cell(self, cell: Any, *, field: Field) -> Any:
+        """Convert frictionless cell to a sqlalchemy value"""
+        sa = platform.sqlalchemy
+        if cell is not None:
+            column_type = self.write_type(field.type)  # type: ignore
+            if field.type != "string" and column_type is sa.Text:
+                cell, _ = field.write_cell(cell)
+            elif field.type in ["object", "geojson"]:
+                cell = json.dumps(cell)
+            elif field.type == "datetime":
+                if cell.tzinfo is not None:
+                    dt = cell.astimezone(timezone.utc)
+                    cell = dt.replace(tzinfo=None)
+            elif field.type == "time":
+                if cell.tzinfo is not None:
+                    dt = datetime.combine(date.min, cell)
+                    dt = dt.astimezone(timezone.utc)
+                    cell = dt.time()
+        return cell
@@ -6,6 +6,7 @@ BUFFER_SIZE = 1000
 ROW_NUMBER_IDENTIFIER = "_rowNumber"
 ROW_VALID_IDENTIFIER = "_rowValid"
 METADATA_IDENTIFIERS = [ROW_NUMBER_IDENTIFIER, ROW_VALID_IDENTIFIER]
+BULK_PRAGMAS = [("journal_mode", "MEMORY"), ("synchronous", "OFF")]
 
 # Prefixes
 
@@ -35,3 +35,34 @@ def test_ensure_dir(tmpdir):
 @pytest.mark.skipif(platform.type == "windows", reason="Fix on Windows")
 def test_is_safe_path(path, is_safe):
     assert helpers.is_safe_path(path) is is_safe
+
+
+def test_formula():
+    formula = helpers.Formula("salary == bonus * 5")
+    assert formula.evaluate({"salary": 1000, "bonus": 200}) is True
+    assert formula.evaluate({"salary": 1300, "bonus": 500}) is False
+
+
+def test_formula_evaluate_batch():
+    formula = helpers.Formula("a + b")
+    results = formula.evaluate_batch({"a": [1, 2], "b": [3, None]}, length=2)
+    assert results[0] == 4
+    assert isinstance(results[1], TypeError)
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["vars()", "import(os)", "x.__class__", "lambda: 1", "x = 1", "[a for a in b]"],
+)
+def test_formula_not_valid(source):
+    with pytest.raises(Exception):
+        helpers.Formula(source, compound=False)
+
+
+def test_sample_reservoir():
+    sample = helpers.sample_reservoir(iter(range(10000)), 100)
+    assert len(sample) == 100
+    assert sample == sorted(set(sample))
+    assert max(sample) > 5000
+    assert helpers.sample_reservoir(range(10000), 100) == sample
+    assert helpers.sample_reservoir(range(5), 100) == [0, 1, 2, 3, 4]
@@ -4,9 +4,12 @@ import ast
 import csv
 import datetime
 import glob
+import hashlib
 import io
 import json
+import math
 import os
+import random
 import re
 import shutil
 import tempfile
@@ -14,9 +17,22 @@ from collections.abc import Mapping
 from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from urllib.parse import parse_qs, urlparse
 
+import simpleeval  # type: ignore
+
 from ..vendors import stringcase
 
 # General
@@ -43,6 +59,29 @@ def pass_through(iterator: Iterator[Any]):
         pass
 
 
+def sample_reservoir(iterable: Iterable[Any], size: int, *, seed: int = 0) -> List[Any]:
+    """Sample items uniformly from an iterable of unknown length
+
+    It uses the "Algorithm L" reservoir sampling so random numbers are only
+    generated for the items getting into the reservoir. The order of
+    the sampled items is kept.
+    """
+    reservoir: List[Tuple[int, Any]] = []
+    if size <= 0:
+        return []
+    generator = random.Random(seed)
+    weight = math.exp(math.log(generator.random()) / size)
+    target = size + math.floor(math.log(generator.random()) / math.log(1 - weight))
+    for index, item in enumerate(iterable):
+        if index < size:
+            reservoir.append((index, item))
+        elif index == target:
+            reservoir[generator.randrange(size)] = (index, item)
+            weight *= math.exp(math.log(generator.random()) / size)
+            target += math.floor(math.log(generator.random()) / math.log(1 - weight)) + 1
+    return [item for _, item in sorted(reservoir, key=lambda pair: pair[0])]
+
+
 def safe_format(text: str, data: Dict[str, Any]):
     return text.format_map(SafeFormatDict(data))
 
@@ -325,6 +364,15 @@ def stringify_csv_string(cells: List[str], **options: Any):
     return result
 
 
+def create_hasher(algorithm: str) -> Any:
+    """Create a hash object for a `hashlib` or `xxhash` algorithm"""
+    from ..platform import platform
+
+    if algorithm.startswith("xxh"):
+        return getattr(platform.xxhash, algorithm)()
+    return hashlib.new(algorithm)
+
+
 def parse_resource_hash_v1(hash: str) -> Tuple[str, str]:
     parts = hash.split(":", maxsplit=1)
     if len(parts) == 1:
@@ -344,6 +392,100 @@ class Timer:
         return round((self.__stop - self.__start).total_seconds(), 3)
 
 
+class Formula:
+    """Formula evaluated with simpleeval
+
+    The formula is parsed and validated against the evaluator's whitelist
+    only once so evaluating it for a row only walks the pre-built AST.
+
+    Parameters:
+        source: Python expression
+        compound: allow compound types (lists, dicts, comprehensions etc)
+
+    Raises:
+        Exception: if the formula is not valid
+    """
+
+    def __init__(self, source: str, *, compound: bool = True):
+        Evaluator = (
+            simpleeval.EvalWithCompoundTypes if compound else simpleeval.SimpleEval
+        )
+        self.source = source
+        self.__evaluator = Evaluator()  # type: ignore
+        self.__node = self.__evaluator.parse(source)  # type: ignore
+        self.__validate(self.__node)
+
+    def evaluate(self, names: Any) -> Any:
+        """Evaluate the formula
+
+        Parameters:
+            names: mapping of names e.g. a row
+
+        Returns:
+            any: result
+        """
+        self.__evaluator.names = names
+        return self.__evaluator.eval(self.source, previously_parsed=self.__node)  # type: ignore
+
+    def evaluate_batch(self, columns: Dict[str, List[Any]], *, length: int) -> List[Any]:
+        """Evaluate the formula for every row of a column batch
+
+        Parameters:
+            columns: mapping of names to columns
+            length: number of rows
+
+        Returns:
+            any[]: results (an exception instance if an evaluation failed)
+        """
+        results: List[Any] = []
+        names = FormulaColumnNames(columns)
+        for index in range(length):
+            names.index = index
+            try:
+                results.append(self.evaluate(names))
+            except Exception as exception:
+                results.append(exception)
+        return results
+
+    def __validate(self, node: ast.AST):
+        evaluator: Any = self.__evaluator
+        if not isinstance(node, ast.Expr):
+            raise simpleeval.FeatureNotAvailable("only expressions are supported")
+        for item in ast.walk(node):
+            if isinstance(item, ast.expr) and type(item) not in evaluator.nodes:
+                name = type(item).__name__
+                raise simpleeval.FeatureNotAvailable(f"{name} is not supported")
+            if isinstance(item, (ast.BinOp, ast.UnaryOp)):
+                if type(item.op) not in evaluator.operators:
+                    name = type(item.op).__name__
+                    raise simpleeval.OperatorNotDefined(name, self.source)
+            if isinstance(item, ast.Compare):
+                for op in item.ops:
+                    if type(op) not in evaluator.operators:
+                        name = type(op).__name__
+                        raise simpleeval.OperatorNotDefined(name, self.source)
+            if isinstance(item, ast.Attribute):
+                if item.attr.startswith(tuple(simpleeval.DISALLOW_PREFIXES)):
+                    raise simpleeval.FeatureNotAvailable(f'"{item.attr}" is not allowed')
+            if isinstance(item, ast.Call) and isinstance(item.func, ast.Name):
+                if item.func.id not in evaluator.functions:
+                    raise simpleeval.FunctionNotDefined(item.func.id, self.source)
+
+
+class FormulaColumnNames:
+    """Names of a row in a column batch (without creating a row)"""
+
+    def __init__(self, columns: Dict[str, List[Any]]):
+        self.columns = columns
+        self.index = 0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name][self.index]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+
 def slugify(text: str, **options: Any):
     """There is a conflict between python-slugify and awesome-slugify
     So we import from a proper module manually
@@ -94,3 +94,16 @@ def test_resource_index_sqlite_on_progress(database_url, mocker):
     assert on_progress.call_count == 2
     on_progress.assert_any_call(control.table, "2 rows")
     on_progress.assert_any_call(control.table, "3 rows")
+
+
+# Fast (non-CSV)
+
+
+def test_resource_index_sqlite_fast_not_csv(sqlite_url):
+    assert control.table
+    resource = TableResource(path="data/table.json")
+    resource.index(sqlite_url, name=control.table, fast=True)
+    assert TableResource(path=sqlite_url, control=control).read_rows() == [
+        {"id": 1, "name": "english"},
+        {"id": 2, "name": "中国人"},
+    ]
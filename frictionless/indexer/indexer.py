@@ -35,12 +35,15 @@ class Indexer:
 
     def __attrs_post_init__(self):
         sa = platform.sqlalchemy
-        if self.resource.format != "csv":
-            self.fast = False
+        formats = platform.frictionless_formats
         engine = self.database
         if isinstance(engine, str):
             engine = sa.create_engine(engine)
-        self.adapter = platform.frictionless_formats.SqlAdapter(engine)
+        # Non-CSV data is indexed row by row using the database's bulk load
+        control = formats.SqlControl(copy=self.fast, bulk_pragmas=self.fast)
+        if self.resource.format != "csv":
+            self.fast = False
+        self.adapter = formats.SqlAdapter(engine, control=control)
 
     # Index
 
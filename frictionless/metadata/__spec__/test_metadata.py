@@ -15,6 +15,24 @@ def test_metadata_from_path():
     assert descriptor["primaryKey"] == "id"
 
 
+def test_metadata_to_descriptor_is_copy():
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "x-meta": {"k": [1]}, "constraints": {"enum": [1]}}
+            ],
+            "x-meta": {"k": [1]},
+        }
+    )
+    descriptor = schema.to_descriptor()
+    descriptor["fields"][0]["x-meta"]["k"].append(2)
+    descriptor["fields"][0]["constraints"]["enum"].append(2)
+    descriptor["x-meta"]["k"].append(2)
+    assert schema.fields[0].custom == {"x-meta": {"k": [1]}}
+    assert schema.fields[0].constraints == {"enum": [1]}
+    assert schema.custom == {"x-meta": {"k": [1]}}
+
+
 # Data package version inference from `$schema` prop
 
 # @pytest.mark.parametrize(
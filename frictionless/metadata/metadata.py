@@ -720,7 +720,8 @@ class Metadata:
                     value = value.to_descriptor_source()  # type: ignore
                     if not value:
                         continue
-            if isinstance(value, (list, dict)):
+            # Exported descriptors are already copies (see `custom` below)
+            elif isinstance(value, (list, dict)):
                 value = deepcopy(value)  # type: ignore
             descriptor[name] = value
 
@@ -728,5 +729,5 @@ class Metadata:
         if self._schema_profile is not None:
             descriptor["$schema"] = self._schema_profile
 
-        descriptor.update(self.custom)  # type: ignore
+        descriptor.update(deepcopy(self.custom))  # type: ignore
         return descriptor  # type: ignore
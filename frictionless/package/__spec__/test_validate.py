@@ -13,7 +13,9 @@ from frictionless import (
     Schema,
     fields,
     platform,
+    system,
 )
+from frictionless.resources import table
 
 # General
 
@@ -619,6 +621,106 @@ def test_package_validate_schema_multiple_foreign_key_violations():
     ]
 
 
+def create_shared_reference_package(tmpdir, **options):
+    tmpdir.join("countries.csv").write("code,name\nfr,France\nit,Italy\n")
+    tmpdir.join("cities.csv").write("name,country\nparis,fr\nrome,it\nrio,br\n")
+    tmpdir.join("capitals.csv").write("name,country\nparis,fr\nbrasilia,br\n")
+    schema = {
+        "fields": [
+            {"name": "name", "type": "string"},
+            {"name": "country", "type": "string"},
+        ],
+        "foreignKeys": [
+            {
+                "fields": "country",
+                "reference": {"resource": "countries", "fields": "code"},
+            }
+        ],
+    }
+    descriptor = {
+        "resources": [
+            {"name": "countries", "path": "countries.csv"},
+            {"name": "cities", "path": "cities.csv", "schema": schema},
+            {"name": "capitals", "path": "capitals.csv", "schema": deepcopy(schema)},
+        ]
+    }
+    return Package(descriptor, basepath=str(tmpdir), **options)
+
+
+@pytest.mark.parametrize("type", ["memory", "compact", "disk"])
+def test_package_validate_schema_foreign_key_shared_reference(tmpdir, type):
+    detector = Detector(integrity_index=type, integrity_memory=0)
+    package = create_shared_reference_package(tmpdir, detector=detector)
+    with system.use_context(trusted=True):
+        report = package.validate()
+    assert report.flatten(["taskNumber", "rowNumber", "type"]) == [
+        [2, 4, "foreign-key"],
+        [3, 3, "foreign-key"],
+    ]
+    assert len(package.reference_cache) == 0
+
+
+def test_package_validate_schema_foreign_key_shared_reference_once(tmpdir, monkeypatch):
+    indexes = []
+    create_integrity_index = table.create_integrity_index
+
+    def create_counted_index(*args, **kwargs):
+        indexes.append(create_integrity_index(*args, **kwargs))
+        return indexes[-1]
+
+    monkeypatch.setattr(table, "create_integrity_index", create_counted_index)
+    package = create_shared_reference_package(tmpdir)
+    with system.use_context(trusted=True):
+        assert not package.validate().valid
+        assert len(indexes) == 1
+        assert not package.validate().valid
+        assert len(indexes) == 2
+    assert len(package.reference_cache) == 0
+
+
+def test_package_validate_schema_foreign_key_shared_reference_outdated(
+    tmpdir, monkeypatch
+):
+    indexes = []
+    create_integrity_index = table.create_integrity_index
+
+    def create_counted_index(*args, **kwargs):
+        indexes.append(create_integrity_index(*args, **kwargs))
+        return indexes[-1]
+
+    monkeypatch.setattr(table, "create_integrity_index", create_counted_index)
+    package = create_shared_reference_package(tmpdir)
+    with system.use_context(trusted=True):
+        with package.get_table_resource("cities"):
+            pass
+        with package.get_table_resource("capitals"):
+            pass
+        assert len(indexes) == 1
+        tmpdir.join("countries.csv").write("code,name\nfr,France\nit,Italy\nbr,Brazil\n")
+        with package.get_table_resource("capitals") as resource:
+            assert not any(row.errors for row in resource.row_stream)
+        assert len(indexes) == 2
+    assert len(package.reference_cache) == 1
+
+
+def test_package_validate_schema_foreign_key_shared_reference_kept(tmpdir):
+    package = create_shared_reference_package(tmpdir)
+    with system.use_context(trusted=True):
+        with package.get_table_resource("cities"):
+            pass
+        assert len(package.reference_cache) == 1
+        assert not package.validate().valid
+    assert len(package.reference_cache) == 1
+
+
+def test_package_validate_schema_foreign_key_shared_reference_batch(tmpdir):
+    package = create_shared_reference_package(tmpdir)
+    resource = package.get_table_resource("cities")
+    with system.use_context(trusted=True):
+        report = resource.validate(batch=True)
+    assert report.flatten(["rowNumber", "type"]) == [[4, "foreign-key"]]
+
+
 # Bugs
 
 
@@ -644,9 +746,6 @@ def test_package_validate_using_detector_schema_sync_issue_847():
 
 # Parallel
 
-# Note: to test parallel validation, do not use foreign keys to prevent an
-# automatic fallback on single-core execution
-
 
 @pytest.mark.ci
 def test_package_validate_parallel_from_dict():
@@ -679,6 +778,54 @@ def test_package_validate_with_parallel():
     ]
 
 
+@pytest.mark.ci
+def test_package_validate_parallel_with_foreign_keys():
+    descriptor = deepcopy(DESCRIPTOR_FK)
+    del descriptor["resources"][1]["data"][4]
+    package = Package(descriptor)
+    report = package.validate(parallel=True)
+    spec = ["taskNumber", "rowNumber", "fieldNumber", "type", "note"]
+    assert report.flatten(spec) == package.validate().flatten(spec)
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [5, None, "foreign-key"],
+    ]
+
+
+@pytest.mark.ci
+def test_package_validate_parallel_with_foreign_keys_shared_reference(tmpdir):
+    package = create_shared_reference_package(tmpdir)
+    with system.use_context(trusted=True):
+        report = package.validate(parallel=True)
+    assert report.flatten(["taskNumber", "rowNumber", "type", "note"]) == [
+        [
+            2,
+            4,
+            "foreign-key",
+            'for "country": values "br" not found in the lookup table "countries" as "code"',
+        ],
+        [
+            3,
+            3,
+            "foreign-key",
+            'for "country": values "br" not found in the lookup table "countries" as "code"',
+        ],
+    ]
+    assert len(package.reference_cache) == 0
+
+
+@pytest.mark.ci
+def test_package_validate_parallel_with_foreign_keys_missing_resource():
+    descriptor = deepcopy(DESCRIPTOR_FK)
+    descriptor["resources"][0]["schema"]["foreignKeys"][0]["reference"]["resource"] = (
+        "bad"
+    )
+    package = Package(descriptor)
+    report = package.validate(parallel=True)
+    spec = ["taskNumber", "rowNumber", "fieldNumber", "type", "note"]
+    assert report.flatten(spec) == package.validate().flatten(spec)
+    assert not report.valid
+
+
 # Missing values version gate — inheritance through the package
 #
 # A package `$schema` imposes its version on its resources/schemas/fields
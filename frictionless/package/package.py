@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import tempfile
 from multiprocessing import Pool
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Union
 
@@ -14,6 +16,8 @@ from ..platform import platform
 from ..report import Report
 from ..resource import Resource
 from ..system import system
+from ..table.index import CompactIndex, MappedIndex
+from ..table.lookup import ReferenceCache, copy_reference_source, read_reference_index
 from ..transformer import Transformer
 from .factory import Factory
 
@@ -169,6 +173,7 @@ class Package(Metadata, metaclass=Factory):
     """
 
     def __attrs_post_init__(self):
+        self.__reference_cache = ReferenceCache()
         for resource in self.resources:
             resource.package = self
             if self._dialect:
@@ -177,6 +182,15 @@ class Package(Metadata, metaclass=Factory):
                 resource.detector = self._detector
         super().__attrs_post_init__()
 
+    @property
+    def reference_cache(self) -> ReferenceCache:
+        """
+        Cache of the indexes of the resources referenced by foreign keys.
+        An index is built only once for all the package's resources
+        and it's rebuilt if the referenced resource changes.
+        """
+        return self.__reference_cache
+
     @property
     def basepath(self) -> Optional[str]:
         """
@@ -476,6 +490,7 @@ class Package(Metadata, metaclass=Factory):
         *,
         name: Optional[str] = None,
         parallel: bool = False,
+        aggregate: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     ):
@@ -483,8 +498,9 @@ class Package(Metadata, metaclass=Factory):
 
         Parameters:
             checklist? (checklist): a Checklist object
-            parallel? (bool): run in parallel if possible. Parallel execution
-            is not possible if foreign keys are used in a resource schema.
+            parallel? (bool): run in parallel. If foreign keys are used
+            the referenced keys are indexed first and shared with the workers.
+            aggregate? (bool): count all the errors (see `ReportTask.summary`)
 
         Returns:
             Report: validation report
@@ -508,27 +524,50 @@ class Package(Metadata, metaclass=Factory):
             return Report.from_validation(time=timer.time, errors=exception.to_errors())
 
         # Validate sequential
-        if not parallel or with_foreign_keys:
-            for resource in resources:
-                report = resource.validate(
-                    checklist=checklist,
-                    limit_errors=limit_errors,
-                    limit_rows=limit_rows,
-                )
-                reports.append(report)
+        # The reference indexes built by the validation are released at the end
+        if not parallel:
+            cached = set(self.reference_cache)
+            try:
+                for resource in resources:
+                    report = resource.validate(
+                        checklist=checklist,
+                        aggregate=aggregate,
+                        limit_errors=limit_errors,
+                        limit_rows=limit_rows,
+                    )
+                    reports.append(report)
+            finally:
+                for name, key in self.reference_cache:
+                    if (name, key) not in cached:
+                        self.reference_cache.remove(name, key)
 
         # Validate parallel
         else:
-            with Pool() as pool:
+            with Pool() as pool, tempfile.TemporaryDirectory() as directory:
                 options_pool: List[Dict[str, Any]] = []
+                references = None
+                if with_foreign_keys:
+                    package_options: Dict[str, Any] = {}
+                    package_options["descriptor"] = self.to_descriptor()
+                    package_options["basepath"] = self.basepath
+                    references = self.__index_references(
+                        resources, package_options, pool=pool, directory=directory
+                    )
                 for resource in resources:
                     options: Any = {}
-                    options["resource"] = {}
-                    options["resource"]["descriptor"] = resource.to_descriptor()
-                    options["resource"]["basepath"] = resource.basepath
+                    if references is None:
+                        options["resource"] = {}
+                        options["resource"]["descriptor"] = resource.to_descriptor()
+                        options["resource"]["basepath"] = resource.basepath
+                    else:
+                        # Foreign keys require the resource's siblings
+                        options["package"] = package_options  # type: ignore
+                        options["resource"] = {"name": resource.name}
+                        options["references"] = references
                     options["validate"] = {}
                     options["validate"]["limit_rows"] = limit_rows
                     options["validate"]["limit_errors"] = limit_errors
+                    options["validate"]["aggregate"] = aggregate
                     options_pool.append(options)
                 report_descriptors = pool.map(_validate_parallel, options_pool)
                 for report_descriptor in report_descriptors:
@@ -540,6 +579,41 @@ class Package(Metadata, metaclass=Factory):
             reports=reports,
         )
 
+    def __index_references(
+        self,
+        resources: List[Resource],
+        package_options: Dict[str, Any],
+        *,
+        pool: Any,
+        directory: str,
+    ) -> List[Dict[str, Any]]:
+        # Every referenced key is indexed once before the validation starts.
+        # The indexes are saved as files and memory-mapped read-only by the workers
+        options_pool: List[Dict[str, Any]] = []
+        for resource in resources:
+            for fk in resource.schema.foreign_keys if resource.schema else []:  # type: ignore
+                name = fk["reference"]["resource"] or resource.name
+                fields = list(fk["reference"]["fields"])
+                if not self.has_resource(name):
+                    continue
+                if any(o["name"] == name and o["fields"] == fields for o in options_pool):
+                    continue
+                options: Any = {}
+                options["package"] = package_options
+                options["name"] = name
+                options["fields"] = fields
+                options["path"] = os.path.join(directory, f"{len(options_pool)}.index")
+                options_pool.append(options)
+        references: List[Dict[str, Any]] = []
+        results = pool.map(_index_parallel, options_pool)
+        for options, indexed in zip(options_pool, results):
+            # Failed indexes are built by the workers themselves to report the errors
+            if indexed:
+                references.append(
+                    {key: options[key] for key in ["name", "fields", "path"]}
+                )
+        return references
+
     # Convert
 
     def to_copy(self, **options: Any) -> Self:
@@ -764,9 +838,32 @@ class Package(Metadata, metaclass=Factory):
         return descriptor
 
 
+def _index_parallel(options: types.IDescriptor) -> bool:
+    package = Package.from_descriptor(**options["package"])
+    key = tuple(options["fields"])
+    index = CompactIndex()
+    try:
+        source = copy_reference_source(package.get_resource(options["name"]))
+        read_reference_index(source, key, index)  # type: ignore
+    except FrictionlessException:
+        return False
+    index.save(options["path"])
+    return True
+
+
 def _validate_parallel(options: types.IDescriptor) -> types.IDescriptor:
     resource_options = options["resource"]
     validate_options = options["validate"]
-    resource = Resource.from_descriptor(**resource_options)
-    report = resource.validate(**validate_options)
+    if "package" in options:
+        package = Package.from_descriptor(**options["package"])
+        for reference in options["references"]:
+            key = tuple(reference["fields"])
+            index = MappedIndex(reference["path"])
+            package.reference_cache.set(reference["name"], key, index, fingerprint=None)
+        resource = package.get_resource(resource_options["name"])
+        report = resource.validate(**validate_options)
+        package.reference_cache.clear()
+    else:
+        resource = Resource.from_descriptor(**resource_options)
+        report = resource.validate(**validate_options)
     return report.to_descriptor()
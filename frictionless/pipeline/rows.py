@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from .. import settings
+from ..platform import platform
+from ..table import ExternalSorter
+from .types import IRows
+
+# NOTE:
+# These helpers implement the row-wise steps over plain lists of cells
+# (the first list is the header) for the fused pipeline execution.
+# They follow the semantics of the PETL functions used by the steps'
+# `transform_resource` so both ways produce the same data
+
+
+def convert_rows(
+    rows: IRows,
+    field_name: Optional[str],
+    converter: Callable[..., Any],
+    *,
+    pass_row: bool = False,
+) -> Iterator[Sequence[Any]]:
+    """Convert cells of a field or of all the fields (if field_name is None)
+
+    As in PETL, a converter raising an exception sets the cell to None.
+    If `pass_row` is set the row is passed to the converter as a record.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    names = read_names(header)
+    indexes = (
+        range(len(header)) if field_name is None else [find_index(names, field_name)]
+    )
+    yield header
+
+    # Convert
+    def convert(cell: Any, *args: Any) -> Any:
+        try:
+            return converter(cell, *args)
+        except Exception:
+            return None
+
+    # Emit
+    for cells in rows:
+        result = list(cells)
+        args = (create_record(cells, names),) if pass_row else ()
+        for index in indexes:
+            if index < len(result):
+                result[index] = convert(result[index], *args)
+        yield result
+
+
+def cut_rows(
+    rows: IRows, select: Callable[[List[str]], List[int]]
+) -> Iterator[Sequence[Any]]:
+    """Cut rows to the fields at `select(names)` indexes (short rows are filled)"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    indexes = select(read_names(header))
+    yield [header[index] for index in indexes]
+    for cells in rows:
+        size = len(cells)
+        yield [cells[index] if index < size else None for index in indexes]
+
+
+def add_field_rows(
+    rows: IRows, name: str, value: Any, *, index: Optional[int] = None
+) -> Iterator[Sequence[Any]]:
+    """Add a field with a value (a callable value gets the row as a record)"""
+    rows = iter(rows)
+    header = next(rows, [])
+    names = read_names(header)
+    index = len(header) if index is None else index
+    result = list(header)
+    result.insert(index, name)
+    yield result
+    for cells in rows:
+        result = list(cells)
+        cell = value(create_record(cells, names)) if callable(value) else value
+        result.insert(index, cell)
+        yield result
+
+
+def rename_rows(rows: IRows, mapping: Dict[str, str]) -> Iterator[Sequence[Any]]:
+    """Rename the fields in the header"""
+    rows = iter(rows)
+    header = next(rows, [])
+    yield [mapping.get(name, name) for name in read_names(header)]
+    yield from rows
+
+
+def filter_rows(rows: IRows, function: Callable[[Any], Any]) -> Iterator[Sequence[Any]]:
+    """Filter rows passed to the function as records"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    names = read_names(header)
+    yield header
+    for cells in rows:
+        if function(create_record(cells, names)):
+            yield cells
+
+
+def slice_rows(
+    rows: IRows, *args: Optional[int], tail: Optional[int] = None
+) -> Iterator[Sequence[Any]]:
+    """Slice rows as `itertools.islice` or take the last rows (if tail is set)"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    yield header
+    if tail is not None:
+        yield from deque(rows, maxlen=tail)
+        return
+    yield from islice(rows, *args)
+
+
+def create_mapping_converter(mapping: Dict[Any, Any]) -> Callable[[Any], Any]:
+    """Create a converter translating cells with a mapping"""
+
+    def converter(cell: Any) -> Any:
+        try:
+            return mapping.get(cell, cell)
+        except TypeError:
+            return cell
+
+    return converter
+
+
+def create_record(cells: Sequence[Any], names: List[str]) -> Any:
+    """Create a PETL record (a tuple with access by field name)"""
+    return platform.petl.Record(cells, names)
+
+
+def sort_rows(
+    rows: IRows,
+    field_names: Optional[List[str]] = None,
+    *,
+    reverse: bool = False,
+    memory: Optional[int] = None,
+    parallel: bool = False,
+) -> Iterator[Sequence[Any]]:
+    """Sort rows by the fields (or by all the fields) with an external merge sort"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    names = read_names(header)
+    indexes = list(range(len(header)))
+    if field_names is not None:
+        indexes = [find_index(names, name) for name in field_names]
+    sorter = ExternalSorter(
+        indexes,
+        reverse=reverse,
+        memory=memory or settings.DEFAULT_LIMIT_MEMORY,
+        parallel=parallel,
+    )
+    yield header
+    yield from sorter.sort(rows)
+
+
+def find_index(names: List[str], name: str) -> int:
+    """Find the index of a field (raising the PETL error if it's not found)"""
+    try:
+        return names.index(name)
+    except ValueError:
+        raise platform.petl.errors.FieldSelectionError(name)
+
+
+def create_view(function: Callable[..., IRows], *args: Any, **options: Any) -> Any:
+    """Create a PETL table iterating the rows returned by a function"""
+
+    class RowsView(platform.petl.Table):  # type: ignore
+        def __iter__(self):  # type: ignore
+            return iter(function(*args, **options))
+
+    return RowsView()
+
+
+# Internal
+
+
+def read_names(header: Sequence[Any]) -> List[str]:
+    return [str(label) for label in header]
@@ -8,6 +8,7 @@ import attrs
 from .. import errors, settings, types
 from ..metadata import Metadata
 from ..system import system
+from .types import IRowsProcessor
 
 if TYPE_CHECKING:
     from ..package import Package
@@ -23,7 +24,6 @@ if TYPE_CHECKING:
 # We might consider adding `process_schema/row` etc to the Step class
 
 
-# TODO: support something like "step.transform_resource_row"
 @attrs.define(kw_only=True, repr=False)
 class Step(Metadata):
     """Step representation.
@@ -69,6 +69,24 @@ class Step(Metadata):
         """
         pass
 
+    def transform_rows(self, resource: Resource) -> Optional[IRowsProcessor]:
+        """Transform resource's rows (fused execution)
+
+        A row-wise step can implement this method to be run by the transformer
+        in one pass with the neighbouring row-wise steps instead of re-reading
+        the data after every step. It updates the resource's metadata as
+        `transform_resource` does and returns a function mapping the rows
+        (lists of cells starting from the header) to the transformed rows.
+        If it returns None (by default) `transform_resource` is used.
+
+        Parameters:
+            resource (Resource): resource
+
+        Returns:
+            callable?: rows processor
+        """
+        return None
+
     def transform_package(self, package: Package):
         """Transform package
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Callable, Iterable, List, Sequence
 
 from typing_extensions import Required, TypedDict
 
@@ -18,3 +18,7 @@ class IStep(TypedDict, total=False):
     type: Required[str]
     title: str
     description: str
+
+
+IRows = Iterable[Sequence[Any]]
+IRowsProcessor = Callable[[IRows], IRows]
@@ -86,6 +86,12 @@ class Platform:
 
         return frictionless.formats
 
+    @cached_property
+    def frictionless_formats_csv_chunks(self):
+        import frictionless.formats.csv.chunks
+
+        return frictionless.formats.csv.chunks
+
     @cached_property
     def frictionless_portals(self):
         import frictionless.portals
@@ -339,6 +345,20 @@ class Platform:
 
         return numpy
 
+    @cached_property
+    @extras(name="parquet")
+    def pyarrow(self):
+        import pyarrow  # type: ignore
+
+        return pyarrow
+
+    @cached_property
+    @extras(name="parquet")
+    def pyarrow_dataset(self):
+        import pyarrow.dataset  # type: ignore
+
+        return pyarrow.dataset
+
     @cached_property
     @extras(name="parquet")
     def pyarrow_parquet(self):
@@ -416,5 +436,12 @@ class Platform:
 
         return frictionless.vendors.wkt
 
+    @cached_property
+    @extras(name="xxhash")
+    def xxhash(self):
+        import xxhash  # type: ignore
+
+        return xxhash
+
 
 platform = Platform()
@@ -0,0 +1,52 @@
+from frictionless import errors
+from frictionless.report.summary import ErrorSummary, RowHistogram
+
+# General
+
+
+def test_error_summary():
+    summary = ErrorSummary(sample_size=2)
+    for row_number in range(2, 102):
+        summary.add(
+            errors.TypeError(
+                note="note",
+                cells=["a"],
+                row_number=row_number,
+                cell="a",
+                field_name="id",
+                field_number=1,
+            )
+        )
+    summary.add(errors.BlankRowError(note="", cells=[""], row_number=200))
+    descriptor = summary.to_descriptor()
+    assert descriptor["errors"] == 101
+    assert summary.count_types() == {"type-error": 100, "blank-row": 1}
+    bucket, blank_bucket = descriptor["buckets"]
+    assert bucket["type"] == "type-error"
+    assert bucket["fieldName"] == "id"
+    assert bucket["count"] == 100
+    assert [error["rowNumber"] for error in bucket["firstErrors"]] == [2, 3]
+    assert len(bucket["sampleErrors"]) == 2
+    assert sum(bucket["rowHistogram"]["counts"]) == 100
+    assert "fieldName" not in blank_bucket
+    assert blank_bucket["count"] == 1
+
+
+def test_error_summary_sample_is_random():
+    summary = ErrorSummary(sample_size=5, seed=1)
+    for row_number in range(2, 10002):
+        summary.add(errors.BlankRowError(note="", cells=[""], row_number=row_number))
+    bucket = summary.to_descriptor()["buckets"][0]
+    row_numbers = [error["rowNumber"] for error in bucket["sampleErrors"]]
+    assert len(row_numbers) == 5
+    assert max(row_numbers) > 100
+
+
+def test_row_histogram():
+    histogram = RowHistogram(bins=4)
+    for row_number in [1, 2, 3]:
+        histogram.add(row_number)
+    assert histogram.to_descriptor() == {"binSize": 1, "counts": [0, 1, 1, 1]}
+    histogram.add(9)
+    assert histogram.to_descriptor() == {"binSize": 4, "counts": [3, 0, 1]}
+    assert histogram.count == 4
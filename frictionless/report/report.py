@@ -149,6 +149,7 @@ class Report(Metadata):
         labels: List[str] = [],
         errors: List[Error] = [],
         warnings: List[str] = [],
+        summary: Optional[types.IReportTaskSummary] = None,
     ):
         """Create a report from a validation task"""
         errors = errors.copy()
@@ -187,6 +188,7 @@ class Report(Metadata):
                     stats=task_stats,
                     errors=errors,
                     warnings=warnings,
+                    summary=summary,
                 )
             ],
         )
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .. import settings
+from . import types
+
+if TYPE_CHECKING:
+    from ..error import Error
+
+
+class ErrorSummary:
+    """Bounded summary of validation errors
+
+    > Constructor of this object is not Public API
+
+    Errors are counted by buckets of error type and field name. A bucket
+    keeps the first errors, a reservoir sample of all its errors, and
+    a histogram of the errors' row numbers. The memory used depends only
+    on the number of buckets so the whole data can be validated.
+
+    Parameters:
+        sample_size (int): number of first/sample errors kept per bucket
+        bins (int): maximum number of row histogram bins per bucket
+        seed (int): seed of the random sampling
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_size: int = settings.DEFAULT_SUMMARY_SAMPLE_SIZE,
+        bins: int = settings.DEFAULT_SUMMARY_BINS,
+        seed: int = 0,
+    ):
+        self.sample_size = sample_size
+        self.bins = bins
+        self.count = 0
+        self.__random = random.Random(seed)
+        self.__buckets: Dict[Tuple[str, Optional[str]], ErrorBucket] = {}
+
+    def add(self, error: Error) -> None:
+        """Count an error
+
+        Parameters:
+            error (Error): error
+        """
+        key = (error.type, getattr(error, "field_name", None) or None)
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            bucket = ErrorBucket(self, type=key[0], field_name=key[1])
+            self.__buckets[key] = bucket
+        bucket.add(error, random=self.__random)
+        self.count += 1
+
+    def count_types(self) -> Dict[str, int]:
+        """Count errors by type
+
+        Returns:
+            dict: error counts
+        """
+        counts: Dict[str, int] = {}
+        for bucket in self.__buckets.values():
+            counts[bucket.type] = counts.get(bucket.type, 0) + bucket.count
+        return counts
+
+    def to_descriptor(self) -> types.IReportTaskSummary:
+        """Export the summary
+
+        Returns:
+            dict: summary descriptor
+        """
+        return types.IReportTaskSummary(
+            errors=self.count,
+            buckets=[bucket.to_descriptor() for bucket in self.__buckets.values()],
+        )
+
+
+class ErrorBucket:
+    """Errors of one type and field (see `ErrorSummary`)
+
+    > Constructor of this object is not Public API
+    """
+
+    def __init__(self, summary: ErrorSummary, *, type: str, field_name: Optional[str]):
+        self.summary = summary
+        self.type = type
+        self.field_name = field_name
+        self.count = 0
+        self.first_errors: List[Error] = []
+        self.sample_errors: List[Error] = []
+        self.histogram = RowHistogram(bins=summary.bins)
+
+    def add(self, error: Error, *, random: random.Random) -> None:
+        size = self.summary.sample_size
+        self.count += 1
+        if len(self.first_errors) < size:
+            self.first_errors.append(error)
+
+        # Reservoir sampling (algorithm R)
+        if len(self.sample_errors) < size:
+            self.sample_errors.append(error)
+        else:
+            index = random.randrange(self.count)
+            if index < size:
+                self.sample_errors[index] = error
+
+        # Histogram
+        row_number = getattr(error, "row_number", None)
+        if row_number is not None:
+            self.histogram.add(row_number)
+
+    def to_descriptor(self) -> types.IReportTaskSummaryBucket:
+        descriptor = types.IReportTaskSummaryBucket(type=self.type, count=self.count)
+        if self.field_name is not None:
+            descriptor["fieldName"] = self.field_name
+        descriptor["firstErrors"] = [error.to_descriptor() for error in self.first_errors]
+        descriptor["sampleErrors"] = [
+            error.to_descriptor() for error in self.sample_errors
+        ]
+        if self.histogram.count:
+            descriptor["rowHistogram"] = self.histogram.to_descriptor()
+        return descriptor
+
+
+class RowHistogram:
+    """Histogram of row numbers with a bounded number of bins
+
+    > Constructor of this object is not Public API
+
+    The bin `i` counts the row numbers from `i * bin_size` to
+    `(i + 1) * bin_size - 1`. The bin size starts at one and it's doubled
+    (merging pairs of bins) every time a row number doesn't fit the bins.
+    """
+
+    def __init__(self, *, bins: int):
+        self.bins = max(bins // 2 * 2, 2)
+        self.bin_size = 1
+        self.count = 0
+        self.counts: List[int] = [0] * self.bins
+
+    def add(self, row_number: int) -> None:
+        index = row_number // self.bin_size
+        while index >= self.bins:
+            pairs = zip(self.counts[::2], self.counts[1::2])
+            merged = [left + right for left, right in pairs]
+            self.counts = merged + [0] * (self.bins - len(merged))
+            self.bin_size *= 2
+            index = row_number // self.bin_size
+        self.counts[index] += 1
+        self.count += 1
+
+    def to_descriptor(self) -> types.IReportTaskSummaryHistogram:
+        counts = list(self.counts)
+        while counts and not counts[-1]:
+            counts.pop()
+        return types.IReportTaskSummaryHistogram(binSize=self.bin_size, counts=counts)
@@ -11,6 +11,7 @@ from ..error import Error
 from ..errors import ReportTaskError
 from ..exception import FrictionlessException
 from ..metadata import Metadata
+from ..system import system
 from . import types
 
 
@@ -70,6 +71,13 @@ class ReportTask(Metadata):
     List of errors raised while validating the data.
     """
 
+    summary: Optional[types.IReportTaskSummary] = None
+    """
+    Counts of all the errors by error type and field name with error
+    samples and row histograms (see the `aggregate` validation option).
+    Unlike `errors`, it's not truncated by `limit_errors`.
+    """
+
     @property
     def error(self):
         """Validation error if there is only one"""
@@ -115,6 +123,13 @@ class ReportTask(Metadata):
             if error_title not in error_list:
                 error_list[error_title] = 0
             error_list[error_title] += 1
+        if self.summary:
+            error_list = {}
+            for bucket in self.summary["buckets"]:
+                Class = system.select_error_class(bucket["type"])
+                error_title = f"{Class.title}"
+                error_list.setdefault(error_title, 0)
+                error_list[error_title] += bucket["count"]
         size = self.stats.get("bytes")
         content = [
             ["File Place", self.place],
@@ -157,6 +172,7 @@ class ReportTask(Metadata):
             "stats": {"type": "object"},
             "warnings": {"type": "array", "arrayItem": {"type": "string"}},
             "errors": {"type": "array", "arrayItem": {"type": "object"}},
+            "summary": {"type": "object"},
         },
     }
 
@@ -43,3 +43,22 @@ class IReportTaskStats(TypedDict, total=False):
     warnings: Required[int]
     errors: Required[int]
     seconds: Required[float]
+
+
+class IReportTaskSummary(TypedDict, total=False):
+    errors: Required[int]
+    buckets: Required[List[IReportTaskSummaryBucket]]
+
+
+class IReportTaskSummaryBucket(TypedDict, total=False):
+    type: Required[str]
+    fieldName: str
+    count: Required[int]
+    firstErrors: List[Any]
+    sampleErrors: List[Any]
+    rowHistogram: IReportTaskSummaryHistogram
+
+
+class IReportTaskSummaryHistogram(TypedDict, total=False):
+    binSize: Required[int]
+    counts: Required[List[int]]
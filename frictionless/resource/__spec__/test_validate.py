@@ -10,9 +10,13 @@ from frictionless import (
     FrictionlessException,
     Resource,
     Schema,
+    checks,
     errors,
     platform,
+    settings,
+    system,
 )
+from frictionless.resource import parallel as parallel_module
 from frictionless.resources import TableResource
 
 # General
@@ -243,6 +247,42 @@ def test_resource_validate_structure_errors_with_limit_errors():
     ]
 
 
+@pytest.mark.parametrize("batch", [False, True])
+def test_resource_validate_aggregate(batch):
+    resource = TableResource(path="data/invalid.csv")
+    report = resource.validate(aggregate=True, batch=batch, limit_errors=3)
+    expected = TableResource(path="data/invalid.csv").validate()
+    assert report.task.warnings == ["reached error limit: 3"]
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [None, 3, "blank-label"],
+        [None, 4, "duplicate-label"],
+        [2, 3, "missing-cell"],
+    ]
+    summary = report.task.summary
+    assert summary
+    assert summary["errors"] == len(expected.task.errors)
+    counts = {}
+    for error in expected.task.errors:
+        key = (error.type, getattr(error, "field_name", None) or None)
+        counts[key] = counts.get(key, 0) + 1
+    assert {
+        (bucket["type"], bucket.get("fieldName")): bucket["count"]
+        for bucket in summary["buckets"]
+    } == counts
+    bucket = summary["buckets"][2]
+    assert bucket["type"] == "missing-cell"
+    assert bucket["firstErrors"][0]["rowNumber"] == 2
+    assert bucket["rowHistogram"] == {"binSize": 1, "counts": [0, 0, 1, 1]}
+
+
+def test_resource_validate_aggregate_all_errors():
+    resource = TableResource(path="data/invalid.csv")
+    report = resource.validate(aggregate=True)
+    assert report.task.warnings == []
+    assert report.task.summary
+    assert report.task.summary["errors"] == len(report.task.errors)
+
+
 def test_resource_validate_custom_check():
     # Create check
     class custom(Check):
@@ -763,3 +803,130 @@ def test_resource_validate_scheme_invalid():
     assert report.flatten(["type", "note"]) == [
         ["scheme-error", 'scheme "bad" is not supported'],
     ]
+
+
+# Parallel
+
+
+def write_parallel_table(path: str):
+    lines = ["id,name,note"]
+    for number in range(1, 301):
+        id = 7 if number in [150, 290] else number
+        name = "bad" if number % 97 == 0 else f"name{number % 10}"
+        note = '"multi\nline ""quoted"""' if number % 3 == 0 else "plain"
+        lines.append(f"{id},{name},{note}")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+@pytest.mark.parametrize("limit_errors", [1000, 5])
+def test_resource_validate_parallel_chunks(tmpdir, mocker, limit_errors):
+    path = str(tmpdir.join("table.csv"))
+    write_parallel_table(path)
+    mocker.patch.object(settings, "DEFAULT_CHUNK_SIZE", 500)
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer", "constraints": {"unique": True}},
+                {"name": "name", "type": "string", "constraints": {"pattern": "n.*"}},
+                {"name": "note", "type": "string"},
+            ],
+        }
+    )
+    checklist = Checklist(checks=[checks.forbidden_value(field_name="id", values=[9])])
+    with system.use_context(trusted=True):
+        resource = TableResource(path=path, schema=schema)
+        report = resource.validate(checklist, limit_errors=limit_errors)
+        resource = TableResource(path=path, schema=schema)
+        spy = mocker.spy(parallel_module, "validate_chunked")
+        parallel = resource.validate(checklist, parallel=True, limit_errors=limit_errors)
+    spec = ["rowNumber", "fieldNumber", "type", "note", "cells"]
+    assert parallel.flatten(spec) == report.flatten(spec)
+    assert parallel.task.warnings == report.task.warnings
+    assert spy.spy_return is not None
+    if limit_errors == 1000:
+        stats = report.task.stats
+        assert parallel.task.stats == {**stats, "seconds": parallel.task.stats["seconds"]}
+        assert [291, "unique-error", "the same as in the row at position 151"] in (
+            parallel.flatten(["rowNumber", "type", "note"])
+        )
+
+
+def test_resource_validate_parallel_chunks_small_file():
+    resource = TableResource(path="data/invalid.csv")
+    report = resource.validate(parallel=True)
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [None, 3, "blank-label"],
+        [None, 4, "duplicate-label"],
+        [2, 3, "missing-cell"],
+        [2, 4, "missing-cell"],
+        [3, 3, "missing-cell"],
+        [3, 4, "missing-cell"],
+        [4, None, "blank-row"],
+        [5, 5, "extra-cell"],
+    ]
+
+
+# Batch
+
+
+@pytest.mark.parametrize("limit_errors", [1000, 5])
+def test_resource_validate_batch(tmpdir, monkeypatch, limit_errors):
+    monkeypatch.setattr(settings, "DEFAULT_BATCH_SIZE", 7)
+    path = str(tmpdir.join("table.csv"))
+    write_parallel_table(path)
+    checklist = Checklist(checks=[checks.row_constraint(formula="id > 10")])
+    with system.use_context(trusted=True):
+        report = TableResource(path=path).validate(
+            checklist, batch=True, limit_errors=limit_errors
+        )
+        expected = TableResource(path=path).validate(checklist, limit_errors=limit_errors)
+    assert report.flatten(["rowNumber", "fieldNumber", "type", "note"]) == (
+        expected.flatten(["rowNumber", "fieldNumber", "type", "note"])
+    )
+    assert report.warnings == expected.warnings
+
+
+def test_resource_validate_batch_errors_without_row_number(tmpdir, monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_BATCH_SIZE", 7)
+
+    # Create check
+    class custom(Check):
+        def validate_row(self, row):
+            if row.row_number % 5 == 0:
+                yield errors.CheckError(note=f"after row {row.row_number}")
+
+    # Validate resource
+    path = str(tmpdir.join("table.csv"))
+    write_parallel_table(path)
+    checklist = Checklist(
+        checks=[checks.row_constraint(formula="id > 10"), custom()],
+    )
+    with system.use_context(trusted=True):
+        report = TableResource(path=path).validate(checklist, batch=True)
+        expected = TableResource(path=path).validate(checklist)
+    assert report.flatten(["rowNumber", "type", "note"]) == (
+        expected.flatten(["rowNumber", "type", "note"])
+    )
+    assert [None, "check-error", "after row 5"] in expected.flatten(
+        ["rowNumber", "type", "note"]
+    )
+
+
+def test_resource_validate_batch_on_row():
+    row_numbers = []
+    resource = TableResource(path="data/invalid.csv")
+    report = resource.validate(
+        batch=True, on_row=lambda row: row_numbers.append(row.row_number)
+    )
+    assert row_numbers == [2, 3, 4, 5]
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [None, 3, "blank-label"],
+        [None, 4, "duplicate-label"],
+        [2, 3, "missing-cell"],
+        [2, 4, "missing-cell"],
+        [3, 3, "missing-cell"],
+        [3, 4, "missing-cell"],
+        [4, None, "blank-row"],
+        [5, 5, "extra-cell"],
+    ]
@@ -0,0 +1,462 @@
+from __future__ import annotations
+
+import os
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .. import errors, helpers, settings
+from ..checklist import Check, Checklist
+from ..detector.scores import FieldScores
+from ..dialect import Dialect
+from ..error import Error
+from ..platform import platform
+from ..system import system
+from ..table import Row, create_cell_handlers
+from .stats import ResourceStats
+
+if TYPE_CHECKING:
+    from .. import types
+    from ..formats.csv.chunks import CsvChunk, CsvChunks
+    from ..resources import TableResource
+    from .resource import Resource
+
+
+# NOTE:
+# Only row-local checks can be run inside of a chunk; stateful checks
+# (e.g. deviated-value) would require merging their state across chunks
+CHUNKABLE_CHECKS = [
+    "baseline",
+    "ascii-value",
+    "forbidden-value",
+    "row-constraint",
+    "truncated-value",
+]
+
+
+def validate_chunked(
+    resource: Resource,
+    *,
+    checklist: Checklist,
+    checks: List[Check],
+    limit_errors: int,
+) -> Optional[List[Error]]:
+    """Validate an open table resource splitting it into chunks
+
+    A local CSV/TSV file is split into byte ranges aligned on record
+    boundaries and every range is validated in a process pool. Uniqueness of
+    `unique` fields and primary keys is checked across the chunks after merging.
+    It also updates the resource's stats (bytes, hashes and rows).
+
+    Parameters:
+        resource: open resource
+        checklist: validation checklist
+        checks: connected checks that passed `validate_start`
+        limit_errors: limit amount of errors to this number
+
+    Returns:
+        Error[]?: row errors or None if the resource can't be validated in chunks
+    """
+    split = split_table(resource, checks=checks)
+    if not split:
+        return None
+    table, chunks = split
+
+    # Validate chunks
+    with Pool() as pool:
+        options_pool: List[Dict[str, Any]] = []
+        for chunk in chunks.chunks:
+            options: Dict[str, Any] = {}
+            options["resource"] = {}
+            options["resource"]["descriptor"] = table.to_descriptor()
+            options["resource"]["basepath"] = table.basepath
+            options["read"] = create_read_options(table)
+            options["checklist"] = checklist.to_descriptor()
+            options["checks"] = [check.to_descriptor() for check in checks]
+            options["chunk"] = chunk
+            options["limit_errors"] = limit_errors
+            options_pool.append(options)
+        results = pool.map(_validate_chunk, options_pool)
+
+    # Verify records
+    for chunk, result in zip(chunks.chunks[:-1], results[:-1]):
+        if not result["partial"] and result["records"] != chunk.records:
+            return None
+
+    # Merge results
+    rows = 0
+    row_errors: List[Error] = []
+    memory_unique: Dict[str, Dict[Any, int]] = {}
+    memory_primary: Dict[Tuple[Any, ...], int] = {}
+    for chunk, result in zip(chunks.chunks, results):
+        chunk_errors: List[Error] = []
+        for descriptor in result["errors"]:
+            Class = system.select_error_class(descriptor["type"])
+            chunk_errors.append(Class.from_descriptor(descriptor))
+        integrity_errors = merge_integrity(
+            table,
+            chunk=chunk,
+            unique=result["unique"],
+            primary=result["primary"],
+            memory_unique=memory_unique,
+            memory_primary=memory_primary,
+        )
+        for error in integrity_errors:
+            if checklist.match(error):
+                insert_error(chunk_errors, error)
+        row_errors.extend(chunk_errors)
+        rows += result["rows"]
+        if result["partial"]:
+            break
+
+    # Update stats
+    table.stats.set_hashes(chunks.hashes)
+    table.stats.bytes = chunks.bytes
+    table.stats.rows = rows
+
+    return row_errors
+
+
+def infer_chunked(
+    resource: TableResource, *, scores: FieldScores
+) -> Optional[ResourceStats]:
+    """Score all the rows of an opening table resource splitting it into chunks
+
+    A local CSV/TSV file is split into byte ranges aligned on record
+    boundaries and the field scores of every range are counted in a process pool.
+    As the file is read completely, its stats (bytes, hashes and rows) are returned.
+
+    Parameters:
+        resource: table resource which dialect is already detected
+        scores: field scores to merge the chunks' counters into
+
+    Returns:
+        ResourceStats?: file stats or None if the resource can't be split
+    """
+    chunks = split_file(resource)
+    if not chunks:
+        return None
+
+    # Score chunks
+    with Pool() as pool:
+        options_pool: List[Dict[str, Any]] = []
+        for chunk in chunks.chunks:
+            options: Dict[str, Any] = {}
+            options["dialect"] = resource.dialect.to_descriptor()
+            options["read"] = create_read_options(resource)
+            options["fields"] = scores.fields
+            options["missing_values"] = list(scores.missing_values)
+            options["chunk"] = chunk
+            options_pool.append(options)
+        results = pool.map(_infer_chunk, options_pool)
+
+    # Verify records
+    for chunk, result in zip(chunks.chunks[:-1], results[:-1]):
+        if result["records"] != chunk.records:
+            return None
+
+    # Merge results
+    rows = 0
+    for result in results:
+        scores.merge(
+            rows=result["rows"], missing=result["missing"], failures=result["failures"]
+        )
+        rows += result["rows"]
+
+    # Create stats
+    stats = ResourceStats(bytes=chunks.bytes, rows=rows)
+    stats.set_hashes(chunks.hashes)
+
+    return stats
+
+
+def split_table(
+    resource: Resource, *, checks: List[Check]
+) -> Optional[Tuple[TableResource, CsvChunks]]:
+    """Split an open table resource into chunks if it's supported"""
+    TableResource = platform.frictionless_resources.TableResource
+    if not isinstance(resource, TableResource):
+        return None
+    if resource.schema.foreign_keys or system.onerror != "ignore":
+        return None
+    for check in checks:
+        if check.type not in CHUNKABLE_CHECKS:
+            return None
+
+    # Fields must not depend on the labels
+    expected_fields = resource.header.get_expected_fields()
+    if [field.name for field in expected_fields] != resource.schema.field_names:
+        return None
+
+    # Split file
+    chunks = split_file(resource)
+    if not chunks:
+        return None
+
+    return resource, chunks
+
+
+def split_file(resource: TableResource) -> Optional[CsvChunks]:
+    """Split a table resource's file into chunks if it's supported"""
+    if resource.format not in ["csv", "tsv"] or resource.scheme != "file":
+        return None
+    if resource.compression or resource.multipart or resource.innerpath:
+        return None
+    if resource.dialect.comment_rows:
+        return None
+    control = platform.frictionless_formats.CsvControl.from_dialect(resource.dialect)
+    if control.escape_char or not resource.normpath or not resource.encoding:
+        return None
+    path = resource.normpath
+    if not os.path.isfile(path):
+        return None
+    chunk_size = settings.DEFAULT_CHUNK_SIZE
+    if os.path.getsize(path) < chunk_size * 2:
+        return None
+    hashing = resource.detector.detect_hashing(resource)
+    chunks = platform.frictionless_formats_csv_chunks.split_chunks(
+        path,
+        chunk_size=chunk_size,
+        skip_records=resource.dialect.create_first_content_row() - 1,
+        quote_char=control.quote_char,
+        encoding=resource.encoding,
+        hashers={name: helpers.create_hasher(name) for name in hashing},
+    )
+    if not chunks or len(chunks.chunks) < 2:
+        return None
+
+    return chunks
+
+
+def create_read_options(resource: TableResource) -> types.IDescriptor:
+    control = platform.frictionless_formats.CsvControl.from_dialect(resource.dialect)
+    options: types.IDescriptor = {}
+    options["path"] = resource.normpath
+    options["encoding"] = resource.encoding
+    options["newline"] = "" if resource.format == "csv" else None
+    options["config"] = platform.frictionless_formats_csv_chunks.create_config(
+        control.to_python()
+    )
+    return options
+
+
+def merge_integrity(
+    resource: TableResource,
+    *,
+    chunk: CsvChunk,
+    unique: Dict[str, Dict[Any, Tuple[int, int]]],
+    primary: Dict[Tuple[Any, ...], Tuple[int, int]],
+    memory_unique: Dict[str, Dict[Any, int]],
+    memory_primary: Dict[Tuple[Any, ...], int],
+) -> List[Error]:
+    """Find the chunk's values that are already seen in the previous chunks
+
+    Every chunk reports the first and the last row for each of its values.
+    As in the sequential mode, the first row of a repeated value refers to
+    the last row where the value has been seen before.
+    """
+    matches: List[Tuple[int, int, Optional[str], int]] = []
+    for field_name, values in unique.items():
+        memory = memory_unique.setdefault(field_name, {})
+        field_number = resource.schema.field_names.index(field_name)
+        for cell, (first, last) in values.items():
+            match = memory.get(cell)
+            memory[cell] = last
+            if match:
+                matches.append((first, field_number, field_name, match))
+    for cells, (first, last) in primary.items():
+        match = memory_primary.get(cells)
+        memory_primary[cells] = last
+        if match:
+            matches.append((first, len(resource.schema.fields), None, match))
+    if not matches:
+        return []
+
+    # Create errors
+    integrity_errors: List[Error] = []
+    options = create_read_options(resource)
+    handlers = create_cell_handlers(resource.schema.fields)
+    records = read_records(options, chunk=chunk, row_numbers=[m[0] for m in matches])
+    for row_number, _, field_name, match in sorted(matches):
+        row = Row(records[row_number], handlers=handlers, row_number=row_number)
+        note = "the same as in the row at position %s" % match
+        if field_name:
+            error = errors.UniqueError.from_row(row, note=note, field_name=field_name)
+        else:
+            error = errors.PrimaryKeyError.from_row(row, note=note)
+        integrity_errors.append(error)
+    return integrity_errors
+
+
+def read_records(
+    options: types.IDescriptor, *, chunk: CsvChunk, row_numbers: List[int]
+) -> Dict[int, List[Any]]:
+    """Read the given records of a chunk (without parsing the cells)"""
+    records: Dict[int, List[Any]] = {}
+    last_row_number = max(row_numbers)
+    selected = set(row_numbers)
+    stream = platform.frictionless_formats_csv_chunks.read_chunk(
+        options["path"], chunk, **without_path(options)
+    )
+    for row_number, cells in enumerate(stream, start=chunk.row_number):
+        if row_number in selected:
+            records[row_number] = cells
+        if row_number >= last_row_number:
+            break
+    return records
+
+
+def insert_error(row_errors: List[Error], error: Error) -> None:
+    """Insert an error after the baseline errors of the same row"""
+    types = [Error.type for Error in platform.frictionless_checks.baseline.Errors]
+    row_number = getattr(error, "row_number")
+    index = len(row_errors)
+    while index:
+        prev = row_errors[index - 1]
+        prev_row_number = getattr(prev, "row_number", 0)
+        if prev_row_number < row_number:
+            break
+        if prev_row_number == row_number and prev.type in types:
+            break
+        index -= 1
+    row_errors.insert(index, error)
+
+
+def without_path(options: types.IDescriptor) -> types.IDescriptor:
+    return {key: value for key, value in options.items() if key != "path"}
+
+
+# Internal
+
+
+def _validate_chunk(options: types.IDescriptor) -> types.IDescriptor:
+    chunk: CsvChunk = options["chunk"]
+    limit_errors: int = options["limit_errors"]
+    resource = platform.frictionless.Resource.from_descriptor(**options["resource"])
+    checklist = Checklist.from_descriptor(options["checklist"])
+    checks = [Check.from_descriptor(item) for item in options["checks"]]
+    for check in checks:
+        check.connect(resource)
+
+    # Prepare state
+    schema = resource.schema
+    dialect = resource.dialect
+    handlers = create_cell_handlers(schema.fields)
+    comment_filter = dialect.create_comment_filter()
+    blank_filter = dialect.create_blank_filter()
+    unique_fields = [f.name for f in schema.fields if f.constraints.get("unique")]
+    unique: Dict[str, Dict[Any, List[int]]] = {name: {} for name in unique_fields}
+    primary: Dict[Tuple[Any, ...], List[int]] = {}
+    row_errors: List[Error] = []
+    partial = False
+    records = 0
+    rows = 0
+
+    # Validate rows
+    read = options["read"]
+    stream = platform.frictionless_formats_csv_chunks.read_chunk(
+        read["path"], chunk, **without_path(read)
+    )
+    for row_number, cells in enumerate(stream, start=chunk.row_number):
+        records += 1
+        if comment_filter and not comment_filter(row_number, cells):
+            continue
+        if blank_filter and not blank_filter(cells):
+            continue
+        rows += 1
+        row = Row(cells, handlers=handlers, row_number=row_number)
+
+        # Unique Error
+        for field_name, memory in unique.items():
+            cell = row[field_name]
+            if cell is not None:
+                match = memory.get(cell)
+                if match:
+                    func = errors.UniqueError.from_row
+                    note = "the same as in the row at position %s" % match[1]
+                    error = func(row, note=note, field_name=field_name)
+                    row.errors.append(error)
+                    match[1] = row_number
+                else:
+                    memory[cell] = [row_number, row_number]
+
+        # Primary Key Error
+        if schema.primary_key:
+            try:
+                cells = resource.primary_key_cells(row, dialect.header_case)  # type: ignore
+            except KeyError:
+                pass
+            else:
+                if set(cells) == {None}:
+                    note = 'cells composing the primary keys are all "None"'
+                    error = errors.PrimaryKeyError.from_row(row, note=note)
+                    row.errors.append(error)
+                else:
+                    match = primary.get(cells)
+                    if match:
+                        note = "the same as in the row at position %s" % match[1]
+                        error = errors.PrimaryKeyError.from_row(row, note=note)
+                        row.errors.append(error)
+                        match[1] = row_number
+                    else:
+                        primary[cells] = [row_number, row_number]
+
+        # Validate row
+        for check in checks:
+            for error in check.validate_row(row):
+                if checklist.match(error):
+                    row_errors.append(error)
+
+        # Limit errors
+        if limit_errors and len(row_errors) >= limit_errors:
+            partial = True
+            break
+
+    # Return result
+    result: types.IDescriptor = {}
+    result["errors"] = [error.to_descriptor() for error in row_errors]
+    result["partial"] = partial
+    result["records"] = records
+    result["rows"] = rows
+    result["unique"] = {
+        name: {cell: tuple(match) for cell, match in memory.items()}
+        for name, memory in unique.items()
+    }
+    result["primary"] = {cells: tuple(match) for cells, match in primary.items()}
+    return result
+
+
+def _infer_chunk(options: types.IDescriptor) -> types.IDescriptor:
+    chunk: CsvChunk = options["chunk"]
+    dialect = Dialect.from_descriptor(options["dialect"])
+    scores = FieldScores(options["fields"], missing_values=options["missing_values"])
+
+    # Prepare state
+    comment_filter = dialect.create_comment_filter()
+    blank_filter = dialect.create_blank_filter()
+    fragment: List[List[Any]] = []
+    records = 0
+
+    # Score rows
+    read = options["read"]
+    stream = platform.frictionless_formats_csv_chunks.read_chunk(
+        read["path"], chunk, **without_path(read)
+    )
+    for row_number, cells in enumerate(stream, start=chunk.row_number):
+        records += 1
+        if comment_filter and not comment_filter(row_number, cells):
+            continue
+        if blank_filter and not blank_filter(cells):
+            continue
+        fragment.append(cells)
+        if len(fragment) >= settings.DEFAULT_BATCH_SIZE:
+            scores.update(fragment)
+            fragment = []
+    scores.update(fragment)
+
+    # Return result
+    result: types.IDescriptor = {}
+    result["records"] = records
+    result["rows"] = scores.rows
+    result["missing"] = scores.missing
+    result["failures"] = scores.failures
+    return result
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
+import heapq
 import json
 import warnings
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import attrs
 from typing_extensions import Self
 
 from .. import errors, fields, helpers, settings
-from ..checklist import Checklist
+from ..checklist import Check, Checklist
 from ..detector import Detector
 from ..dialect import Control, Dialect
 from ..exception import FrictionlessException
 from ..metadata import Metadata
 from ..platform import platform
 from ..report import Report
+from ..report.summary import ErrorSummary
 from ..schema import Schema
 from ..system import system
+from . import parallel as parallel_module
 from .factory import Factory
 from .stats import ResourceStats
 
@@ -509,7 +522,10 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
             if not stats:
                 return
             helpers.pass_through(self.byte_stream)
-            self.hash = f"sha256:{self.stats.sha256}"
+            if self.stats.sha256:
+                self.hash = f"sha256:{self.stats.sha256}"
+            elif self.stats.md5:
+                self.hash = self.stats.md5
             self.bytes = self.stats.bytes
 
     # Dereference
@@ -608,6 +624,8 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
         name: Optional[str] = None,
         on_row: Optional[types.ICallbackFunction] = None,
         parallel: bool = False,
+        batch: bool = False,
+        aggregate: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     ) -> Report:
@@ -617,7 +635,10 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
             checklist: a Checklist object
             name: limit validation to one resource (if applicable)
             on_row: callbacke for every row
-            paraller: allow parallel validation (multiprocessing)
+            parallel: validate a local CSV/TSV table in chunks (multiprocessing)
+            batch: validate a table in columnar batches (see `batch_stream`)
+            aggregate: validate the whole table counting the errors after
+                the `limit_errors` is reached (see `ReportTask.summary`)
             limit_rows: limit amount of rows to this number
             limit_errors: limit amount of errors to this number
 
@@ -631,6 +652,16 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
         labels: List[str] = []
         errors: List[Error] = []
         warnings: List[str] = []
+        summary = ErrorSummary() if aggregate else None
+
+        # Collect error
+        # In the aggregate mode, errors are only counted after the limit
+        def add_error(error: Error):
+            if summary:
+                summary.add(error)
+                if limit_errors and len(errors) >= limit_errors:
+                    return
+            errors.append(error)
 
         # Prepare checklist
         checklist = checklist or Checklist()
@@ -640,8 +671,13 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
         try:
             self.to_descriptor(validate=True)
         except FrictionlessException as exception:
+            for error in exception.to_errors():
+                add_error(error)
             return Report.from_validation_task(
-                self, time=timer.time, errors=exception.to_errors()
+                self,
+                time=timer.time,
+                errors=errors,
+                summary=summary.to_descriptor() if summary else None,
             )
 
         # TODO: remove in version 6
@@ -658,25 +694,102 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
                 self.open()
             except FrictionlessException as exception:
                 self.close()
+                for error in exception.to_errors():
+                    add_error(error)
                 return Report.from_validation_task(
-                    self, time=timer.time, errors=exception.to_errors()
+                    self,
+                    time=timer.time,
+                    errors=errors,
+                    summary=summary.to_descriptor() if summary else None,
                 )
 
         # Validate data
         with self:
             # Validate start
-            for index, check in enumerate(checks):
+            for check in list(checks):
                 for error in check.validate_start():
                     if error.type == "check-error":
-                        del checks[index]
+                        checks[:] = [item for item in checks if item is not check]
                     if checklist.match(error):
-                        errors.append(error)
+                        add_error(error)
+
+            # Validate chunks
+            # Chunks are validated up to the limit so they can't be aggregated
+            chunk_errors = None
+            if parallel and not on_row and not limit_rows and not aggregate:
+                chunk_errors = parallel_module.validate_chunked(
+                    self, checklist=checklist, checks=checks, limit_errors=limit_errors
+                )
 
             # Validate file
             if not isinstance(self, platform.frictionless_resources.TableResource):
                 if self.hash is not None or self.bytes is not None:
                     helpers.pass_through(self.byte_stream)
 
+            # Validate table (chunked)
+            elif chunk_errors is not None:
+                labels = self.labels
+                errors.extend(chunk_errors)
+                if limit_errors:
+                    if len(errors) >= limit_errors:
+                        errors = errors[:limit_errors]
+                        warning = f"reached error limit: {limit_errors}"
+                        warnings.append(warning)
+                        partial = True
+
+            # Validate table (batched)
+            elif batch and not limit_rows:
+                labels = self.labels
+                while True:
+                    # Emit batch
+                    try:
+                        row_batch = next(self.batch_stream)  # type: ignore
+                    except FrictionlessException as exception:
+                        add_error(exception.error)
+                        break
+                    except StopIteration:
+                        break
+
+                    # Validate batch
+                    # Errors are merged by row to keep the sequential order.
+                    # The rows are validated one by one for the checks not
+                    # implementing `validate_batch` so every error gets its row
+                    # (otherwise an error without a row number follows the previous one)
+                    batch_errors: List[List[Tuple[int, Error]]] = []
+                    first_number = row_batch.row_numbers[0] if len(row_batch) else 0
+                    for check in checks:
+                        check_errors: List[Tuple[int, Error]] = []
+                        if type(check).validate_batch is Check.validate_batch:
+                            for row in row_batch:
+                                for error in check.validate_row(row):
+                                    if checklist.match(error):
+                                        check_errors.append((row.row_number, error))
+                        else:
+                            row_number = first_number
+                            for error in check.validate_batch(row_batch):
+                                if checklist.match(error):
+                                    number = getattr(error, "row_number", None)
+                                    row_number = number or row_number
+                                    check_errors.append((row_number, error))
+                        batch_errors.append(check_errors)
+                    key = lambda item: item[0]  # type: ignore
+                    for _, error in heapq.merge(*batch_errors, key=key):  # type: ignore
+                        add_error(error)
+
+                    # Callback rows
+                    if on_row:
+                        for row in row_batch:
+                            on_row(row)
+
+                    # Limit errors
+                    if limit_errors and not summary:
+                        if len(errors) >= limit_errors:
+                            errors = errors[:limit_errors]
+                            warning = f"reached error limit: {limit_errors}"
+                            warnings.append(warning)
+                            partial = True
+                            break
+
             # Validate table
             else:
                 row_count = 0
@@ -688,7 +801,7 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
                     try:
                         row = next(self.row_stream)  # type: ignore
                     except FrictionlessException as exception:
-                        errors.append(exception.error)
+                        add_error(exception.error)
                         continue
                     except StopIteration:
                         break
@@ -697,7 +810,7 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
                     for check in checks:
                         for error in check.validate_row(row):
                             if checklist.match(error):
-                                errors.append(error)
+                                add_error(error)
 
                     # Callback row
                     if on_row:
@@ -712,7 +825,7 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
                             break
 
                     # Limit errors
-                    if limit_errors:
+                    if limit_errors and not summary:
                         if len(errors) >= limit_errors:
                             errors = errors[:limit_errors]
                             warning = f"reached error limit: {limit_errors}"
@@ -725,11 +838,20 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
                 for check in checks:
                     for error in check.validate_end():
                         if checklist.match(error):
-                            errors.append(error)
+                            add_error(error)
+
+        # Limit errors (aggregate)
+        if summary and limit_errors and summary.count > limit_errors:
+            warnings.append(f"reached error limit: {limit_errors}")
 
         # Return report
         return Report.from_validation_task(
-            self, time=timer.time, labels=labels, errors=errors, warnings=warnings
+            self,
+            time=timer.time,
+            labels=labels,
+            errors=errors,
+            warnings=warnings,
+            summary=summary.to_descriptor() if summary else None,
         )
 
     # Export
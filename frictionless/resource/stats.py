@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 
 import attrs
 
@@ -19,6 +19,13 @@ class ResourceStats:
     Hashed value of data with sha256 hashing algorithm.
     """
 
+    hashes: Dict[str, str] = attrs.field(factory=dict)
+    """
+    Hashed values of data indexed by algorithm.
+    Only the digests calculated while reading the data are available
+    (see `Detector.hashing`).
+    """
+
     bytes: Optional[int] = None
     """
     Size of data in bytes.
@@ -33,3 +40,15 @@ class ResourceStats:
     """
     Number of rows in a resource.
     """
+
+    # Hashes
+
+    def set_hashes(self, hashes: Dict[str, str]) -> None:
+        """Set hashed values of data updating the `md5` and `sha256` stats
+
+        Parameters:
+            hashes: hashed values of data indexed by algorithm
+        """
+        self.hashes = hashes
+        self.md5 = hashes.get("md5")
+        self.sha256 = hashes.get("sha256")
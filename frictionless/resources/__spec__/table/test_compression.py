@@ -1,8 +1,11 @@
+import gzip
+import hashlib
 import sys
+import tempfile
 
 import pytest
 
-from frictionless import FrictionlessException
+from frictionless import Detector, FrictionlessException
 from frictionless.resources import TableResource
 
 # General
@@ -177,6 +180,42 @@ def test_resource_compression_error_invalid_gz():
     assert error.note == "Not a gzipped file (b'id')"
 
 
+def test_resource_compression_local_csv_gz_single_pass(mocker):
+    seek = mocker.spy(gzip.GzipFile, "seek")
+    with open("data/table.csv.gz", "rb") as file:
+        bytes = file.read()
+    with TableResource(path="data/table.csv.gz") as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+        assert resource.stats.bytes == len(bytes)
+        assert resource.stats.sha256 == hashlib.sha256(bytes).hexdigest()
+    assert seek.call_count == 0
+
+
+def test_resource_compression_local_csv_gz_small_buffer():
+    detector = Detector(buffer_size=10)
+    with TableResource(path="data/table.csv.gz", detector=detector) as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_resource_compression_local_csv_zip_without_temporary_file(mocker):
+    mocker.patch.object(tempfile, "NamedTemporaryFile", side_effect=AssertionError)
+    with open("data/table.csv.zip", "rb") as file:
+        bytes = file.read()
+    with TableResource(path="data/table.csv.zip") as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+        assert resource.stats.bytes == len(bytes)
+        assert resource.stats.sha256 == hashlib.sha256(bytes).hexdigest()
+
+
 # Bugs
 
 
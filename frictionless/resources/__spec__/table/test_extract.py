@@ -1,7 +1,7 @@
 import os
 from pathlib import Path
 
-from frictionless import Resource, resources, system
+from frictionless import Resource, helpers, resources, system
 from frictionless.resources import TableResource
 
 # General
@@ -28,6 +28,27 @@ def test_extract_resource_process():
     }
 
 
+def test_extract_resource_without_hashing(monkeypatch):
+    algorithms = []
+    create_hasher = helpers.create_hasher
+    monkeypatch.setattr(
+        helpers,
+        "create_hasher",
+        lambda name: algorithms.append(name) or create_hasher(name),
+    )
+    resource = TableResource(path="data/table.csv")
+    assert resource.extract() == {
+        "table": [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+    }
+    assert algorithms == []
+    with resource:
+        resource.read_rows()
+    assert algorithms == ["md5", "sha256"]
+
+
 def test_extract_resource_from_file():
     resource = TableResource(path="data/table.csv")
     assert resource.extract() == {
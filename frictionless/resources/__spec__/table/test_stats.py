@@ -1,8 +1,9 @@
+import hashlib
 import sys
 
 import pytest
 
-from frictionless import Dialect
+from frictionless import Detector, Dialect
 from frictionless.resources import TableResource
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
@@ -29,6 +30,33 @@ def test_resource_stats_hash_compressed():
         )
 
 
+def test_resource_stats_hashes():
+    with TableResource(path="data/doublequote.csv") as resource:
+        resource.read_rows()
+        assert list(resource.stats.hashes) == ["md5", "sha256"]
+        assert resource.stats.hashes["sha256"] == resource.stats.sha256
+
+
+def test_resource_stats_hashes_disabled():
+    detector = Detector(hashing=[])
+    with TableResource(path="data/doublequote.csv", detector=detector) as resource:
+        resource.read_rows()
+        assert resource.stats.hashes == {}
+        assert resource.stats.md5 is None
+        assert resource.stats.sha256 is None
+        assert resource.stats.bytes == 7346
+
+
+def test_resource_stats_hashes_custom_algorithm():
+    with open("data/doublequote.csv", "rb") as file:
+        expected = hashlib.blake2b(file.read()).hexdigest()
+    detector = Detector(hashing=["blake2b"])
+    with TableResource(path="data/doublequote.csv", detector=detector) as resource:
+        resource.read_rows()
+        assert resource.stats.hashes == {"blake2b": expected}
+        assert resource.stats.sha256 is None
+
+
 @pytest.mark.vcr
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="pytest-vcr bug in Python3.8/9")
 def test_resource_stats_hash_remote():
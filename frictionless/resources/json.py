@@ -108,6 +108,7 @@ class MetadataResource(JsonResource, Generic[T]):
         name: Optional[str] = None,
         on_row: Optional[types.ICallbackFunction] = None,
         parallel: bool = False,
+        aggregate: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     ) -> Report:
@@ -199,6 +200,7 @@ class ResourceResource(MetadataResource[Resource]):
         name: Optional[str] = None,
         on_row: Optional[types.ICallbackFunction] = None,
         parallel: bool = False,
+        aggregate: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     ) -> Report:
@@ -207,7 +209,11 @@ class ResourceResource(MetadataResource[Resource]):
         except FrictionlessException as exception:
             return Report.from_validation(errors=exception.to_errors())
         return resource.validate(
-            checklist, limit_errors=limit_errors, limit_rows=limit_rows, on_row=on_row
+            checklist,
+            aggregate=aggregate,
+            limit_errors=limit_errors,
+            limit_rows=limit_rows,
+            on_row=on_row,
         )
 
 
@@ -261,6 +267,7 @@ class PackageResource(MetadataResource[Package]):
         name: Optional[str] = None,
         on_row: Optional[types.ICallbackFunction] = None,
         parallel: bool = False,
+        aggregate: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     ) -> Report:
@@ -272,6 +279,7 @@ class PackageResource(MetadataResource[Package]):
             checklist,
             name=name,
             parallel=parallel,
+            aggregate=aggregate,
             limit_rows=limit_rows,
             limit_errors=limit_errors,
         )
@@ -296,6 +304,7 @@ class InquiryResource(MetadataResource[Inquiry]):
         name: Optional[str] = None,
         on_row: Optional[types.ICallbackFunction] = None,
         parallel: bool = False,
+        aggregate: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
     ) -> Report:
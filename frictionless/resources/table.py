@@ -3,28 +3,49 @@ from __future__ import annotations
 import builtins
 import os
 import warnings
+from contextlib import contextmanager
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
+import attrs
+
 from frictionless.schema.field import Field
 
-from .. import errors, helpers
+from .. import errors, helpers, settings
 from ..analyzer import Analyzer
 from ..dialect import Dialect
 from ..exception import FrictionlessException
 from ..indexer import Indexer
 from ..platform import platform
 from ..resource import Resource
+from ..resource import parallel as parallel_module
 from ..system import system
-from ..table import Header, Lookup, Row, Table, create_cell_handlers
+from ..table import (
+    Header,
+    IntegrityIndex,
+    Lookup,
+    Row,
+    RowBatch,
+    Table,
+    create_cell_handlers,
+    create_integrity_index,
+)
 from ..table import fields_match as fields_match_module
+from ..table.lookup import (
+    copy_reference_source,
+    create_fingerprint,
+    read_reference_index,
+)
 from ..transformer import Transformer
 
 if TYPE_CHECKING:
     from .. import types
+    from ..detector.scores import FieldScores
     from ..indexer import IOnProgress, IOnRow
     from ..pipeline import Pipeline
+    from ..resource.stats import ResourceStats
     from ..system import Loader, Parser
-    from ..table import IRowStream
+    from ..table import IBatchStream, IRowStream
 
 
 class TableResource(Resource):
@@ -39,9 +60,12 @@ class TableResource(Resource):
         self.__sample: Optional[types.ISample] = None
         self.__labels: Optional[types.ILabels] = None
         self.__fragment: Optional[types.IFragment] = None
+        self.__schema_stats: Optional[ResourceStats] = None
+        self.__indexes: List[IntegrityIndex] = []
         self.__header: Optional[Header] = None
         self.__lookup: Optional[Lookup] = None
         self.__row_stream: Optional[IRowStream] = None
+        self.__batch_stream: Optional[IBatchStream] = None
         super().__attrs_post_init__()
 
     # Open/Close
@@ -137,6 +161,21 @@ class TableResource(Resource):
             raise FrictionlessException("resource is not open")
         return self.__row_stream
 
+    @property
+    def batch_stream(self) -> IBatchStream:
+        """Row stream in form of a generator of RowBatch objects
+
+        It's an alternative to `row_stream` processing the rows in columnar
+        batches of `settings.DEFAULT_BATCH_SIZE` records. Both streams share
+        the same source so only one of them can be used at once.
+
+        Yields:
+            gen<RowBatch[]>?: batch stream
+        """
+        if self.__batch_stream is None:
+            raise FrictionlessException("resource is not open")
+        return self.__batch_stream
+
     @property
     def closed(self) -> bool:
         """Whether the table is closed
@@ -154,6 +193,9 @@ class TableResource(Resource):
         if self.__loader:
             self.__loader.close()
             self.__loader = None
+        for index in self.__indexes:
+            index.close()
+        self.__indexes = []
 
     def open(self):
         """Open the resource as "io.open" does"""
@@ -200,15 +242,77 @@ class TableResource(Resource):
 
     def __open_schema(self):
         self.metadata_assigned.add("schema")
+        fragment = self.fragment
+        scores: Optional[FieldScores] = None
+        field_candidates = system.detect_field_candidates()
+        self.__schema_stats = None
+
+        # Sample table
+        # The sample is the whole table if it's smaller than the sample size
+        sampling = self.detector.schema_sampling
+        if sampling not in ["head", "full", "reservoir"]:
+            note = f'schema sampling "{sampling}" is not supported'
+            raise FrictionlessException(errors.DetectorError(note=note))
+        if not self.schema and not self.detector.field_type and fragment:
+            is_sampled = len(self.sample) >= self.detector.sample_size
+            if sampling == "full":
+                scores = self.detector.create_field_scores(
+                    field_candidates=field_candidates
+                )
+                if not is_sampled:
+                    scores.update(fragment)
+                else:
+                    self.__schema_stats = self.__read_schema_scores(scores)
+            elif sampling == "reservoir" and is_sampled:
+                fragment = self.__read_schema_reservoir()
+
         self.schema = self.detector.detect_schema(
-            self.fragment,
+            fragment,
             labels=self.labels,
             schema=self.schema,
-            field_candidates=system.detect_field_candidates(),
+            field_candidates=field_candidates,
+            scores=scores,
             header_case=self.dialect.header_case,
         )
         self.stats.fields = len(self.schema.fields)
 
+    def __read_schema_scores(self, scores: FieldScores) -> ResourceStats:
+        # Local CSV files can be scored in parallel
+        if self.detector.schema_parallel:
+            stats = parallel_module.infer_chunked(self, scores=scores)
+            if stats:
+                return stats
+
+        # Score the whole table (the file stats are calculated as well)
+        with self.__read_schema_stream() as (stream, source):
+            source.stats.rows = 0
+            while True:
+                fragment = [
+                    cells for _, cells in islice(stream, settings.DEFAULT_BATCH_SIZE)
+                ]
+                if not fragment:
+                    break
+                scores.update(fragment)
+                source.stats.rows += len(fragment)
+            return source.stats
+
+    def __read_schema_reservoir(self) -> types.IFragment:
+        with self.__read_schema_stream() as (stream, _):
+            cell_stream = (cells for _, cells in stream)
+            return helpers.sample_reservoir(cell_stream, self.detector.sample_size)
+
+    @contextmanager
+    def __read_schema_stream(self):
+        # A copy is used as its parser has its own loader and stats
+        source = self.to_copy()
+        parser = system.create_parser(source)
+        parser.open()
+        try:
+            stream = self.dialect.read_enumerated_content_stream(parser.cell_stream)
+            yield stream, source
+        finally:
+            parser.close()
+
     def __open_header(self):
         assert self.__labels is not None
 
@@ -245,8 +349,7 @@ class TableResource(Resource):
             source_key = tuple(fk["reference"]["fields"])
             if source_name == self.name or not source_name:
                 # Self reference
-                # A copy is needed as the resource is closed after the lookup
-                source_res = self.to_copy()
+                source_res = copy_reference_source(self)
             else:
                 if not self.package:
                     note = (
@@ -258,12 +361,7 @@ class TableResource(Resource):
                     note = f'failed to handle a foreign key for resource "{self.name}" as resource "{source_name}" does not exist'
                     raise FrictionlessException(errors.ResourceError(note=note))
 
-                # A copy is needed as the resource is closed after the lookup.
-                # Otherwise, this would cause issues in case of circular references.
-                source_res = self.package.get_resource(source_name).to_copy()
-
-            if source_res.schema:
-                source_res.schema.foreign_keys = []
+                source_res = copy_reference_source(self.package.get_resource(source_name))
 
             # Prepare lookup
             self.__lookup.setdefault(source_name, {})
@@ -272,12 +370,29 @@ class TableResource(Resource):
             self.__lookup[source_name][source_key] = set()
             if not source_res:
                 continue
-            with source_res:
-                for row in source_res.row_stream:  # type: ignore
-                    cells = tuple(row.get(field_name) for field_name in source_key)  # type: ignore
-                    if set(cells) == {None}:  # type: ignore
-                        continue
-                    self.__lookup[source_name][source_key].add(cells)
+
+            # Reuse index
+            # Indexes are shared by the package's resources until the source changes
+            cache = self.package.reference_cache if self.package else None
+            fingerprint = create_fingerprint(source_res) if cache is not None else None
+            if cache is not None:
+                name = source_name or self.name
+                index = cache.get(name, source_key, fingerprint=fingerprint)
+                if index is not None:
+                    self.__lookup[source_name][source_key] = index
+                    continue
+
+            # Create index
+            index = create_integrity_index(
+                self.detector.integrity_index, memory=self.detector.integrity_memory
+            )
+            read_reference_index(source_res, source_key, index)  # type: ignore
+            self.__lookup[source_name][source_key] = index
+            if cache is not None and fingerprint:
+                name = source_name or self.name
+                cache.set(name, source_key, index, fingerprint=fingerprint)
+            else:
+                self.__indexes.append(index)
 
     def __open_row_stream(self):
         # The header knows the fields to expect in the data (in order, and
@@ -287,14 +402,21 @@ class TableResource(Resource):
         handlers = create_cell_handlers(expected_fields)
 
         # Create state
-        memory_unique: Dict[str, Any] = {}
-        memory_primary: Dict[Tuple[Any], Any] = {}
+        memory_unique: Dict[str, IntegrityIndex] = {}
+        memory_primary: Optional[IntegrityIndex] = None
         foreign_groups: List[Any] = []
-        is_integrity = bool(self.schema.primary_key)
-        for field in self.schema.fields:
-            if field.constraints.get("unique"):
-                memory_unique[field.name] = {}
-                is_integrity = True
+        unique_fields = [
+            f.name for f in self.schema.fields if f.constraints.get("unique")
+        ]
+        is_integrity = bool(self.schema.primary_key or unique_fields)
+        if is_integrity:
+            # The memory budget is shared by all the indexes
+            count = len(unique_fields) + bool(self.schema.primary_key)
+            memory = max(self.detector.integrity_memory // count, 1)
+            for field_name in unique_fields:
+                memory_unique[field_name] = self.__create_index(memory=memory)
+            if self.schema.primary_key:
+                memory_primary = self.__create_index(memory=memory)
         if self.__lookup:
             for fk in self.schema.foreign_keys:
                 group = {}
@@ -309,6 +431,100 @@ class TableResource(Resource):
             self.cell_stream
         )
 
+        # Process integrity
+        def process_integrity(row: Row, probes: Optional[List[bool]] = None):
+            # Unique Error
+            if memory_unique:
+                for field_name in memory_unique.keys():
+                    cell = row[field_name]
+                    if cell is not None:
+                        match = memory_unique[field_name].update(cell, row.row_number)
+                        if match:
+                            func = errors.UniqueError.from_row
+                            note = "the same as in the row at position %s" % match
+                            error = func(row, note=note, field_name=field_name)
+                            row.errors.append(error)
+
+            # Primary Key Error
+            if self.schema.primary_key:
+                try:
+                    cells = self.primary_key_cells(row, self.dialect.header_case)
+                except KeyError:
+                    # Row does not have primary_key as label
+                    # There should already be a missing-label error in
+                    # in self.header corresponding to the schema primary key
+                    assert not self.header.valid
+                else:
+                    if set(cells) == {None}:
+                        note = 'cells composing the primary keys are all "None"'
+                        error = errors.PrimaryKeyError.from_row(row, note=note)
+                        row.errors.append(error)
+                    else:
+                        match = memory_primary.update(cells, row.row_number)  # type: ignore
+                        if match:
+                            note = "the same as in the row at position %s" % match
+                            error = errors.PrimaryKeyError.from_row(row, note=note)
+                            row.errors.append(error)
+
+            # Foreign Key Error
+            if foreign_groups:
+                for position, group in enumerate(foreign_groups):
+                    group_lookup = self.lookup.get(group["sourceName"])
+                    if group_lookup:
+                        cells = tuple(row[name] for name in group["targetKey"])
+                        if set(cells) == {None}:
+                            continue
+                        if probes is not None:
+                            match = probes[position]
+                        else:
+                            match = cells in group_lookup.get(group["sourceKey"], set())
+                        if not match:
+                            note = (
+                                'for "%s": values "%s" not found in the lookup table "%s" as "%s"'
+                                % (
+                                    ", ".join(group["targetKey"]),
+                                    ", ".join(str(d) for d in cells),
+                                    group["sourceName"],
+                                    ", ".join(group["sourceKey"]),
+                                )
+                            )
+
+                            error = errors.ForeignKeyError.from_row(
+                                row,
+                                note=note,
+                                field_names=list(group["targetKey"]),
+                                field_values=list(cells),
+                                reference_name=group["sourceName"],
+                                reference_field_names=list(group["sourceKey"]),
+                            )
+                            row.errors.append(error)
+
+        # Probe foreign keys
+        # Membership of the batch's keys is checked at once for every group
+        def probe_foreign_keys(batch: RowBatch) -> List[List[bool]]:
+            probes: List[List[bool]] = [[] for _ in range(len(batch))]
+            for group in foreign_groups:
+                group_lookup = self.lookup.get(group["sourceName"]) or {}
+                index = group_lookup.get(group["sourceKey"], set())
+                keys = [
+                    tuple(row.get(name) for name in group["targetKey"]) for row in batch
+                ]
+                if isinstance(index, IntegrityIndex):
+                    matches = index.contains_many(keys)
+                else:
+                    matches = [key in index for key in keys]
+                for position, match in enumerate(matches):
+                    probes[position].append(match)
+            return probes
+
+        # Handle errors
+        def process_onerror(row: Row):
+            if not row.valid:
+                error = row.errors[0]
+                if system.onerror == "raise":
+                    raise FrictionlessException(error)
+                warnings.warn(error.message, UserWarning)
+
         # Create row stream
         def row_stream():
             self.stats.rows = 0
@@ -321,84 +537,56 @@ class TableResource(Resource):
                     row_number=row_number,
                 )
 
-                # Unique Error
-                if is_integrity and memory_unique:
-                    for field_name in memory_unique.keys():
-                        cell = row[field_name]
-                        if cell is not None:
-                            match = memory_unique[field_name].get(cell)
-                            memory_unique[field_name][cell] = row.row_number
-                            if match:
-                                func = errors.UniqueError.from_row
-                                note = "the same as in the row at position %s" % match
-                                error = func(row, note=note, field_name=field_name)
-                                row.errors.append(error)
-
-                # Primary Key Error
-                if is_integrity and self.schema.primary_key:
-                    try:
-                        cells = self.primary_key_cells(row, self.dialect.header_case)
-                    except KeyError:
-                        # Row does not have primary_key as label
-                        # There should already be a missing-label error in
-                        # in self.header corresponding to the schema primary key
-                        assert not self.header.valid
-                    else:
-                        if set(cells) == {None}:
-                            note = 'cells composing the primary keys are all "None"'
-                            error = errors.PrimaryKeyError.from_row(row, note=note)
-                            row.errors.append(error)
-                        else:
-                            match = memory_primary.get(cells)
-                            memory_primary[cells] = row.row_number
-                            if match:
-                                note = "the same as in the row at position %s" % match
-                                error = errors.PrimaryKeyError.from_row(row, note=note)
-                                row.errors.append(error)
-
-                # Foreign Key Error
-                if is_integrity and foreign_groups:
-                    for group in foreign_groups:
-                        group_lookup = self.lookup.get(group["sourceName"])
-                        if group_lookup:
-                            cells = tuple(row[name] for name in group["targetKey"])
-                            if set(cells) == {None}:
-                                continue
-                            match = cells in group_lookup.get(group["sourceKey"], set())
-                            if not match:
-                                note = (
-                                    'for "%s": values "%s" not found in the lookup table "%s" as "%s"'
-                                    % (
-                                        ", ".join(group["targetKey"]),
-                                        ", ".join(str(d) for d in cells),
-                                        group["sourceName"],
-                                        ", ".join(group["sourceKey"]),
-                                    )
-                                )
-
-                                error = errors.ForeignKeyError.from_row(
-                                    row,
-                                    note=note,
-                                    field_names=list(group["targetKey"]),
-                                    field_values=list(cells),
-                                    reference_name=group["sourceName"],
-                                    reference_field_names=list(group["sourceKey"]),
-                                )
-                                row.errors.append(error)
+                # Check integrity
+                if is_integrity:
+                    process_integrity(row)
 
                 # Handle errors
                 if system.onerror != "ignore":
-                    if not row.valid:
-                        error = row.errors[0]
-                        if system.onerror == "raise":
-                            raise FrictionlessException(error)
-                        warnings.warn(error.message, UserWarning)
+                    process_onerror(row)
 
                 # Yield row
                 yield row
 
-        # Create row stream
+        # Create batch stream
+        def batch_stream():
+            self.stats.rows = 0
+            while True:
+                items = list(
+                    islice(enumerated_content_stream, settings.DEFAULT_BATCH_SIZE)
+                )
+                if not items:
+                    break
+                self.stats.rows += len(items)
+
+                batch = RowBatch(
+                    [cells for _, cells in items],
+                    handlers=handlers,
+                    row_numbers=[row_number for row_number, _ in items],
+                )
+
+                # Check integrity
+                if is_integrity:
+                    probes = probe_foreign_keys(batch) if foreign_groups else None
+                    for position, row in enumerate(batch):
+                        process_integrity(row, probes[position] if probes else None)
+
+                # Handle errors
+                if system.onerror != "ignore" and not batch.valid:
+                    for row in batch:
+                        process_onerror(row)
+
+                # Yield batch
+                yield batch
+
+        # Create row/batch streams
         self.__row_stream = row_stream()
+        self.__batch_stream = batch_stream()
+
+    def __create_index(self, *, memory: int) -> IntegrityIndex:
+        index = create_integrity_index(self.detector.integrity_index, memory=memory)
+        self.__indexes.append(index)
+        return index
 
     def primary_key_cells(self, row: Row, case_sensitive: bool) -> Tuple[Any, ...]:
         """Create a tuple containg all cells from a given row associated to primary
@@ -495,8 +683,17 @@ class TableResource(Resource):
         with self:
             if not stats:
                 return
-            helpers.pass_through(self.row_stream)
-            self.hash = f"sha256:{self.stats.sha256}"
+            # Stats are already calculated if the whole table has been scored
+            if self.__schema_stats and system.onerror == "ignore":
+                self.stats.set_hashes(self.__schema_stats.hashes)
+                self.stats.bytes = self.__schema_stats.bytes
+                self.stats.rows = self.__schema_stats.rows
+            else:
+                helpers.pass_through(self.row_stream)
+            if self.stats.sha256:
+                self.hash = f"sha256:{self.stats.sha256}"
+            elif self.stats.md5:
+                self.hash = self.stats.md5
             self.bytes = self.stats.bytes
             self.fields = self.stats.fields
             self.rows = self.stats.rows
@@ -547,7 +744,15 @@ class TableResource(Resource):
     ) -> types.ITabularData:
         if not process:
             process = lambda row: row.to_dict()
-        data = self.read_rows(size=limit_rows)
+
+        # A closed resource is read by a copy as its stats are not returned
+        # so the data is not hashed (except for the declared hash)
+        resource = self
+        if self.closed:
+            resource = self.to_copy()
+            resource.detector = attrs.evolve(self.detector, hashing=[])
+
+        data = resource.read_rows(size=limit_rows)
         data = builtins.filter(filter, data) if filter else data
         data = (process(row) for row in data) if process else data
         return {name or self.name: list(data)}
@@ -612,9 +817,25 @@ class TableResource(Resource):
         target = self.write(Resource(format="inline", dialect=dialect))  # type: ignore
         return target.data
 
-    def to_pandas(self, *, dialect: Optional[Dialect] = None):
-        """Helper to export resource as an Pandas dataframe"""
-        dialect = dialect or Dialect()
+    def to_pandas(
+        self, *, dialect: Optional[Dialect] = None, chunksize: Optional[int] = None
+    ):
+        """Helper to export resource as an Pandas dataframe
+
+        Parameters:
+            dialect (Dialect): dialect of the target resource
+            chunksize (int): if set, an iterator of dataframes having this
+                number of rows is returned instead of a single dataframe
+
+        Returns:
+            DataFrame|Iterator[DataFrame]: pandas dataframe(s)
+        """
+        dialect = dialect.to_copy() if dialect else Dialect()
+        if chunksize:
+            PandasControl = platform.frictionless_formats.PandasControl
+            control = PandasControl.from_dialect(dialect)
+            control.chunksize = chunksize
+            dialect.set_control(control)
         target = self.write(Resource(format="pandas", dialect=dialect))  # type: ignore
         return target.data
 
@@ -224,6 +224,35 @@ def test_field_read_cell_enum():
     assert read("") == (None, None)
 
 
+def test_field_read_cell_enum_unhashable():
+    field = Field.from_descriptor(
+        {
+            "name": "name",
+            "type": "object",
+            "constraints": {"enum": ['{"a": 1}', '{"b": [2]}']},
+        }
+    )
+    read = field.read_cell
+    assert read('{"a": 1}') == ({"a": 1}, None)
+    assert read({"b": [2]}) == ({"b": [2]}, None)
+    assert read('{"c": 3}')[1] == {
+        "enum": 'constraint "enum" is "[\'{"a": 1}\', \'{"b": [2]}\']"'
+    }
+
+
+def test_field_read_column_enum():
+    field = Field.from_descriptor(
+        {
+            "name": "name",
+            "type": "integer",
+            "constraints": {"enum": ["1", "2", "3"]},
+        }
+    )
+    values, notes = field.read_column(["1", "4", "", 3])
+    assert values == [1, 4, None, 3]
+    assert notes == {1: {"enum": "constraint \"enum\" is \"['1', '2', '3']\""}}
+
+
 def test_field_read_cell_multiple_constraints():
     field = Field.from_descriptor(
         {
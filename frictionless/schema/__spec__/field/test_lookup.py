@@ -0,0 +1,37 @@
+from frictionless import fields
+
+# General
+
+
+class Value(str):
+    # Counts the comparisons made while looking up a cell
+    comparisons = 0
+
+    __hash__ = str.__hash__
+
+    def __eq__(self, other):
+        Value.comparisons += 1
+        return str.__eq__(self, other)
+
+
+def test_field_read_cell_enum_lookup():
+    # Big code lists must not make every cell cost a linear scan
+    values = [Value(number) for number in range(10000)]
+    field = fields.StringField(name="name", constraints={"enum": values})
+    read = field.create_cell_reader()
+    Value.comparisons = 0
+    assert read("9999") == ("9999", None)
+    assert read("5000") == ("5000", None)
+    assert read("bad")[1] is not None
+    assert Value.comparisons == 2
+
+
+def test_field_read_cell_missing_values_lookup():
+    values = [Value(number) for number in range(10000)]
+    field = fields.StringField(name="name", missing_values=values)
+    read = field.create_cell_reader()
+    Value.comparisons = 0
+    assert read("9999") == (None, None)
+    assert read("5000") == (None, None)
+    assert read("value") == ("value", None)
+    assert Value.comparisons == 2
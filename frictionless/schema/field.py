@@ -9,9 +9,11 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Pattern,
+    Set,
     cast,
 )
 
@@ -124,30 +126,13 @@ class Field(Metadata):
 
     def create_cell_reader(self) -> types.ICellReader:
         value_reader = self.create_value_reader()
-
-        # Create missing values
-        missing_values = self.missing_values
-        if not self.has_defined("missing_values") and self.schema:
-            missing_values = self.schema.missing_values
-
-        # TODO: review where we need to cast constraints
-        # Create checks
-        checks: Dict[str, Callable[[Any], bool]] = {}
-        for name in self.supported_constraints:
-            constraint = self.constraints.get(name)
-            if constraint is not None:
-                if name in ["minimum", "maximum"]:
-                    constraint = value_reader(constraint)
-                if name == "pattern":
-                    constraint = re.compile("^{0}$".format(constraint))
-                if name == "enum":
-                    constraint = list(map(value_reader, constraint))  # type: ignore
-                checks[name] = partial(globals().get(f"check_{name}"), constraint)  # type: ignore
+        missing_values = self.__create_missing_values()
+        checks = self.__create_checks(value_reader)
 
         # Create reader
         def cell_reader(cell: Any):
             notes: Optional[Dict[str, str]] = None
-            if str(cell) in missing_values:
+            if (cell if type(cell) is str else str(cell)) in missing_values:
                 cell = None
             if cell is not None:
                 cell = value_reader(cell)
@@ -164,6 +149,59 @@ class Field(Metadata):
 
         return cell_reader
 
+    def read_column(self, cells: List[Any]):
+        column_reader = self.create_column_reader()
+        return column_reader(cells)
+
+    def create_column_reader(self) -> types.IColumnReader:
+        """Create a reader casting a column of cells at once
+
+        It's an equivalent of mapping the cell reader over the cells but
+        it returns the notes in a sparse form (indexed by the cell position)
+        and it casts the values with `create_value_column_reader`.
+        """
+        value_column_reader = self.create_value_column_reader()
+        missing_values = self.__create_missing_values()
+        checks = self.__create_checks(self.create_value_reader())
+
+        # Create reader
+        def column_reader(cells: List[Any]):
+            notes: Dict[int, Dict[str, str]] = {}
+            indexes = [
+                index
+                for index, cell in enumerate(cells)
+                if cell is not None
+                and (cell if type(cell) is str else str(cell)) not in missing_values
+            ]
+
+            # Cast values
+            if len(indexes) == len(cells):
+                values = value_column_reader(cells)
+            else:
+                values: List[Any] = [None] * len(cells)
+                targets = value_column_reader([cells[index] for index in indexes])
+                for index, target in zip(indexes, targets):
+                    values[index] = target
+            if None in values:
+                for index in indexes:
+                    if values[index] is None:
+                        notes[index] = {"type": f'type is "{self.type}/{self.format}"'}
+
+            # Check values
+            if checks:
+                for index, cell in enumerate(values):
+                    if index in notes:
+                        continue
+                    for name, check in checks.items():
+                        if not check(cell):
+                            constraint = self.constraints[name]
+                            note = f'constraint "{name}" is "{constraint}"'
+                            notes.setdefault(index, {})[name] = note
+
+            return values, notes
+
+        return column_reader
+
     def create_value_reader(self) -> types.IValueReader:
         # Create reader
         def value_reader(cell: Any):
@@ -171,6 +209,44 @@ class Field(Metadata):
 
         return value_reader
 
+    def create_value_column_reader(self) -> types.IValueColumnReader:
+        """Create a reader casting a column of non-missing cells
+
+        Field types can override it to cast the values in bulk;
+        the result must be the same as mapping `create_value_reader`.
+        """
+        value_reader = self.create_value_reader()
+
+        # Create reader
+        def value_column_reader(cells: List[Any]):
+            return list(map(value_reader, cells))
+
+        return value_column_reader
+
+    def __create_missing_values(self) -> FrozenSet[str]:
+        missing_values = self.missing_values
+        if not self.has_defined("missing_values") and self.schema:
+            missing_values = self.schema.missing_values
+        # Only strings can match as the cells are stringified before the lookup
+        return frozenset(value for value in missing_values if isinstance(value, str))
+
+    # TODO: review where we need to cast constraints
+    def __create_checks(
+        self, value_reader: types.IValueReader
+    ) -> Dict[str, Callable[[Any], bool]]:
+        checks: Dict[str, Callable[[Any], bool]] = {}
+        for name in self.supported_constraints:
+            constraint = self.constraints.get(name)
+            if constraint is not None:
+                if name in ["minimum", "maximum"]:
+                    constraint = value_reader(constraint)
+                if name == "pattern":
+                    constraint = re.compile("^{0}$".format(constraint))
+                if name == "enum":
+                    constraint = EnumLookup(list(map(value_reader, constraint)))  # type: ignore
+                checks[name] = partial(globals().get(f"check_{name}"), constraint)  # type: ignore
+        return checks
+
     # Write
 
     def write_cell(self, cell: Any, *, ignore_missing: bool = False):
@@ -387,7 +463,7 @@ def check_pattern(constraint: Pattern[str], cell: Optional[str]):
     return False
 
 
-def check_enum(constraint: List[Any], cell: Any):
+def check_enum(constraint: EnumLookup, cell: Any):
     if cell is None:
         return True
     if cell in constraint:
@@ -395,4 +471,29 @@ def check_enum(constraint: List[Any], cell: Any):
     return False
 
 
+class EnumLookup:
+    """Membership test for enum values
+
+    Hashable values are looked up in a set while unhashable ones
+    (e.g. objects and arrays) fall back to a linear scan.
+    """
+
+    def __init__(self, values: List[Any]):
+        self.hashable: Set[Any] = set()
+        self.unhashable: List[Any] = []
+        for value in values:
+            try:
+                self.hashable.add(value)
+            except TypeError:
+                self.unhashable.append(value)
+
+    def __contains__(self, cell: Any) -> bool:
+        try:
+            if cell in self.hashable:
+                return True
+        except TypeError:
+            pass
+        return cell in self.unhashable
+
+
 COMPILED_RE = type(re.compile(""))
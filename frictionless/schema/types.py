@@ -105,6 +105,7 @@ class IForeignKeyReference(TypedDict, total=False):
 
 INotes = Optional[Dict[str, str]]
 IValueReader = Callable[[Any], Any]
+IValueColumnReader = Callable[[List[Any]], List[Any]]
 IValueWriter = Callable[[Any], Any]
 
 
@@ -112,6 +113,12 @@ class ICellReader(Protocol):
     def __call__(self, cell: Any) -> Tuple[Any, INotes]: ...
 
 
+class IColumnReader(Protocol):
+    def __call__(
+        self, cells: List[Any]
+    ) -> Tuple[List[Any], Dict[int, Dict[str, str]]]: ...
+
+
 class ICellWriter(Protocol):
     def __call__(
         self, cell: Any, *, ignore_missing: bool = False
@@ -1,10 +1,13 @@
 import json
 import sys
+import threading
+import time
 
 import pytest
 
-from frictionless import FrictionlessException, platform, schemes
+from frictionless import FrictionlessException, platform, schemes, system
 from frictionless.resources import TableResource
+from frictionless.schemes.multipart.loader import MultipartByteStream, find_line_end
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
 
@@ -48,7 +51,8 @@ def test_multipart_loader_resource_remote():
         "name": "name",
         "path": "chunk2.headless.csv",
         "extrapaths": ["chunk3.csv"],
-        "dialect": {"header": False},
+        # The cassettes are not thread-safe so the parts are not prefetched
+        "dialect": {"header": False, "multipart": {"prefetch": 0}},
         "schema": "schema.json",
     }
     with TableResource.from_descriptor(descriptor, basepath=BASEURL % "data") as resource:
@@ -69,7 +73,8 @@ def test_multipart_loader_resource_remote_both_path_and_basepath():
         "name": "name",
         "path": "chunk2.headless.csv",
         "extrapaths": [BASEURL % "data/chunk3.csv"],
-        "dialect": {"header": False},
+        # The cassettes are not thread-safe so the parts are not prefetched
+        "dialect": {"header": False, "multipart": {"prefetch": 0}},
         "schema": "schema.json",
     }
     with TableResource.from_descriptor(descriptor, basepath=BASEURL % "data") as resource:
@@ -137,6 +142,78 @@ def test_multipart_loader_resource_validate():
     assert report.task.stats.get("rows") == 2
 
 
+@pytest.mark.parametrize("prefetch", [0, 1, 2])
+def test_multipart_byte_stream(prefetch):
+    paths = ["data/chunk1.csv", "data/chunk2.csv", "data/chunk1.csv"]
+    stream = MultipartByteStream(paths, remote=False, headless=False, prefetch=prefetch)
+    text = "id,name\n1,english\n2,中国人\n1,english\n".encode("utf-8")
+    assert stream.read(4) == text[:4]
+    assert stream.read(20) == text[4:24]
+    assert stream.read() == text[24:]
+    assert stream.read(4) == b""
+    stream.seek(0)
+    assert stream.read() == text
+    stream.close()
+
+
+def test_multipart_byte_stream_headless():
+    paths = ["data/chunk1.csv", "data/chunk2.csv"]
+    stream = MultipartByteStream(paths, remote=False, headless=True, prefetch=1)
+    assert stream.read() == "id,name\n1,english\nid,name\n2,中国人\n".encode("utf-8")
+
+
+def test_multipart_byte_stream_prefetch_sessions(monkeypatch):
+    calls = []
+
+    def read_part(self, number, path):
+        calls.append((threading.get_ident(), system.http_session))
+        yield str(number).encode()
+
+    monkeypatch.setattr(MultipartByteStream, "read_part", read_part)
+    paths = ["part1", "part2", "part3", "part4", "part5"]
+    stream = MultipartByteStream(paths, remote=True, headless=True, prefetch=2)
+    assert stream.read() == b"12345"
+    sessions = {}
+    for ident, session in calls:
+        assert session is not system.http_session
+        assert sessions.setdefault(ident, session) is session
+    assert len(set(map(id, sessions.values()))) == len(sessions)
+
+
+def test_multipart_byte_stream_prefetch_size(monkeypatch):
+    counts = {}
+
+    def read_part(self, number, path):
+        for count in range(1, 10000):
+            counts[number] = count
+            yield b"x"
+
+    monkeypatch.setattr(MultipartByteStream, "read_part", read_part)
+    paths = ["part1", "part2"]
+    stream = MultipartByteStream(
+        paths, remote=False, headless=True, prefetch=1, prefetch_size=1
+    )
+    assert stream.read(3) == b"xxx"
+    time.sleep(0.2)
+    stream.close()
+    assert counts[1] < 10
+    assert counts[2] < 10
+
+
+def test_multipart_control_prefetch_default():
+    control = schemes.MultipartControl()
+    assert control.prefetch > 0
+    assert control.prefetch_size > 0
+
+
+def test_multipart_find_line_end():
+    assert find_line_end(b"id,name\n1") == 8
+    assert find_line_end(b"id,name\r\n1") == 9
+    assert find_line_end(b"id,name\r1") == 8
+    assert find_line_end(b"id,name\r") == -1
+    assert find_line_end(b"id,name") == -1
+
+
 # Write
 
 
@@ -17,10 +17,25 @@ class MultipartControl(Control):
     Specifies chunk size for the multipart file.
     """
 
+    prefetch: int = settings.DEFAULT_PREFETCH
+    """
+    Specifies the number of remote parts to load in advance
+    on a thread pool while the current part is being read.
+    Every worker thread uses its own HTTP session. Use 0 to disable.
+    """
+
+    prefetch_size: int = settings.DEFAULT_PREFETCH_SIZE
+    """
+    Specifies the maximum number of bytes buffered for every
+    prefetched part (a worker waits until its part is consumed).
+    """
+
     # Metadata
 
     metadata_profile_patch = {
         "properties": {
             "chunkSize": {"type": "integer"},
+            "prefetch": {"type": "integer"},
+            "prefetchSize": {"type": "integer"},
         },
     }
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import queue
 import tempfile
-from typing import Any, List
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List
 
-from ... import helpers, types
+from ... import helpers, settings, types
+from ...detector import Detector
 from ...resources import FileResource
-from ...system import Loader
+from ...system import Loader, system
+from . import settings as multipart_settings
 from .control import MultipartControl
 
 # NOTE:
@@ -23,10 +29,13 @@ class MultipartLoader(Loader):
         remote = self.resource.remote
         headless = self.resource.dialect.header is False
         headless = headless or self.resource.format != "csv"
+        control = MultipartControl.from_dialect(self.resource.dialect)
         return MultipartByteStream(
             self.resource.normpaths,
             remote=remote,
             headless=headless,
+            prefetch=control.prefetch if remote else 0,
+            prefetch_size=control.prefetch_size,
         )
 
     # Write
@@ -50,11 +59,22 @@ class MultipartLoader(Loader):
 
 
 class MultipartByteStream:
-    def __init__(self, paths: List[str], *, remote: bool, headless: bool):
+    def __init__(
+        self,
+        paths: List[str],
+        *,
+        remote: bool,
+        headless: bool,
+        prefetch: int = 0,
+        prefetch_size: int = multipart_settings.DEFAULT_PREFETCH_SIZE,
+    ):
         self.__paths = paths
         self.__remote = remote
         self.__headless = headless
-        self.__line_stream = self.read_line_stream()
+        self.__prefetch = prefetch
+        self.__prefetch_size = prefetch_size
+        self.__chunk_stream = self.read_chunk_stream()
+        self.__chunk = memoryview(b"")
 
     def __enter__(self):
         return self
@@ -80,33 +100,172 @@ class MultipartByteStream:
         return False
 
     def close(self):
-        pass
+        self.__chunk_stream.close()
 
     def flush(self):
         pass
 
-    def read1(self, size: int):
-        return self.read(size)
+    def read1(self, size: int = -1):
+        return bytes(self.__read_chunk(size))
 
     def seek(self, offset: int):
         assert offset == 0
-        self.__line_stream = self.read_line_stream()
+        self.__chunk_stream.close()
+        self.__chunk_stream = self.read_chunk_stream()
+        self.__chunk = memoryview(b"")
 
-    def read(self, size: int):
-        res = b""
-        while True:
-            try:
-                res += next(self.__line_stream)
-            except StopIteration:
+    def read(self, size: int = -1):
+        buffer = bytearray()
+        while size < 0 or len(buffer) < size:
+            chunk = self.__read_chunk(-1 if size < 0 else size - len(buffer))
+            if not chunk:
                 break
-            if len(res) > size:
-                break
-        return res
+            buffer += chunk
+        return bytes(buffer)
+
+    def read_chunk_stream(self) -> Iterator[bytes]:
+        parts = enumerate(self.__paths, start=1)
+
+        # Sequential
+        if not self.__prefetch:
+            for number, path in parts:
+                yield from self.read_part(number, path)
+            return
 
-    def read_line_stream(self):
-        for number, path in enumerate(self.__paths, start=1):
-            with FileResource(path=path) as resource:
-                for line_number, line in enumerate(resource.byte_stream, start=1):
-                    if not self.__headless and number > 1 and line_number == 1:
+        # Prefetched
+        # The next parts are loaded on a thread pool while the current one is consumed.
+        # Every worker uses its own HTTP session (a session is not thread-safe)
+        # and buffers a limited number of bytes of its part
+        buffers: Deque[PartBuffer] = deque()
+        sessions: List[Any] = []
+        local = threading.local()
+        http_session = system.http_session if self.__remote else None
+
+        def read_part(number: int, path: str) -> Iterator[bytes]:
+            if http_session is None:
+                yield from self.read_part(number, path)
+                return
+            session = getattr(local, "http_session", None)
+            if session is None:
+                session = local.http_session = create_http_session(http_session)
+                sessions.append(session)
+            with system.use_thread_context(http_session=session):
+                yield from self.read_part(number, path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.__prefetch + 1) as executor:
+                try:
+                    for number, path in parts:
+                        buffer = PartBuffer(self.__prefetch_size)
+                        executor.submit(buffer.fill, read_part, number, path)
+                        buffers.append(buffer)
+                        if len(buffers) > self.__prefetch:
+                            yield from buffers[0]
+                            buffers.popleft()
+                    while buffers:
+                        yield from buffers[0]
+                        buffers.popleft()
+                finally:
+                    for buffer in buffers:
+                        buffer.cancel()
+        finally:
+            for session in sessions:
+                session.close()
+
+    def read_part(self, number: int, path: str) -> Iterator[bytes]:
+        skip = not self.__headless and number > 1
+        detector = Detector(hashing=[])
+        with FileResource(path=path, detector=detector) as resource:
+            prefix = b""
+            while True:
+                chunk = resource.byte_stream.read1(settings.DEFAULT_BUFFER_SIZE)
+                if not chunk:
+                    break
+                # Skip header
+                if skip:
+                    prefix += chunk
+                    index = find_line_end(prefix)
+                    if index == -1:
                         continue
-                    yield line
+                    chunk = prefix[index:]
+                    skip = False
+                if chunk:
+                    yield chunk
+
+    def __read_chunk(self, size: int) -> memoryview:
+        if not self.__chunk:
+            self.__chunk = memoryview(next(self.__chunk_stream, b""))
+        chunk = self.__chunk
+        if 0 <= size < len(chunk):
+            self.__chunk = chunk[size:]
+            return chunk[:size]
+        self.__chunk = memoryview(b"")
+        return chunk
+
+
+class PartBuffer:
+    """Bounded buffer of a part's chunks filled by a worker thread"""
+
+    def __init__(self, size: int):
+        maxsize = max(size // settings.DEFAULT_BUFFER_SIZE, 1)
+        self.__queue: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self.__cancelled = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def fill(self, read: Callable[..., Iterable[bytes]], *args: Any):
+        try:
+            chunks = iter(read(*args))
+            try:
+                for chunk in chunks:
+                    if not self.__put(chunk):
+                        return
+            finally:
+                getattr(chunks, "close", lambda: None)()
+        except Exception as exception:
+            self.__put(exception)
+            return
+        self.__put(None)
+
+    def cancel(self):
+        self.__cancelled.set()
+
+    def __put(self, item: Any) -> bool:
+        while not self.__cancelled.is_set():
+            try:
+                self.__queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+def create_http_session(http_session: Any) -> Any:
+    """Create a HTTP session with the settings of the given one"""
+    session = type(http_session)()
+    session.headers.update(http_session.headers)
+    session.auth = http_session.auth
+    session.cookies.update(http_session.cookies)
+    session.proxies.update(http_session.proxies)
+    session.verify = http_session.verify
+    session.cert = http_session.cert
+    return session
+
+
+def find_line_end(bytes: bytes) -> int:
+    """Find the index after the first line's end (-1 if it's not complete)"""
+    for index, byte in enumerate(bytes):
+        if byte == 10:
+            return index + 1
+        if byte == 13:
+            if index + 1 == len(bytes):
+                return -1
+            return index + 2 if bytes[index + 1] == 10 else index + 1
+    return -1
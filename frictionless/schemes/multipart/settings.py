@@ -3,3 +3,5 @@ from __future__ import annotations
 # General
 
 DEFAULT_CHUNK_SIZE = 100000000
+DEFAULT_PREFETCH = 2
+DEFAULT_PREFETCH_SIZE = 10000000
@@ -1,13 +1,64 @@
+import io
+import os
 import sys
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
-from frictionless import Dialect, platform, schemes
+from frictionless import Dialect, FrictionlessException, platform, schemes, system
 from frictionless.resources import TableResource
+from frictionless.schemes.remote.loader import RemoteByteStream
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
 
 
+# Fixtures
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    requests: list = []
+    ranges = True
+
+    def log_message(self, *args, **kwargs):
+        pass
+
+    def send_head(self):
+        self.requests.append((self.command, self.headers.get("Range")))
+        header = self.headers.get("Range")
+        if not self.ranges or not header:
+            return super().send_head()
+        path = self.translate_path(self.path)
+        with open(path, "rb") as file:
+            data = file.read()
+        start = int(header.split("=")[1].split("-")[0])
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return io.BytesIO(data[start:])
+
+    def end_headers(self):
+        if self.ranges and not self.headers.get("Range"):
+            self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+
+@pytest.fixture
+def server():
+    RangeRequestHandler.requests = []
+    RangeRequestHandler.ranges = True
+    handler = partial(RangeRequestHandler, directory=os.path.abspath("data"))
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/%s", RangeRequestHandler
+    httpd.shutdown()
+    httpd.server_close()
+
+
 # Read
 
 
@@ -60,6 +111,109 @@ def test_remote_loader_http_preload():
         assert resource.header == ["id", "name"]
 
 
+def test_remote_loader_local_server(server):
+    baseurl, handler = server
+    with TableResource(path=baseurl % "table.csv") as resource:
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+    assert handler.requests == [("GET", None)]
+
+
+def test_remote_byte_stream_range_request(server):
+    baseurl, handler = server
+    session = system.http_session
+    stream = RemoteByteStream(
+        baseurl % "table.csv", session=session, timeout=10, buffer_size=4
+    )
+    with open("data/table.csv", "rb") as file:
+        data = file.read()
+    stream.open()
+    assert stream.ranges is True
+    assert stream.read(10) == data[:10]
+    stream.seek(2)
+    assert stream.read(5) == data[2:7]
+    stream.seek(0, 2)
+    assert stream.tell() == len(data)
+    stream.close()
+    assert handler.requests == [("GET", None), ("GET", "bytes=2-")]
+
+
+def test_remote_byte_stream_range_request_not_supported(server):
+    baseurl, handler = server
+    handler.ranges = False
+    session = system.http_session
+    stream = RemoteByteStream(
+        baseurl % "table.csv", session=session, timeout=10, buffer_size=4
+    )
+    with open("data/table.csv", "rb") as file:
+        data = file.read()
+    stream.open()
+    assert stream.ranges is False
+    assert stream.read(10) == data[:10]
+    stream.seek(2)
+    assert stream.read() == data[2:]
+    stream.close()
+    assert handler.requests == [("GET", None), ("GET", None)]
+
+
+def test_remote_byte_stream_closed_before_open(server):
+    baseurl, _ = server
+    stream = RemoteByteStream(
+        baseurl % "table.csv", session=system.http_session, timeout=10
+    )
+    assert stream.closed is True
+
+
+def test_remote_loader_http_cache(server, tmpdir):
+    baseurl, handler = server
+    control = schemes.RemoteControl(http_cache=str(tmpdir))
+    with system.use_context(trusted=True):
+        for _ in range(2):
+            resource = TableResource(path=baseurl % "table.csv", control=control)
+            assert resource.read_rows() == [
+                {"id": 1, "name": "english"},
+                {"id": 2, "name": "中国人"},
+            ]
+    assert len(handler.requests) == 2
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_remote_loader_http_cache_zip_is_local(server, tmpdir, monkeypatch):
+    baseurl, _ = server
+    calls = []
+    NamedTemporaryFile = tempfile.NamedTemporaryFile
+    monkeypatch.setattr(
+        tempfile,
+        "NamedTemporaryFile",
+        lambda *args, **kwargs: (
+            calls.append(kwargs) or NamedTemporaryFile(*args, **kwargs)
+        ),
+    )
+    control = schemes.RemoteControl(http_cache=str(tmpdir))
+    with system.use_context(trusted=True):
+        for _ in range(2):
+            resource = TableResource(path=baseurl % "table.csv.zip", control=control)
+            assert resource.read_rows() == [
+                {"id": 1, "name": "english"},
+                {"id": 2, "name": "中国人"},
+            ]
+    assert calls == [{"dir": str(tmpdir), "delete": False}]
+
+
+def test_remote_loader_http_cache_not_safe(server):
+    baseurl, _ = server
+    control = schemes.RemoteControl(http_cache="/tmp/cache")
+    resource = TableResource(path=baseurl % "table.csv", control=control)
+    with pytest.raises(FrictionlessException) as excinfo:
+        resource.open()
+    error = excinfo.value.error
+    assert error.type == "scheme-error"
+    assert error.note == 'http cache "/tmp/cache" is not safe'
+
+
 # Write
 
 
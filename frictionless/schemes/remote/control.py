@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import attrs
 
 from ...dialect import Control
@@ -24,3 +26,20 @@ class RemoteControl(Control):
     Preloads data to the memory if set to True. It is set
     to False by default.
     """
+
+    http_cache: Optional[str] = None
+    """
+    Path to a directory to cache remote files. A cached file is
+    revalidated using a conditional request (ETag/Last-Modified)
+    so it's downloaded again only if it has changed.
+    """
+
+    # Metadata
+
+    metadata_profile_patch = {
+        "properties": {
+            "httpTimeout": {"type": "integer"},
+            "httpPreload": {"type": "boolean"},
+            "httpCache": {"type": "string"},
+        },
+    }
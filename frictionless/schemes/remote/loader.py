@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import io
-from typing import TYPE_CHECKING, Optional
+import json
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from ... import types
+from ... import errors, helpers, types
+from ...exception import FrictionlessException
 from ...platform import platform
 from ...system import Loader, system
+from . import settings
 from .control import RemoteControl
 
 if TYPE_CHECKING:
@@ -25,7 +32,26 @@ class RemoteLoader(Loader):
         control = RemoteControl.from_dialect(self.resource.dialect)
         session = system.http_session
         timeout = control.http_timeout
-        byte_stream = RemoteByteStream(path, session=session, timeout=timeout).open()
+
+        # Cached
+        if control.http_cache:
+            if not system.trusted and not helpers.is_safe_path(control.http_cache):
+                note = f'http cache "{control.http_cache}" is not safe'
+                raise FrictionlessException(errors.SchemeError(note=note))
+            cache = RemoteCache(control.http_cache, session=session, timeout=timeout)
+            path = cache.fetch(path)
+            # The cached file is read as a local one (e.g. an archive is not
+            # copied to a temporary file to be read randomly)
+            self.remote = False
+            return open(path, "rb")
+
+        # Streamed
+        buffer_size = max(
+            self.resource.detector.buffer_size, settings.DEFAULT_HTTP_BUFFER_SIZE
+        )
+        byte_stream = RemoteByteStream(
+            path, session=session, timeout=timeout, buffer_size=buffer_size
+        ).open()
         if control.http_preload:
             buffer = io.BufferedRandom(io.BytesIO())  # type: ignore
             buffer.write(byte_stream.read())
@@ -48,10 +74,33 @@ class RemoteLoader(Loader):
 
 
 class RemoteByteStream:
-    def __init__(self, source: str, *, session: Session, timeout: int):
+    """Remote byte stream
+
+    The head of the file (up to `buffer_size` bytes) is kept in memory so
+    seeking back to it (e.g. after buffering) doesn't issue new requests.
+    Other positions are fetched using HTTP Range requests if the server
+    supports them (otherwise the file is requested again and skipped).
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        session: Session,
+        timeout: int,
+        buffer_size: int = settings.DEFAULT_HTTP_BUFFER_SIZE,
+    ):
         self.__source = source
         self.__session = session
         self.__timeout = timeout
+        self.__buffer_size = buffer_size
+        self.__buffer = bytearray()
+        self.__position = 0
+        self.__response: Any = None
+        self.__response_position: Optional[int] = None
+        self.__ranges = False
+        self.__size: Optional[int] = None
+        self.__closed = True
 
     def __iter__(self):  # type: ignore
         while True:
@@ -73,33 +122,164 @@ class RemoteByteStream:
     def closed(self):
         return self.__closed
 
+    @property
+    def ranges(self) -> bool:
+        """Whether the server supports HTTP Range requests"""
+        return self.__ranges
+
     def open(self):
         self.__closed = False
-        self.seek(0)
+        self.__buffer = bytearray()
+        self.__position = 0
+        self.__request(0)
         return self
 
     def close(self):
         self.__closed = True
+        if self.__response is not None:
+            self.__response.close()
+            self.__response = None
+            self.__response_position = None
 
     def tell(self):
-        return self.__response.raw.tell()
+        return self.__position
 
     def flush(self):
         pass
 
     def read(self, size: Optional[int] = -1):
-        if size == -1:
-            size = None
-        return self.__response.raw.read(size)
+        size = -1 if size is None else size
+        chunks: List[bytes] = []
+
+        # Buffered
+        buffer = self.__buffer
+        if self.__position < len(buffer):
+            end = len(buffer) if size < 0 else min(len(buffer), self.__position + size)
+            chunk = bytes(buffer[self.__position : end])
+            self.__position += len(chunk)
+            chunks.append(chunk)
+            if size >= 0:
+                size -= len(chunk)
+
+        # Remote
+        if size:
+            if self.__response_position != self.__position:
+                self.__request(self.__position)
+            chunk = self.__response.raw.read(None if size < 0 else size)
+            if self.__position == len(buffer):
+                if len(buffer) + len(chunk) <= self.__buffer_size:
+                    buffer.extend(chunk)
+            self.__position += len(chunk)
+            self.__response_position = self.__position
+            chunks.append(chunk)
+
+        return b"".join(chunks)
 
     def read1(self, size: int = -1):
         return self.read(size)
 
-    def seek(self, offset: int, whence: int = 0):
-        assert offset == 0
-        assert whence == 0
-        self.__response = self.__session.get(
-            self.__source, stream=True, timeout=self.__timeout
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            if self.__size is None:
+                raise io.UnsupportedOperation("the size of the remote file is unknown")
+            offset += self.__size
+        self.__position = offset
+        return offset
+
+    def __request(self, offset: int):
+        if self.__response is not None:
+            self.__response.close()
+        headers: Dict[str, str] = {}
+        if offset and self.__ranges:
+            headers["Range"] = f"bytes={offset}-"
+        response = self.__session.get(
+            self.__source, stream=True, timeout=self.__timeout, headers=headers
+        )
+        response.raise_for_status()
+        response.raw.decode_content = True
+        self.__response = response
+        self.__response_position = offset
+
+        # Detect ranges
+        # Ranges are counted in the encoded bytes so they can't be used
+        # if the content is encoded (e.g. gzipped by the server)
+        if not offset:
+            encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+            self.__ranges = response.headers.get("Accept-Ranges") == "bytes"
+            self.__ranges = self.__ranges and not encoded
+            length = response.headers.get("Content-Length")
+            self.__size = int(length) if length and not encoded else None
+
+        # Skip bytes
+        if offset and response.status_code != 206:
+            skipped = 0
+            while skipped < offset:
+                chunk = response.raw.read(min(offset - skipped, 65536))
+                if not chunk:
+                    break
+                skipped += len(chunk)
+            self.__response_position = skipped
+
+
+class RemoteCache:
+    """Local on-disk cache of remote files
+
+    Files are keyed by URL and revalidated using conditional requests
+    based on the ETag and Last-Modified headers of the cached response.
+    """
+
+    def __init__(self, directory: str, *, session: Session, timeout: int):
+        self.__directory = directory
+        self.__session = session
+        self.__timeout = timeout
+
+    def fetch(self, source: str) -> str:
+        """Fetch a remote file returning its local path
+
+        Parameters:
+            source: URL of the file
+
+        Returns:
+            str: path to the cached file
+        """
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        path = os.path.join(self.__directory, f"{key}.data")
+        meta_path = os.path.join(self.__directory, f"{key}.json")
+
+        # Prepare headers
+        meta: Optional[Dict[str, Any]] = None
+        headers: Dict[str, str] = {}
+        if os.path.isfile(path) and os.path.isfile(meta_path):
+            with open(meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+            if meta and meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta and meta.get("lastModified"):
+                headers["If-Modified-Since"] = meta["lastModified"]
+
+        # Request file
+        response = self.__session.get(
+            source, stream=True, timeout=self.__timeout, headers=headers
         )
-        self.__response.raise_for_status()
-        self.__response.raw.decode_content = True
+        if headers and response.status_code == 304:
+            response.close()
+            return path
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        # Save file
+        os.makedirs(self.__directory, exist_ok=True)
+        with response, tempfile.NamedTemporaryFile(
+            dir=self.__directory, delete=False
+        ) as file:
+            shutil.copyfileobj(response.raw, file)
+        os.replace(file.name, path)
+        meta = {"url": source}
+        meta["etag"] = response.headers.get("ETag")
+        meta["lastModified"] = response.headers.get("Last-Modified")
+        with open(meta_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+        return path
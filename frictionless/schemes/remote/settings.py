@@ -4,3 +4,4 @@ from __future__ import annotations
 
 DEFAULT_HTTP_TIMEOUT = 10
 DEFAULT_SCHEMES = ["http", "https", "ftp", "ftps"]
+DEFAULT_HTTP_BUFFER_SIZE = 1000000
@@ -32,10 +32,18 @@ DEFAULT_HEADER_JOIN = " "
 DEFAULT_HEADER_CASE = True
 DEFAULT_FLOAT_NUMBERS = False
 DEFAULT_MISSING_VALUES = [""]
+DEFAULT_HASHING = ["md5", "sha256"]
 DEFAULT_LIMIT_ERRORS = 1000
+DEFAULT_SUMMARY_SAMPLE_SIZE = 5
+DEFAULT_SUMMARY_BINS = 20
 DEFAULT_LIMIT_MEMORY = 1000
 DEFAULT_BUFFER_SIZE = 100000
+DEFAULT_CHUNK_SIZE = 100000000
+DEFAULT_BATCH_SIZE = 1000
 DEFAULT_SAMPLE_SIZE = 100
+DEFAULT_SCHEMA_SAMPLING = "head"
+DEFAULT_INTEGRITY_INDEX = "memory"
+DEFAULT_EXACT_STATS_SIZE = 100000
 DEFAULT_ENCODING_CONFIDENCE = 0.5
 DEFAULT_FIELD_CONFIDENCE = 0.9
 DEFAULT_PACKAGE_PROFILE = "data-package"
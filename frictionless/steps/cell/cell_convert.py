@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -49,6 +49,20 @@ class cell_convert(Step):
         else:
             resource.data = table.update(self.field_name, self.value)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        converter = self.function
+        if not self.field_name:
+            if not converter:
+                converter = lambda _: self.value  # type: ignore
+        elif not converter:
+            if self.mapping:
+                converter = rows.create_mapping_converter(self.mapping)
+            else:
+                converter = lambda _: self.value  # type: ignore
+        if not callable(converter):
+            return None
+        return lambda data: rows.convert_rows(data, self.field_name, converter)
+
     # Metadata
 
     metadata_profile_patch = {
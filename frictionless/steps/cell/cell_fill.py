@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -44,6 +44,12 @@ class cell_fill(Step):
         elif self.direction == "left":
             resource.data = table.fillleft()  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        if not self.value or not self.field_name:
+            return None
+        converter = rows.create_mapping_converter({None: self.value})
+        return lambda data: rows.convert_rows(data, self.field_name, converter)
+
     # Metadata
 
     metadata_profile_patch = {
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -35,6 +35,10 @@ class cell_interpolate(Step):
         else:
             resource.data = table.interpolate(self.field_name, self.template)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        converter = lambda cell: self.template % cell  # type: ignore
+        return lambda data: rows.convert_rows(data, self.field_name, converter)
+
     # Metadata
 
     metadata_profile_patch = {
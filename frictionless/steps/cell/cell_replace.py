@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 from ...platform import platform
 
 if TYPE_CHECKING:
@@ -43,6 +44,13 @@ class cell_replace(Step):
                 function = platform.petl.sub  # type: ignore
             resource.data = function(table, self.field_name, pattern, self.replace)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        converter = rows.create_mapping_converter({self.pattern: self.replace})
+        if self.field_name and self.pattern.startswith("<regex>"):
+            regex = re.compile(self.pattern.replace("<regex>", ""))
+            converter = lambda cell: regex.sub(self.replace, cell)  # type: ignore
+        return lambda data: rows.convert_rows(data, self.field_name, converter)
+
     # Metadata
 
     metadata_profile_patch = {
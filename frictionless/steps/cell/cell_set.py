@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -32,6 +32,9 @@ class cell_set(Step):
         table = resource.to_petl()  # type: ignore
         resource.data = table.update(self.field_name, self.value)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        return lambda data: rows.convert_rows(data, self.field_name, lambda _: self.value)
+
     # Metadata
 
     metadata_profile_patch = {
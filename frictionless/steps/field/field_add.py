@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import itertools
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
-from ...pipeline import Step
+from ... import helpers
+from ...pipeline import IRows, Step, rows
 from ...schema import Field
 
 if TYPE_CHECKING:
@@ -66,10 +67,30 @@ class field_add(Step):
     # Transform
 
     def transform_resource(self, resource: Resource):
-        value = self.value
-        position = self.position
-        function = self.function
         table = resource.to_petl()  # type: ignore
+        index = self.__add_field(resource)
+        if self.incremental:
+            resource.data = table.addrownumbers(field=self.name)  # type: ignore
+        else:
+            value = self.__create_value()
+            resource.data = table.addfield(self.name, value=value, index=index)  # type: ignore
+
+    def transform_rows(self, resource: Resource):
+        index = self.__add_field(resource)
+        if self.incremental:
+            # Row numbers are added as the first field as in PETL
+            def processor(data: IRows):
+                numbers = itertools.count(1)
+                return rows.add_field_rows(
+                    data, self.name, lambda _: next(numbers), index=0
+                )
+
+            return processor
+        value = self.__create_value()
+        return lambda data: rows.add_field_rows(data, self.name, value, index=index)
+
+    def __add_field(self, resource: Resource):
+        position = self.position
         descriptor = deepcopy(self.descriptor) or {}
         if self.name:
             descriptor["name"] = self.name
@@ -78,15 +99,15 @@ class field_add(Step):
             position = position or 1
             descriptor["type"] = "integer"
         field = Field.from_descriptor(descriptor)
-        index = position - 1 if position else None
-        resource.schema.add_field(field, position=position)
-        if self.incremental:
-            resource.data = table.addrownumbers(field=self.name)  # type: ignore
-        else:
-            if self.formula:
-                function = lambda row: simpleeval.simple_eval(self.formula, names=row)  # type: ignore
-            value = value or function  # type: ignore
-            resource.data = table.addfield(self.name, value=value, index=index)  # type: ignore
+        resource.schema.add_field(field, position=position)  # type: ignore
+        return position - 1 if position else None
+
+    def __create_value(self):
+        function = self.function
+        if self.formula:
+            formula = helpers.Formula(self.formula, compound=False)
+            function = lambda row: formula.evaluate(row)  # type: ignore
+        return self.value or function  # type: ignore
 
     # Metadata
 
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, List
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -29,11 +29,20 @@ class field_filter(Step):
 
     def transform_resource(self, resource: Resource):
         table = resource.to_petl()  # type: ignore
-        for name in resource.schema.field_names:
-            if name not in self.names:
-                resource.schema.remove_field(name)
+        self.__filter_fields(resource)
         resource.data = table.cut(*resource.schema.field_names)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        self.__filter_fields(resource)
+        field_names = resource.schema.field_names  # type: ignore
+        select = lambda names: [rows.find_index(names, name) for name in field_names]  # type: ignore
+        return lambda data: rows.cut_rows(data, select)  # type: ignore
+
+    def __filter_fields(self, resource: Resource):
+        for name in resource.schema.field_names:  # type: ignore
+            if name not in self.names:
+                resource.schema.remove_field(name)  # type: ignore
+
     # Metadata
 
     metadata_profile_patch = {
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -38,6 +38,18 @@ class field_move(Step):
         resource.schema.fields.insert(self.position - 1, field)  # type: ignore
         resource.data = table.movefield(self.name, self.position - 1)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        field = resource.schema.remove_field(self.name)  # type: ignore
+        resource.schema.fields.insert(self.position - 1, field)  # type: ignore
+
+        # Select
+        def select(names: List[str]):
+            indexes = [index for index, name in enumerate(names) if name != self.name]
+            indexes.insert(self.position - 1, rows.find_index(names, self.name))
+            return indexes
+
+        return lambda data: rows.cut_rows(data, select)  # type: ignore
+
     # Metadata
 
     metadata_profile_patch = {
@@ -5,7 +5,7 @@ from typing import List
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -26,13 +26,22 @@ class field_remove(Step):
     # Transform
 
     def transform_resource(self, resource):
-        indexes = []
         table = resource.to_petl()
+        indexes = self.__remove_fields(resource)
+        resource.data = table.cutout(*indexes)
+
+    def transform_rows(self, resource):
+        indexes = self.__remove_fields(resource)
+        select = lambda names: [i for i in range(len(names)) if i not in indexes]
+        return lambda data: rows.cut_rows(data, select)
+
+    def __remove_fields(self, resource):
+        indexes = []
         for index, field in list(enumerate(resource.schema.fields)):
             if field.name in self.names:
                 resource.schema.remove_field(field.name)
                 indexes.append(index)
-        resource.data = table.cutout(*indexes)
+        return indexes
 
     # Metadata
 
@@ -4,9 +4,9 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
-from ...pipeline import Step
+from ... import helpers
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ... import types
@@ -59,21 +59,45 @@ class field_update(Step):
     # Transform
 
     def transform_resource(self, resource: Resource):
-        function = self.function
-        pass_row = self.pass_row
         table = resource.to_petl()  # type: ignore
-        descriptor = deepcopy(self.descriptor) or {}
-        new_name = descriptor.get("name")
-        resource.schema.update_field(self.name, descriptor)
-        if self.formula:
-            function = lambda _, row: simpleeval.simple_eval(self.formula, names=row)  # type: ignore
-            pass_row = True
+        new_name = self.__update_field(resource)
+        function, pass_row = self.__create_function()
         if function:
             resource.data = table.convert(self.name, function, pass_row=pass_row)  # type: ignore
         elif self.value:
             resource.data = table.update(self.name, self.value)  # type: ignore
         elif new_name:
             resource.data = table.rename({self.name: new_name})  # type: ignore
+
+    def transform_rows(self, resource: Resource):
+        new_name = (self.descriptor or {}).get("name")
+        function, pass_row = self.__create_function()
+        if function and not callable(function):
+            return None
+        if not function and not self.value and not new_name:
+            return None
+        self.__update_field(resource)
+        if function:
+            return lambda data: rows.convert_rows(
+                data, self.name, function, pass_row=pass_row
+            )
+        elif self.value:
+            return lambda data: rows.convert_rows(data, self.name, lambda _: self.value)
+        return lambda data: rows.rename_rows(data, {self.name: new_name})
+
+    def __create_function(self):
+        function = self.function
+        pass_row = self.pass_row
+        if self.formula:
+            formula = helpers.Formula(self.formula, compound=False)
+            function = lambda _, row: formula.evaluate(row)  # type: ignore
+            pass_row = True
+        return function, pass_row
+
+    def __update_field(self, resource: Resource):
+        descriptor = deepcopy(self.descriptor) or {}
+        new_name = descriptor.get("name")
+        resource.schema.update_field(self.name, descriptor)  # type: ignore
         if new_name and resource.schema.primary_key:
             resource.schema.primary_key.remove(self.name)
             resource.schema.primary_key.append(new_name)
@@ -102,6 +126,7 @@ class field_update(Step):
                 resource.package.metadata_descriptor_initial = (
                     resource.package.to_descriptor()
                 )
+        return new_name
 
     # Metadata
 
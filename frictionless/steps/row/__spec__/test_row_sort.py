@@ -48,6 +48,33 @@ def test_step_row_sort_with_reverse():
     ]
 
 
+def test_step_row_sort_spilled():
+    data = [["id", "name"]] + [
+        [number, f"name{number % 1000}"] for number in range(20000)
+    ]
+    source = TableResource(data=data)
+    pipeline = Pipeline(
+        steps=[
+            steps.row_sort(field_names=["name", "id"], memory=1),
+            steps.row_slice(head=3),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.read_rows() == [
+        {"id": 0, "name": "name0"},
+        {"id": 1000, "name": "name0"},
+        {"id": 2000, "name": "name0"},
+    ]
+
+
+def test_step_row_sort_descriptor():
+    step = Step.from_descriptor(
+        {"type": "row-sort", "fieldNames": ["id"], "memory": 100, "parallel": True}
+    )
+    assert step.memory == 100
+    assert step.parallel is True
+
+
 # Bugs
 
 
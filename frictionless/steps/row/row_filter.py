@@ -3,9 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
-from ...pipeline import Step
+from ... import helpers
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -40,11 +40,19 @@ class row_filter(Step):
         function = self.function
         table = resource.to_petl()  # type: ignore
         if self.formula:
-            # NOTE: review EvalWithCompoundTypes/sync with checks
-            evalclass = simpleeval.EvalWithCompoundTypes  # type: ignore
-            function = lambda row: evalclass(names=row).eval(self.formula)  # type: ignore
+            formula = helpers.Formula(self.formula)
+            function = lambda row: formula.evaluate(row)  # type: ignore
         resource.data = table.select(function)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        function = self.function
+        if self.formula:
+            formula = helpers.Formula(self.formula)
+            function = lambda row: formula.evaluate(row)  # type: ignore
+        if not callable(function):
+            return None
+        return lambda data: rows.filter_rows(data, function)  # type: ignore
+
     # Metadata
 
     metadata_profile_patch = {
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 from ...platform import platform
 
 if TYPE_CHECKING:
@@ -49,6 +50,15 @@ class row_search(Step):
         else:
             resource.data = search(table, self.regex)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        regex = re.compile(self.regex)
+        if self.field_name:
+            match = lambda row: regex.search(str(row[self.field_name]))  # type: ignore
+        else:
+            match = lambda row: any(regex.search(str(cell)) for cell in row)  # type: ignore
+        function = lambda row: bool(match(row)) != self.negate  # type: ignore
+        return lambda data: rows.filter_rows(data, function)  # type: ignore
+
     # Metadata
 
     metadata_profile_patch = {
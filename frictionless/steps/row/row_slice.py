@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -60,6 +60,13 @@ class row_slice(Step):
         else:
             resource.data = table.rowslice(self.start, self.stop, self.step)  # type: ignore
 
+    def transform_rows(self, resource: Resource):
+        if self.head:
+            return lambda data: rows.slice_rows(data, self.head)
+        elif self.tail:
+            return lambda data: rows.slice_rows(data, tail=self.tail)
+        return lambda data: rows.slice_rows(data, self.start, self.stop, self.step)
+
     # Metadata
 
     metadata_profile_patch = {  # type: ignore
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -33,11 +33,31 @@ class row_sort(Step):
     The sort will be reversed if it is set to True.
     """
 
+    memory: Optional[int] = None
+    """
+    Memory budget of the sort in MB. If the rows don't fit in it,
+    sorted runs of rows are spilled to disk and merged.
+    """
+
+    parallel: bool = False
+    """
+    Sort the runs of rows in worker processes.
+    """
+
     # Transform
 
     def transform_resource(self, resource: Resource):
         table = resource.to_petl()  # type: ignore
-        resource.data = table.sort(self.field_names, reverse=self.reverse)  # type: ignore
+        resource.data = rows.create_view(self.transform_rows(resource), table)
+
+    def transform_rows(self, resource: Resource):
+        return lambda data: rows.sort_rows(
+            data,
+            self.field_names,
+            reverse=self.reverse,
+            memory=self.memory,
+            parallel=self.parallel,
+        )
 
     # Metadata
 
@@ -46,5 +66,7 @@ class row_sort(Step):
         "properties": {
             "fieldNames": {"type": "array"},
             "reverse": {},
+            "memory": {"type": "integer"},
+            "parallel": {"type": "boolean"},
         },
     }
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -36,14 +36,16 @@ class row_subset(Step):
 
     def transform_resource(self, resource: Resource):
         table = resource.to_petl()  # type: ignore
+        key = [self.field_name] if self.field_name else None
+        table = rows.create_view(rows.sort_rows, table, key)
         if self.subset == "conflicts":
-            resource.data = table.conflicts(self.field_name)  # type: ignore
+            resource.data = table.conflicts(self.field_name, presorted=True)  # type: ignore
         elif self.subset == "distinct":
-            resource.data = table.distinct(self.field_name)  # type: ignore
+            resource.data = table.distinct(self.field_name, presorted=True)  # type: ignore
         elif self.subset == "duplicates":
-            resource.data = table.duplicates(self.field_name)  # type: ignore
+            resource.data = table.duplicates(self.field_name, presorted=True)  # type: ignore
         elif self.subset == "unique":
-            resource.data = table.unique(self.field_name)  # type: ignore
+            resource.data = table.unique(self.field_name, presorted=True)  # type: ignore
 
     # Metadata
 
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 from ...platform import platform
 
 if TYPE_CHECKING:
@@ -42,11 +42,16 @@ class row_ungroup(Step):
 
     def transform_resource(self, resource: Resource):
         table = resource.to_petl()  # type: ignore
-        function = getattr(platform.petl, f"groupselect{self.selection}")
-        if self.selection in ["first", "last"]:
-            resource.data = function(table, self.group_name)
-        else:
-            resource.data = function(table, self.group_name, self.value_name)
+        selection = self.selection
+        if selection in ["min", "max"]:
+            # The rows are sorted by value and then by group (the sort is stable)
+            reverse = selection == "max"
+            key = [self.value_name]
+            table = rows.create_view(rows.sort_rows, table, key, reverse=reverse)
+            selection = "first"
+        table = rows.create_view(rows.sort_rows, table, [self.group_name])
+        function = getattr(platform.petl, f"groupselect{selection}")
+        resource.data = function(table, self.group_name, presorted=True)
 
     # Metadata
 
@@ -1,4 +1,6 @@
-from frictionless import Pipeline, Step, steps
+import pytest
+
+from frictionless import Pipeline, Schema, Step, steps
 from frictionless.resources import TableResource
 
 # General
@@ -256,6 +258,90 @@ def test_step_table_join_hash_is_true():
     ]
 
 
+def test_step_table_join_natural():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.table_join(
+                resource=TableResource(data=[["id", "note"], [3, "beer"], [1, "vine"]]),
+            ),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.schema.to_descriptor() == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string"},
+            {"name": "population", "type": "integer"},
+            {"name": "note", "type": "string"},
+        ]
+    }
+    assert target.read_rows() == [
+        {"id": 1, "name": "germany", "population": 83, "note": "vine"},
+        {"id": 3, "name": "spain", "population": 47, "note": "beer"},
+    ]
+
+
+@pytest.mark.parametrize("use_hash", [False, True])
+def test_step_table_join_spilled(use_hash):
+    source = TableResource(
+        data=[["id", "name"]] + [[number, f"name{number}"] for number in range(20000)]
+    )
+    pipeline = Pipeline(
+        steps=[
+            steps.table_join(
+                resource=TableResource(
+                    data=[["id", "note"]]
+                    + [[number * 2, f"note{number}"] for number in range(20000)]
+                ),
+                field_name="id",
+                mode="outer",
+                use_hash=use_hash,
+                memory=1,
+            ),
+        ],
+    )
+    target = source.transform(pipeline)
+    cells = target.read_cells()
+    assert cells[0] == ["id", "name", "note"]
+    if use_hash:
+        cells[1:] = sorted(cells[1:], key=lambda cells: cells[0])
+    assert cells[1:] == [
+        [
+            number,
+            f"name{number}" if number < 20000 else None,
+            f"note{number // 2}" if number % 2 == 0 else None,
+        ]
+        for number in range(40000)
+        if number < 20000 or number % 2 == 0
+    ]
+
+
+@pytest.mark.parametrize("mode, count", [("inner", 1), ("left", 2), ("outer", 4)])
+def test_step_table_join_invalid_key_cells(mode, count):
+    schema = {"fields": [{"name": "id", "type": "integer"}, {"name": "name"}]}
+    source = TableResource(data=[["id", "name"], ["1", "a"], ["abc", "b"]])
+    source.schema = Schema.from_descriptor(schema)
+    schema = {"fields": [{"name": "id", "type": "integer"}, {"name": "note"}]}
+    other = TableResource(data=[["id", "note"], ["1", "x"], ["", "y"], ["xyz", "z"]])
+    other.schema = Schema.from_descriptor(schema)
+    pipeline = Pipeline(
+        steps=[steps.table_join(resource=other, field_name="id", mode=mode)],
+    )
+    target = source.transform(pipeline)
+    cells = target.read_cells()[1:]
+    assert ["1", "a", "x"] in cells
+    assert len(cells) == count
+
+
+def test_step_table_join_from_descriptor_with_memory():
+    step = Step.from_descriptor(
+        {"type": "table-join", "resource": "data", "fieldName": "id", "memory": 100}
+    )
+    assert isinstance(step, steps.table_join)
+    assert step.memory == 100
+
+
 # Bugs
 
 
@@ -4,7 +4,7 @@ from typing import Union
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import Step, rows
 from ...platform import platform
 from ...resource import Resource
 
@@ -50,15 +50,16 @@ class table_diff(Step):
         source.infer()
         view1 = target.to_petl()  # type: ignore
         view2 = source.to_petl()  # type: ignore
-        function = (  # type: ignore
-            platform.petl.recordcomplement  # type: ignore
-            if self.ignore_order
-            else platform.petl.complement  # type: ignore
-        )
         # NOTE: we might raise an error for ignore/hash
-        if self.use_hash and not self.ignore_order:
-            function = platform.petl.hashcomplement  # type: ignore
-        resource.data = function(view1, view2)  # type: ignore
+        if self.ignore_order:
+            resource.data = platform.petl.recordcomplement(view1, view2)  # type: ignore
+        elif self.use_hash:
+            resource.data = platform.petl.hashcomplement(view1, view2)  # type: ignore
+        else:
+            # The views are sorted by the external sorter (all the fields)
+            view1 = rows.create_view(rows.sort_rows, view1)
+            view2 = rows.create_view(rows.sort_rows, view2)
+            resource.data = platform.petl.complement(view1, view2, presorted=True)  # type: ignore
 
     # Metadata
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Any, List, Optional, Union
 
 import attrs
 
-from ...pipeline import Step
+from ... import errors, settings
+from ...exception import FrictionlessException
+from ...pipeline import Step, rows
 from ...platform import platform
 from ...resource import Resource
+from ...table import HashJoiner
 
 DEFAULT_MODE = "inner"
 
@@ -36,7 +39,8 @@ class table_join(Step):
 
     use_hash: bool = False
     """
-    Specify whether to use hash or not. If True, an alternative implementation of join will be used.
+    Specify whether to use hash or not. If True, the joined rows follow the order
+    of the rows in the resource being transformed instead of the key order.
     """
 
     mode: str = DEFAULT_MODE
@@ -45,6 +49,12 @@ class table_join(Step):
     "negate". The default mode is "inner".
     """
 
+    memory: Optional[int] = None
+    """
+    Memory budget of the join in MB. If the rows of the joined resource don't
+    fit in it, both tables are partitioned to disk and joined partition by partition.
+    """
+
     # Transform
 
     def transform_resource(self, resource: Resource):
@@ -54,34 +64,109 @@ class table_join(Step):
             assert target.package
             source = target.package.get_resource(source)
         source.infer()  # type: ignore
-        view1 = target.to_petl()  # type: ignore
-        view2 = source.to_petl()  # type: ignore
+
+        # Cross
+        if self.mode == "cross":
+            view1 = target.to_petl()  # type: ignore
+            view2 = source.to_petl()  # type: ignore
+            for field in source.schema.fields:  # type: ignore
+                target.schema.fields.append(field.to_copy())
+            resource.data = platform.petl.crossjoin(view1, view2)  # type: ignore
+            return
+
+        # Key
+        field_names = [self.field_name] if self.field_name else []
+        if not self.field_name:
+            for name in target.schema.field_names:  # type: ignore
+                if name in source.schema.field_names:  # type: ignore
+                    field_names.append(name)
+            if not field_names:
+                note = "there are no fields in common for a natural join"
+                raise FrictionlessException(errors.StepError(note=note))
+
+        # Data
+        current = target.to_copy()
+        other = source.to_copy()
+        resource.data = rows.create_view(self.__join, current, other, field_names)
+
+        # Meta
         if self.mode not in ["negate"]:
             for field in source.schema.fields:  # type: ignore
-                if field.name != self.field_name:
+                if field.name not in field_names:
                     target.schema.fields.append(field.to_copy())
-        if self.mode == "inner":
-            join = platform.petl.hashjoin if self.use_hash else platform.petl.join  # type: ignore
-            resource.data = join(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "left":
-            leftjoin = (  # type: ignore
-                platform.petl.hashleftjoin if self.use_hash else platform.petl.leftjoin  # type: ignore
+
+    # Internal
+
+    def __join(self, target: Resource, source: Resource, field_names: List[str]):
+        with target, source:
+            labels1 = self.__read_labels(target)
+            labels2 = self.__read_labels(source)
+            indexes1 = self.__read_indexes(labels1, field_names)
+            indexes2 = self.__read_indexes(labels2, field_names)
+            values = [index for index in range(len(labels2)) if index not in indexes2]
+            if self.mode == "negate":
+                yield labels1
+            else:
+                yield labels1 + [labels2[index] for index in values]
+            joiner = HashJoiner(
+                indexes1,
+                width=len(labels1),
+                extra=len(values),
+                mode=self.mode,
+                ordered=not self.use_hash,
+                memory=self.memory or settings.DEFAULT_LIMIT_MEMORY,
             )
-            resource.data = leftjoin(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "right":
-            rightjoin = (  # type: ignore
-                platform.petl.hashrightjoin if self.use_hash else platform.petl.rightjoin  # type: ignore
+            yield from joiner.join(
+                self.__read_keyed_rows(target, indexes1),
+                self.__read_keyed_rows(source, indexes2, values=values),
             )
-            resource.data = rightjoin(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "outer":
-            resource.data = platform.petl.outerjoin(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "cross":
-            resource.data = platform.petl.crossjoin(view1, view2)  # type: ignore
-        elif self.mode == "negate":
-            antijoin = (  # type: ignore
-                platform.petl.hashantijoin if self.use_hash else platform.petl.antijoin  # type: ignore
+
+    def __read_labels(self, resource: Resource) -> List[str]:
+        if resource.header.missing:  # type: ignore
+            return resource.schema.field_names  # type: ignore
+        return resource.header.labels  # type: ignore
+
+    def __read_indexes(self, labels: List[str], field_names: List[str]) -> List[int]:
+        indexes: List[int] = []
+        for name in field_names:
+            if name not in labels:
+                note = f'join field "{name}" is not found'
+                raise FrictionlessException(errors.StepError(note=note))
+            indexes.append(labels.index(name))
+        return indexes
+
+    def __read_keyed_rows(
+        self,
+        resource: Resource,
+        indexes: List[int],
+        *,
+        values: Optional[List[int]] = None,
+    ):
+        # The key cells are cast by the schema while the other cells are
+        # passed as they are (as PETL's views of the resources do).
+        # A key cell failing to cast is kept raw to not match other invalid cells
+        fields = resource.header.get_expected_fields()  # type: ignore
+        readers = [
+            fields[index].create_cell_reader() if index < len(fields) else None
+            for index in indexes
+        ]
+        stream = resource.dialect.read_enumerated_content_stream(resource.cell_stream)  # type: ignore
+        for _, cells in stream:
+            size = len(cells)
+            key: List[Any] = []
+            for index, reader in zip(indexes, readers):
+                cell = cells[index] if index < size else None
+                if reader:
+                    value, notes = reader(cell)
+                    cell = cell if notes else value
+                key.append(cell)
+            if values is None:
+                yield tuple(key), cells
+                continue
+            yield (
+                tuple(key),
+                tuple(cells[index] if index < size else None for index in values),
             )
-            resource.data = antijoin(view1, view2, self.field_name)  # type: ignore
 
     # Metadata
 
@@ -95,6 +180,7 @@ class table_join(Step):
                 "enum": ["inner", "left", "right", "outer", "cross", "negate"],
             },
             "hash": {},
+            "memory": {"type": "integer"},
         },
     }
 
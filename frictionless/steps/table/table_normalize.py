@@ -4,7 +4,9 @@ from typing import TYPE_CHECKING
 
 import attrs
 
-from ...pipeline import Step
+from ...pipeline import IRows, Step
+from ...table import Header, Row, create_cell_handlers
+from ...table import fields_match as fields_match_module
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -35,3 +37,33 @@ class table_normalize(Step):
 
         # Meta
         resource.data = data
+
+    def transform_rows(self, resource: Resource):
+        if not resource.dialect.header:  # type: ignore
+            return None
+        schema = resource.schema.to_copy()  # type: ignore
+        dialect = resource.dialect  # type: ignore
+        declared = schema.fields_match if schema.has_defined("fields_match") else None
+        fields_match = fields_match_module.resolve(
+            declared, schema_sync=resource.detector.schema_sync
+        )
+
+        # Cast the cells as the resource would do reading the rows
+        def processor(data: IRows):
+            data = iter(data)
+            labels = next(data, None)
+            if labels is None:
+                return
+            header = Header(
+                list(labels),
+                fields=schema.fields,
+                row_numbers=dialect.header_rows,
+                ignore_case=not dialect.header_case,
+                fields_match=fields_match,
+            )
+            handlers = create_cell_handlers(header.get_expected_fields())
+            yield header.to_list()
+            for row_number, cells in enumerate(data, start=2):
+                yield Row(list(cells), handlers=handlers, row_number=row_number).to_list()
+
+        return processor
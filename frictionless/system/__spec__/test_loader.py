@@ -0,0 +1,30 @@
+import gzip
+import io
+
+from frictionless.system.loader import ByteStreamWithPrefixReplay
+
+# General
+
+
+def test_byte_stream_with_prefix_replay():
+    data = b"id,name\n1,english\n2,german\n"
+    source = io.BytesIO(gzip.compress(data))
+    file = gzip.open(source)
+    stream = ByteStreamWithPrefixReplay(file, size=10, sources=[source])
+    assert stream.read(7) == b"id,name"
+    assert stream.seek(0) == 0
+    assert stream.read1(3) == b"id,"
+    assert stream.read(8) == b"name\n1,e"
+    assert stream.read() == b"nglish\n2,german\n"
+    assert file.tell() == len(data)
+    stream.close()
+    assert source.closed
+
+
+def test_byte_stream_with_prefix_replay_exceeded():
+    source = io.BytesIO(gzip.compress(b"id,name\n1,english\n2,german\n"))
+    stream = ByteStreamWithPrefixReplay(gzip.open(source), size=4, sources=[source])
+    assert stream.read(7) == b"id,name"
+    assert stream.seek(0) == 0
+    assert stream.read(7) == b"id,name"
+    assert stream.tell() == 7
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import atexit
-import hashlib
 import io
 import os
 import shutil
 import tempfile
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, List, Optional, cast
 
-from .. import errors, settings
+from .. import errors, helpers, settings
 from ..exception import FrictionlessException
 from ..platform import platform
 
@@ -193,6 +192,7 @@ class Loader:
         # ZIP compression
         if self.resource.compression == "zip":
             # Remote
+            # A zip archive requires random access so it's downloaded
             if self.remote:
                 self.remote = False
                 target = tempfile.NamedTemporaryFile()
@@ -200,58 +200,43 @@ class Loader:
                 target.seek(0)
                 byte_stream = target  # type: ignore
             # Stats
+            # The archive is read randomly so the stats are calculated beforehand
             else:
                 bytes = True
                 while bytes:
                     bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)  # type: ignore
                 byte_stream.seek(0)
             # Unzip
-            with platform.zipfile.ZipFile(byte_stream) as archive:
-                name = self.resource.innerpath or archive.namelist()[0]
-                if not name:
-                    error = errors.Error(note="the archive is empty")
-                    raise FrictionlessException(error)
-                # TODO: enable typing when resource.innerpath is fixed
-                with archive.open(name) as file:  # type: ignore
-                    target = tempfile.NamedTemporaryFile()
-                    shutil.copyfileobj(file, target)
-                    target.seek(0)
-                byte_stream = target  # type: ignore
-                self.resource.innerpath = name
-            return byte_stream
-
-        # GZip compression
+            archive = platform.zipfile.ZipFile(byte_stream)
+            name = self.resource.innerpath or archive.namelist()[0]
+            if not name:
+                error = errors.Error(note="the archive is empty")
+                raise FrictionlessException(error)
+            # TODO: enable typing when resource.innerpath is fixed
+            file = archive.open(name)  # type: ignore
+            self.resource.innerpath = name
+            return ByteStreamWithPrefixReplay(
+                file,
+                size=self.resource.detector.buffer_size,
+                sources=[archive, byte_stream],
+            )
+
+        # GZip/bzip2/XZ compression
+        # Compressed bytes are streamed only once: the stats are calculated
+        # while feeding the decompressor (see ByteStreamWithStatsHandling)
+        module = None
         if self.resource.compression == "gz":
-            # Stats
-            if not self.remote:
-                bytes = True
-                while bytes:
-                    bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)  # type: ignore
-                byte_stream.seek(0)
-            byte_stream = platform.gzip.open(byte_stream)  # type: ignore
-            return byte_stream
-
-        # bzip2 compression
-        if self.resource.compression == "bz2":
-            # Stats
-            if not self.remote:
-                bytes = True
-                while bytes:
-                    bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)  # type: ignore
-                byte_stream.seek(0)
-            byte_stream = platform.bz2.open(byte_stream)  # type: ignore
-            return byte_stream
-
-        # XZ compression
-        if self.resource.compression == "xz":
-            # Stats
-            if not self.remote:
-                bytes = True
-                while bytes:
-                    bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)  # type: ignore
-                byte_stream.seek(0)
-            byte_stream = platform.lzma.open(byte_stream)  # type: ignore
-            return byte_stream
+            module = platform.gzip
+        elif self.resource.compression == "bz2":
+            module = platform.bz2
+        elif self.resource.compression == "xz":
+            module = platform.lzma
+        if module:
+            return ByteStreamWithPrefixReplay(
+                module.open(byte_stream),  # type: ignore
+                size=self.resource.detector.buffer_size,
+                sources=[byte_stream],
+            )
 
         # Not supported compression
         note = f'compression "{self.resource.compression}" is not supported'
@@ -338,8 +323,11 @@ class ByteStreamWithStatsHandling:
     def __init__(self, byte_stream: types.IByteStream, *, resource: Resource):
         self.__byte_stream = byte_stream
         self.__resource = resource
-        self.__md5 = hashlib.new("md5")
-        self.__sha256 = hashlib.new("sha256")
+        self.__hashers = {
+            algorithm: helpers.create_hasher(algorithm)
+            for algorithm in resource.detector.detect_hashing(resource)
+        }
+        self.__position = 0
         self.__bytes = 0
 
     def __getattr__(self, name: str):
@@ -356,19 +344,137 @@ class ByteStreamWithStatsHandling:
     def closed(self):
         return self.__byte_stream.closed
 
+    def read(self, size: Optional[int] = -1):
+        size = -1 if size is None else size
+        chunk = cast(bytes, self.__byte_stream.read(size))  # type: ignore
+        return self.__process(chunk, size=size)
+
     def read1(self, size: Optional[int] = -1):
         size = -1 if size is None else size
         chunk = cast(bytes, self.__byte_stream.read1(size))  # type: ignore
+        return self.__process(chunk, size=size)
+
+    def seek(self, offset: int, *whence: int):
+        position = self.__byte_stream.seek(offset, *whence)
+        # Not all the custom streams return the position
+        if position is None:
+            if whence and whence[0] != io.SEEK_SET:
+                position = self.__byte_stream.tell()
+            position = offset if position is None else position
+        self.__position = position
+        return position
+
+    def __process(self, chunk: bytes, *, size: int):
+        start = self.__position
+        self.__position += len(chunk)
 
         # Calculate
-        self.__md5.update(chunk)
-        self.__sha256.update(chunk)
-        self.__bytes += len(chunk)
+        # Every byte is counted only once even if the stream is re-read
+        # (e.g. after buffering) or read randomly (e.g. by a decompressor)
+        if start <= self.__bytes < self.__position:
+            data = memoryview(chunk)[self.__bytes - start :]
+            for hasher in self.__hashers.values():
+                hasher.update(data)
+            self.__bytes = self.__position
 
         # Store (hash on EOF)
-        if size == -1 or not chunk:
-            self.__resource.stats.md5 = self.__md5.hexdigest()
-            self.__resource.stats.sha256 = self.__sha256.hexdigest()
+        if (size == -1 or not chunk) and self.__position == self.__bytes:
+            self.__resource.stats.set_hashes(
+                {name: hasher.hexdigest() for name, hasher in self.__hashers.items()}
+            )
         self.__resource.stats.bytes = self.__bytes
 
         return chunk
+
+
+class ByteStreamWithPrefixReplay:
+    """Decompressed byte stream replaying its prefix after `seek(0)`
+
+    Rewinding a decompressor means reading the compressed bytes again, so
+    the first bytes read (e.g. the buffer for detection) are kept in memory.
+    If more than `size` bytes have been read it falls back to a real seek.
+    """
+
+    def __init__(self, byte_stream: Any, *, size: int, sources: List[Any]):
+        self.__byte_stream = byte_stream
+        self.__size = size
+        self.__sources = sources
+        self.__prefix: Optional[bytearray] = bytearray()
+        self.__position = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self.__byte_stream, name)
+
+    def __iter__(self):  # type: ignore
+        while True:
+            bytes = self.read1(settings.DEFAULT_BUFFER_SIZE)
+            if not bytes:
+                break
+            yield from bytes.splitlines(keepends=True)
+
+    @property
+    def closed(self):
+        return self.__byte_stream.closed
+
+    def close(self):
+        self.__byte_stream.close()
+        for source in self.__sources:
+            source.close()
+
+    def readable(self):
+        return True
+
+    def read(self, size: Optional[int] = -1):
+        size = -1 if size is None else size
+        chunk = self.__read_prefix(size)
+        if size < 0:
+            return chunk + self.__read_stream(-1, read=self.__byte_stream.read)
+        if len(chunk) < size:
+            read = self.__byte_stream.read
+            chunk += self.__read_stream(size - len(chunk), read=read)
+        return chunk
+
+    def read1(self, size: Optional[int] = -1):
+        size = -1 if size is None else size
+        chunk = self.__read_prefix(size)
+        if chunk:
+            return chunk
+        return self.__read_stream(size, read=self.__byte_stream.read1)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if self.__prefix is not None:
+            if offset == 0 and whence == io.SEEK_SET:
+                self.__position = 0
+                return 0
+            self.__byte_stream.seek(self.__position)
+            self.__prefix = None
+        position = self.__byte_stream.seek(offset, whence)
+        if position == 0:
+            self.__prefix = bytearray()
+            self.__position = 0
+        return position
+
+    def tell(self):
+        if self.__prefix is not None:
+            return self.__position
+        return self.__byte_stream.tell()
+
+    def __read_prefix(self, size: int) -> bytes:
+        prefix = self.__prefix
+        if prefix is None or self.__position >= len(prefix):
+            return b""
+        end = len(prefix) if size < 0 else self.__position + size
+        chunk = bytes(prefix[self.__position : end])
+        self.__position += len(chunk)
+        return chunk
+
+    def __read_stream(self, size: int, *, read: Any) -> bytes:
+        chunk = cast(bytes, read(size))
+        prefix = self.__prefix
+        if prefix is not None:
+            if len(prefix) + len(chunk) <= self.__size:
+                prefix.extend(chunk)
+                self.__position += len(chunk)
+            else:
+                self.__prefix = None
+        return chunk
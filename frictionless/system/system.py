@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import os
 import pkgutil
+import threading
 from collections import OrderedDict
 from contextlib import contextmanager
 from functools import cached_property
@@ -75,6 +76,7 @@ class System:
     def __init__(self):
         self.__dynamic_plugins: OrderedDict[str, Plugin] = OrderedDict()
         self.__http_session = None
+        self.__thread = threading.local()
 
     @property
     def http_session(self):
@@ -82,10 +84,14 @@ class System:
 
         This method will return a new session or the session
         from `system.use_http_session` context manager
+        (or from `system.use_thread_context` in its thread)
 
         Returns:
             requests.Session: a HTTP session
         """
+        http_session = getattr(self.__thread, "http_session", None)
+        if http_session is not None:
+            return http_session
         if not self.__http_session:
             http_session = platform.requests.Session()
             http_session.headers.update(settings.DEFAULT_HTTP_HEADERS)
@@ -184,6 +190,20 @@ class System:
         self.standards = current_standards
         self.__http_session = current_http_session
 
+    @contextmanager
+    def use_thread_context(self, *, http_session: Optional[Any] = None):
+        """Use a context in the current thread only
+
+        For example, worker threads use their own HTTP sessions
+        as a session is not thread-safe.
+        """
+        current_http_session = getattr(self.__thread, "http_session", None)
+        self.__thread.http_session = http_session
+        try:
+            yield self
+        finally:
+            self.__thread.http_session = current_http_session
+
     # Hooks
 
     def create_adapter(
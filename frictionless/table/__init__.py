@@ -1,6 +1,10 @@
 from . import fields_match
+from .batch import RowBatch
 from .header import Header
+from .index import IntegrityIndex, create_integrity_index
+from .joiner import HashJoiner
 from .lookup import Lookup
 from .row import Row, create_cell_handlers
+from .sorter import ExternalSorter
 from .table import Table
 from .types import *
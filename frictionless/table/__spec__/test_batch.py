@@ -0,0 +1,87 @@
+import pytest
+
+from frictionless import Schema, fields, settings
+from frictionless.resources import TableResource
+from frictionless.table import RowBatch, create_cell_handlers
+
+# General
+
+
+def test_batch():
+    handlers = create_cell_handlers(
+        [fields.IntegerField(name="id"), fields.StringField(name="name")]
+    )
+    batch = RowBatch(
+        [["1", "english"], ["bad", "中国人"], [], ["3", "german", "extra"]],
+        handlers=handlers,
+        row_numbers=[2, 3, 4, 5],
+    )
+    assert len(batch) == 4
+    assert batch.field_names == ["id", "name"]
+    assert batch.row_numbers == [2, 3, 4, 5]
+    assert batch.columns == {
+        "id": [1, None, None, 3],
+        "name": ["english", "中国人", None, "german"],
+    }
+    assert batch.valid is False
+    assert [(error.row_number, error.type) for error in batch.errors] == [
+        (3, "type-error"),
+        (4, "blank-row"),
+        (5, "extra-cell"),
+    ]
+
+
+def test_batch_rows():
+    handlers = create_cell_handlers([fields.IntegerField(name="id")])
+    batch = RowBatch([["1"], ["bad"], [""]], handlers=handlers, row_numbers=[2, 3, 4])
+    rows = list(batch)
+    assert rows == [{"id": 1}, {"id": None}, {"id": None}]
+    assert rows[0].valid is True
+    assert rows[1].error_cells == {"id": "bad"}
+    assert rows[2].blank_cells == {"id": ""}
+    assert rows[1].errors == batch.get_errors(1)
+    assert batch[1] is rows[1]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "data/table.csv",
+        "data/invalid.csv",
+        "data/capital-invalid.csv",
+        "data/unique-field.csv",
+    ],
+)
+def test_batch_stream_same_as_row_stream(path):
+    options = {}
+    if path == "data/unique-field.csv":
+        options["schema"] = "data/unique-field.json"
+    with TableResource(path=path, **options) as resource:
+        rows = resource.read_rows()
+        row_errors = [error for row in rows for error in row.errors]
+    with TableResource(path=path, **options) as resource:
+        batches = list(resource.batch_stream)
+        batch_errors = [error for batch in batches for error in batch.errors]
+        assert resource.stats.rows == len(rows)
+    assert [row for batch in batches for row in batch] == rows
+    assert [error.to_descriptor() for error in batch_errors] == [
+        error.to_descriptor() for error in row_errors
+    ]
+
+
+def test_batch_stream_batch_size(monkeypatch):
+    monkeypatch.setattr(settings, "DEFAULT_BATCH_SIZE", 2)
+    schema = Schema.from_descriptor(
+        {"fields": [{"name": "id", "type": "integer"}], "primaryKey": ["id"]}
+    )
+    data = [["id"], ["1"], ["2"], ["1"], ["3"], ["2"]]
+    with TableResource(data=data, schema=schema) as resource:
+        batches = list(resource.batch_stream)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [batch.row_numbers for batch in batches] == [[2, 3], [4, 5], [6]]
+        assert [error.note for error in batches[1].errors] == [
+            "the same as in the row at position 2"
+        ]
+        assert [error.note for error in batches[2].errors] == [
+            "the same as in the row at position 3"
+        ]
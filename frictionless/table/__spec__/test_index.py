@@ -0,0 +1,153 @@
+from decimal import Decimal
+
+import pytest
+
+from frictionless import Detector, FrictionlessException, Schema
+from frictionless.resources import TableResource
+from frictionless.table import create_integrity_index
+from frictionless.table.index import (
+    CompactIndex,
+    DiskIndex,
+    MappedIndex,
+    MemoryIndex,
+    hash_key,
+)
+from frictionless.table.lookup import ReferenceCache
+
+# General
+
+
+@pytest.mark.parametrize("type", ["memory", "compact", "disk"])
+def test_integrity_index(type):
+    index = create_integrity_index(type)
+    assert index.update("a", 2) is None
+    assert index.update("b", 3) is None
+    assert index.update("a", 4) == 2
+    assert index.update("a", 5) == 4
+    assert index.update(("a", 1), 6) is None
+    assert index.update(("a", 1), 7) == 6
+    index.close()
+
+
+@pytest.mark.parametrize("type", ["memory", "compact", "disk"])
+def test_integrity_index_equal_numbers(type):
+    index = create_integrity_index(type)
+    assert index.update(Decimal("1.0"), 2) is None
+    assert index.update(Decimal("1.00"), 3) == 2
+    assert index.update(1, 4) == 3
+    assert index.update(Decimal("0.5"), 5) is None
+    assert index.update(0.5, 6) == 5
+    index.close()
+
+
+@pytest.mark.parametrize("type", ["memory", "compact", "disk"])
+def test_integrity_index_contains(type):
+    index = create_integrity_index(type, memory=0)
+    for number in range(2000):
+        index.update((str(number),), number + 1)
+    assert ("0",) in index
+    assert ("2000",) not in index
+    assert index.get(("10",)) == 11
+    assert index.get(("2000",)) is None
+    keys = [(str(number),) for number in range(2010)]
+    assert index.contains_many(keys) == [True] * 2000 + [False] * 10
+    index.close()
+
+
+def test_integrity_index_not_supported():
+    with pytest.raises(FrictionlessException) as excinfo:
+        create_integrity_index("bad")
+    error = excinfo.value.error
+    assert error.type == "detector-error"
+    assert error.note == 'integrity index "bad" is not supported'
+
+
+def test_compact_index_resize():
+    index = CompactIndex(capacity=4)
+    for number in range(1000):
+        assert index.update(number, number + 1) is None
+    assert len(index) == 1000
+    for number in range(1000):
+        assert index.update(number, number + 2000) == number + 1
+
+
+def test_memory_index_hash():
+    index = MemoryIndex()
+    high, low = hash_key(("a", 1))
+    assert index.update_hash(high, low, 1) is None
+    assert index.update_hash(high, low, 2) == 1
+    assert index.get((high << 64) | low) == 2
+    assert index.get((high, low)) is None
+
+
+def test_disk_index_spill():
+    index = DiskIndex(memory=0)
+    for number in range(5000):
+        assert index.update(str(number), number + 1) is None
+    assert index.spilled
+    for number in range(5000):
+        assert index.update(str(number), number + 10000) == number + 1
+    assert index.update("0", 20000) == 10000
+    index.close()
+
+
+def test_mapped_index(tmpdir):
+    compact = CompactIndex()
+    for number in range(1000):
+        compact.update((str(number), number), number + 1)
+    path = str(tmpdir.join("index"))
+    compact.save(path)
+    index = MappedIndex(path)
+    assert len(index) == 1000
+    for number in range(1000):
+        assert index.get((str(number), number)) == number + 1
+    assert index.get(("1", 2)) is None
+    assert index.contains_many([("1", 1), ("1", 2)]) == [True, False]
+    index.close()
+
+
+def test_mapped_index_empty(tmpdir):
+    path = str(tmpdir.join("index"))
+    CompactIndex().save(path)
+    index = MappedIndex(path)
+    assert len(index) == 0
+    assert "a" not in index
+    index.close()
+
+
+@pytest.mark.parametrize("type", ["memory", "compact", "disk"])
+def test_integrity_index_row_stream(type):
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "code", "type": "string", "constraints": {"unique": True}},
+            ],
+            "primaryKey": ["id"],
+        }
+    )
+    data = [["id", "code"], ["1", "a"], ["2", "b"], ["1", "c"], ["3", "a"], ["1", "d"]]
+    detector = Detector(integrity_index=type, integrity_memory=0)
+    with TableResource(data=data, schema=schema, detector=detector) as resource:
+        errors = [error for row in resource.row_stream for error in row.errors]
+    assert [(error.type, error.row_number, error.note) for error in errors] == [
+        ("primary-key", 4, "the same as in the row at position 2"),
+        ("unique-error", 5, "the same as in the row at position 2"),
+        ("primary-key", 6, "the same as in the row at position 4"),
+    ]
+
+
+def test_reference_cache_replace_not_closed():
+    cache = ReferenceCache()
+    index = DiskIndex(memory=0)
+    for number in range(5000):
+        index.update((str(number),), number + 1)
+    cache.set("countries", ("code",), index, fingerprint="old")
+    cache.set("countries", ("code",), DiskIndex(), fingerprint="new")
+    assert cache.get("countries", ("code",), fingerprint="old") is None
+    assert index.spilled
+    assert ("0",) in index
+    cache.remove("countries", ("code",))
+    assert len(cache) == 0
+    assert ("0",) in index
+    index.close()
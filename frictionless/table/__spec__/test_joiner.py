@@ -0,0 +1,88 @@
+import random
+import tempfile
+
+import petl
+import pytest
+
+from frictionless.table import HashJoiner
+
+# General
+
+
+def create_tables(count, *, seed=1):
+    rand = random.Random(seed)
+    left = [[number, rand.randint(0, count), f"left{number}"] for number in range(count)]
+    right = [[rand.randint(0, count), f"right{number}"] for number in range(count // 2)]
+    return left, right
+
+
+def join_with_joiner(left, right, *, mode, ordered=True, memory=1000):
+    joiner = HashJoiner([1], width=3, extra=1, mode=mode, ordered=ordered, memory=memory)
+    keyed1 = (((cells[1],), cells) for cells in left)
+    keyed2 = (((cells[0],), tuple(cells[1:])) for cells in right)
+    return [list(cells) for cells in joiner.join(keyed1, keyed2)]
+
+
+def join_with_petl(left, right, *, mode):
+    table1 = [["id", "key", "name"]] + left
+    table2 = [["key", "note"]] + right
+    if mode == "negate":
+        table = petl.antijoin(table1, table2, "key")
+    else:
+        join = dict(
+            inner=petl.join,
+            left=petl.leftjoin,
+            right=petl.rightjoin,
+            outer=petl.outerjoin,
+        )[mode]
+        table = join(table1, table2, "key")
+    return [list(cells) for cells in table][1:]
+
+
+@pytest.mark.parametrize("mode", ["inner", "left", "right", "outer", "negate"])
+def test_hash_joiner(mode):
+    left, right = create_tables(1000)
+    result = join_with_joiner(left, right, mode=mode)
+    assert result == join_with_petl(left, right, mode=mode)
+
+
+@pytest.mark.parametrize("mode", ["inner", "left", "right", "outer", "negate"])
+def test_hash_joiner_spilled(mode):
+    left, right = create_tables(40000)
+    result = join_with_joiner(left, right, mode=mode, memory=1)
+    assert result == join_with_petl(left, right, mode=mode)
+
+
+def test_hash_joiner_not_ordered():
+    left = [[1, "b", "x"], [2, "a", "y"], [3, "c", "z"], [4, "a", "w"]]
+    right = [["a", 1], ["b", 2], ["d", 3], ["a", 4]]
+    assert join_with_joiner(left, right, mode="outer", ordered=False) == [
+        [1, "b", "x", 2],
+        [2, "a", "y", 1],
+        [2, "a", "y", 4],
+        [3, "c", "z", None],
+        [4, "a", "w", 1],
+        [4, "a", "w", 4],
+        [None, "d", None, 3],
+    ]
+
+
+def test_hash_joiner_spilled_not_ordered():
+    left, right = create_tables(40000)
+    result = join_with_joiner(left, right, mode="outer", ordered=False, memory=1)
+    assert sorted(result, key=repr) == sorted(
+        join_with_petl(left, right, mode="outer"), key=repr
+    )
+
+
+def test_hash_joiner_removes_partitions(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    left, right = create_tables(40000)
+    joiner = HashJoiner([1], width=3, extra=1, memory=1)
+    keyed1 = (((cells[1],), cells) for cells in left)
+    keyed2 = (((cells[0],), tuple(cells[1:])) for cells in right)
+    rows = joiner.join(keyed1, keyed2)
+    next(rows)
+    assert list(tmp_path.iterdir())
+    rows.close()
+    assert list(tmp_path.iterdir()) == []
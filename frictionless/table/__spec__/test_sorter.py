@@ -0,0 +1,121 @@
+import datetime
+import random
+import tempfile
+from decimal import Decimal
+
+import petl
+import pytest
+
+from frictionless.table import ExternalSorter
+from frictionless.table import sorter as sorter_module
+
+# General
+
+
+def create_rows(count, *, seed=1):
+    rand = random.Random(seed)
+    names = ["a", "b", "c", None]
+    return [
+        [number, rand.choice(names), rand.randint(0, 1000)] for number in range(count)
+    ]
+
+
+def sort_with_petl(rows, indexes, *, reverse=False, buffersize=None):
+    header = ["id", "name", "value"]
+    key = [header[index] for index in indexes]
+    table = petl.sort([header] + rows, key, reverse=reverse, buffersize=buffersize)
+    return [list(cells) for cells in table][1:]
+
+
+def test_external_sorter():
+    rows = create_rows(1000)
+    sorter = ExternalSorter([1, 2])
+    assert [list(cells) for cells in sorter.sort(rows)] == sort_with_petl(rows, [1, 2])
+
+
+def test_external_sorter_reverse():
+    rows = create_rows(1000)
+    sorter = ExternalSorter([2], reverse=True)
+    result = [list(cells) for cells in sorter.sort(rows)]
+    assert result == sort_with_petl(rows, [2], reverse=True)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_external_sorter_spilled(parallel):
+    rows = create_rows(30000)
+    sorter = ExternalSorter([2, 1], memory=1, parallel=parallel)
+    result = [list(cells) for cells in sorter.sort(rows)]
+    assert result == sort_with_petl(rows, [2, 1])
+
+
+def test_external_sorter_spilled_compared_with_petl(tmp_path, monkeypatch):
+    runs = []
+    write_sorted_run = sorter_module.write_sorted_run
+
+    def write_counted_run(rows, **options):
+        runs.append(len(rows))
+        write_sorted_run(rows, **options)
+
+    monkeypatch.setattr(sorter_module, "write_sorted_run", write_counted_run)
+    rows = create_rows(30000)
+    sorter = ExternalSorter([2, 1], memory=1)
+    result = [list(cells) for cells in sorter.sort(rows)]
+
+    # PETL spills the same number of chunks when its buffer fits a run
+    header = ["id", "name", "value"]
+    key = ["value", "name"]
+    options = dict(buffersize=max(runs), tempdir=str(tmp_path))
+    table = petl.sort([header] + rows, key, **options)
+    iterator = iter(table)
+    next(iterator)
+    first = list(next(iterator))
+    assert len(list(tmp_path.iterdir())) == len(runs)
+    assert result == [first] + [list(cells) for cells in iterator]
+
+    # PETL's default buffer holds all the rows in memory
+    assert max(runs) < len(rows) <= petl.config.sort_buffersize
+
+
+def test_external_sorter_spilled_merged_in_passes(monkeypatch):
+    monkeypatch.setattr(sorter_module, "MERGE_SIZE", 2)
+    rows = create_rows(30000)
+    sorter = ExternalSorter([1], memory=1)
+    result = [list(cells) for cells in sorter.sort(rows)]
+    assert result == sort_with_petl(rows, [1])
+
+
+def test_external_sorter_spilled_typed_cells():
+    date = datetime.date(2020, 1, 1)
+    rows = [
+        [Decimal(number % 7), date + datetime.timedelta(number)]
+        for number in range(20000)
+    ]
+    sorter = ExternalSorter([0, 1], memory=1)
+    result = list(sorter.sort(rows))
+    assert result == sorted(rows)
+    assert isinstance(result[0][0], Decimal)
+    assert isinstance(result[0][1], datetime.date)
+
+
+def test_external_sorter_mixed_types():
+    rows = [["b"], [2], [None], [b"a"], [1.5], ["a"], [datetime.date(2020, 1, 1)]]
+    sorter = ExternalSorter([0])
+    assert [list(cells) for cells in sorter.sort(rows)] == [
+        list(cells) for cells in petl.sort([["name"]] + rows, "name")
+    ][1:]
+
+
+def test_external_sorter_short_rows():
+    rows = [[3, "c"], [1], [2, "b"], [1, "a"]]
+    sorter = ExternalSorter([1])
+    assert list(sorter.sort(rows)) == [[1], [1, "a"], [2, "b"], [3, "c"]]
+
+
+def test_external_sorter_removes_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    sorter = ExternalSorter([0], memory=1)
+    rows = sorter.sort(create_rows(30000))
+    next(rows)
+    assert list(tmp_path.iterdir())
+    rows.close()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from collections import Counter
+from functools import cached_property
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Set, Union
+
+from .. import errors
+from ..error import ErrorRecord
+from .row import Row
+
+if TYPE_CHECKING:
+    from ..schema import Field
+    from .row import _CellHandler
+
+
+class RowBatch:
+    """Row batch representation
+
+    > Constructor of this object is not Public API
+
+    A batch holds a number of consecutive records processed column by column:
+    every column is cast at once using the field's column reader so the
+    per-cell overhead of the `Row` processing is avoided. Rows are
+    available as lazy views sharing the batch's state.
+
+    ```python
+    with TableResource(path="data/table.csv") as resource:
+        for batch in resource.batch_stream:
+            # work with the RowBatch
+    ```
+
+    Parameters:
+        cells (any[][]): array of records
+        handlers (dict): cell handlers shared by every batch of the stream,
+            built once via `create_cell_handlers`
+        row_numbers (int[]): row numbers from 1
+    """
+
+    def __init__(
+        self,
+        cells: List[List[Any]],
+        *,
+        handlers: Dict[str, _CellHandler],
+        row_numbers: List[int],
+    ):
+        self.__cells = cells
+        self.__handlers = handlers
+        self.__row_numbers = row_numbers
+        self.__processed: bool = False
+        self.__columns: Dict[str, List[Any]] = {}
+        self.__sources: Dict[str, List[Any]] = {}
+        self.__blank_indexes: Dict[str, Set[int]] = {}
+        self.__error_indexes: Dict[str, Set[int]] = {}
+        self.__errors: Dict[int, List[Union[errors.RowError, ErrorRecord]]] = {}
+        self.__rows: Dict[int, Row] = {}
+
+    def __len__(self):
+        return len(self.__cells)
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(len(self.__cells)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> Row:
+        row = self.__rows.get(index)
+        if row is None:
+            row = Row(
+                self.__cells[index],
+                handlers=self.__handlers,
+                row_number=self.__row_numbers[index],
+                batch=self,
+                batch_index=index,
+            )
+            self.__rows[index] = row
+        return row
+
+    @cached_property
+    def cells(self) -> List[List[Any]]:
+        """
+        Returns:
+            any[][]: batch records
+        """
+        return self.__cells
+
+    @cached_property
+    def fields(self) -> List[Field]:
+        """
+        Returns:
+            Field[]: table schema fields
+        """
+        return [handler.field for handler in self.__handlers.values()]
+
+    @cached_property
+    def field_names(self) -> List[str]:
+        """
+        Returns:
+            str[]: field names
+        """
+        return list(self.__handlers)
+
+    @cached_property
+    def row_numbers(self) -> List[int]:
+        """
+        Returns:
+            int[]: row numbers from 1
+        """
+        return self.__row_numbers
+
+    @property
+    def columns(self) -> Dict[str, List[Any]]:
+        """A mapping indexed by a field name with parsed cells
+
+        Returns:
+            dict: batch columns
+        """
+        self.__process()
+        return self.__columns
+
+    @property
+    def errors(self) -> List[Union[errors.RowError, ErrorRecord]]:
+        """
+        Returns:
+            Error[]: batch errors ordered by row
+        """
+        self.__process()
+        return [
+            error for index in sorted(self.__errors) for error in self.__errors[index]
+        ]
+
+    @property
+    def valid(self) -> bool:
+        """
+        Returns:
+            bool: if all the batch rows are valid
+        """
+        self.__process()
+        return not any(self.__errors.values())
+
+    # Rows
+
+    def get_errors(self, index: int) -> List[Union[errors.RowError, ErrorRecord]]:
+        """Get the errors of a row (the list is shared with the row view)
+
+        Parameters:
+            index (int): position of the row in the batch
+
+        Returns:
+            Error[]: row errors
+        """
+        self.__process()
+        return self.__errors.setdefault(index, [])
+
+    def get_blank_cells(self, index: int) -> Dict[str, Any]:
+        """Get the blank cells of a row before parsing"""
+        self.__process()
+        result: Dict[str, Any] = {}
+        for name, indexes in self.__blank_indexes.items():
+            if index in indexes:
+                result[name] = self.__sources[name][index]
+        return result
+
+    def get_error_cells(self, index: int) -> Dict[str, Any]:
+        """Get the error cells of a row before parsing"""
+        self.__process()
+        result: Dict[str, Any] = {}
+        for name, indexes in self.__error_indexes.items():
+            if index in indexes:
+                result[name] = self.__sources[name][index]
+        return result
+
+    # Convert
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Returns:
+            dict: a batch as a dictionary of columns
+        """
+        return dict(self.columns)
+
+    # Process
+
+    def __process(self):
+        # NOTE:
+        # Errors must be the same (including the order) as `Row` creates
+        # so they are created only for the rows having any problem
+
+        # Exit if processed
+        if self.__processed:
+            return
+
+        # Prepare context
+        cells = self.__cells
+        handlers = self.__handlers
+        n_fields = len(handlers)
+        sources = list(zip_longest(*cells)) if cells else []
+        notes: Dict[str, Dict[int, Dict[str, str]]] = {}
+        blank_counter: Counter[int] = Counter()
+
+        # Read columns
+        for handler in handlers.values():
+            name = handler.field.name
+            position = handler.field_number - 1
+            column = (
+                list(sources[position])
+                if position < len(sources)
+                else [None] * len(cells)
+            )
+            values, column_notes = handler.column_reader(column)
+            error_indexes = {
+                index for index, note in column_notes.items() if "type" in note
+            }
+            blank_indexes = {
+                index
+                for index, value in enumerate(values)
+                if value is None and index not in error_indexes
+            }
+            blank_counter.update(blank_indexes)
+            self.__columns[name] = values
+            self.__sources[name] = column
+            self.__blank_indexes[name] = blank_indexes
+            self.__error_indexes[name] = error_indexes
+            if column_notes:
+                notes[name] = column_notes
+
+        # Find problems
+        problems: Set[int] = set()
+        for column_notes in notes.values():
+            problems.update(column_notes)
+        problems.update(
+            index for index, record in enumerate(cells) if len(record) != n_fields
+        )
+        blank_rows = {
+            index for index, count in blank_counter.items() if count == n_fields
+        }
+        if not n_fields:
+            blank_rows = set(range(len(cells)))
+        problems.update(blank_rows)
+
+        # Create errors
+        for index in sorted(problems):
+            self.__errors[index] = self.__create_errors(
+                index, notes=notes, blank=index in blank_rows
+            )
+
+        # Set processed
+        self.__processed = True
+
+    def __create_errors(
+        self,
+        index: int,
+        *,
+        notes: Dict[str, Dict[int, Dict[str, str]]],
+        blank: bool,
+    ) -> List[Union[errors.RowError, ErrorRecord]]:
+        cells = self.__cells[index]
+        row_number = self.__row_numbers[index]
+        row_errors: List[Union[errors.RowError, ErrorRecord]] = []
+
+        # Blank row
+        if blank:
+            row_errors.append(
+                ErrorRecord(
+                    errors.BlankRowError, note="", cells=cells, row_number=row_number
+                )
+            )
+            return row_errors
+
+        # Cell errors
+        for handler in self.__handlers.values():
+            name = handler.field.name
+            cell_notes = notes.get(name, {}).get(index)
+            if not cell_notes:
+                continue
+            source = self.__sources[name][index]
+            for note_name, note in cell_notes.items():
+                Error = (
+                    errors.TypeError if note_name == "type" else errors.ConstraintError
+                )
+                row_errors.append(
+                    ErrorRecord(
+                        Error,
+                        note=note,
+                        cells=cells,
+                        row_number=row_number,
+                        field_number=handler.field_number,
+                        field_name=name,
+                        source=source,
+                    )
+                )
+
+        # Extra cells
+        n_fields = len(self.__handlers)
+        if n_fields < len(cells):
+            start = n_fields + 1
+            for field_number, cell in enumerate(cells[n_fields:], start=start):
+                row_errors.append(
+                    ErrorRecord(
+                        errors.ExtraCellError,
+                        note="",
+                        cells=cells,
+                        row_number=row_number,
+                        field_number=field_number,
+                        field_name="",
+                        source=cell,
+                    )
+                )
+
+        # Missing cells
+        if n_fields > len(cells):
+            missing_handlers = list(self.__handlers.values())[len(cells) :]
+            for handler in missing_handlers:
+                row_errors.append(
+                    ErrorRecord(
+                        errors.MissingCellError,
+                        note="",
+                        cells=cells,
+                        row_number=row_number,
+                        field_number=handler.field_number,
+                        field_name=handler.field.name,
+                        source="",
+                    )
+                )
+
+        return row_errors
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import decimal
+import hashlib
+import mmap
+import os
+import shutil
+import sqlite3
+import struct
+import tempfile
+import weakref
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .. import errors, settings
+from ..exception import FrictionlessException
+
+# NOTE:
+# The compact and disk indexes compare the keys by a 128-bit hash of their
+# normalized representation. A false match is possible in theory but its
+# probability is negligible even for billions of keys
+
+PROBE_SIZE = 500
+RECORD = struct.Struct(">QQq")
+
+
+class IntegrityIndex:
+    """Index of the seen keys for the integrity checks (unique/primary key)
+
+    > Constructor of this object is not Public API
+
+    It maps every seen key to the row number where it has been seen last.
+    It's also used as a reference index for the foreign key checks.
+    """
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Any) -> Optional[int]:
+        """Get a key's row number
+
+        Parameters:
+            key (any): cell value or tuple of cell values
+
+        Returns:
+            int?: row number where the key has been seen last
+        """
+        raise NotImplementedError()
+
+    def contains_many(self, keys: List[Any]) -> List[bool]:
+        """Check membership of many keys at once
+
+        Parameters:
+            keys (any[]): cell values or tuples of cell values
+
+        Returns:
+            bool[]: whether every key is in the index
+        """
+        return [key in self for key in keys]
+
+    def update(self, key: Any, row_number: int) -> Optional[int]:
+        """Store a key's row number
+
+        Parameters:
+            key (any): cell value or tuple of cell values
+            row_number (int): row number from 1
+
+        Returns:
+            int?: row number where the key has been seen before
+        """
+        raise NotImplementedError()
+
+    def update_hash(self, high: int, low: int, row_number: int) -> Optional[int]:
+        """Store a row number by a hashed key (see `hash_key`)
+
+        Returns:
+            int?: row number where the key has been seen before
+        """
+        # A single 128-bit integer is about half the size of a pair of integers
+        return self.update((high << 64) | low, row_number)
+
+    def insert_hash(self, high: int, low: int, row_number: int) -> None:
+        """Store a row number by a hashed key known to be new (see `BloomFilter`)"""
+        self.update_hash(high, low, row_number)
+
+    def close(self) -> None:
+        """Release the index's resources"""
+        pass
+
+
+class MemoryIndex(IntegrityIndex):
+    """Integrity index keeping the keys as they are in a dictionary"""
+
+    def __init__(self):
+        self.__memory: Dict[Any, int] = {}
+
+    def get(self, key: Any) -> Optional[int]:
+        return self.__memory.get(key)
+
+    def update(self, key: Any, row_number: int) -> Optional[int]:
+        match = self.__memory.get(key)
+        self.__memory[key] = row_number
+        return match
+
+
+class CompactIndex(IntegrityIndex):
+    """Integrity index keeping fixed-width hashed keys in flat arrays
+
+    It's an open addressing hash table using 24 bytes per slot
+    which doesn't depend on the size of the keys.
+    """
+
+    def __init__(self, *, capacity: int = 1024):
+        self.__create(capacity)
+
+    def __len__(self):
+        return self.__count
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: size of the buffers in bytes
+        """
+        return self.__capacity * 24
+
+    def get(self, key: Any) -> Optional[int]:
+        return self.get_hash(*hash_key(key))
+
+    def update(self, key: Any, row_number: int) -> Optional[int]:
+        return self.update_hash(*hash_key(key), row_number)
+
+    def get_hash(self, high: int, low: int) -> Optional[int]:
+        """Get a row number by a hashed key"""
+        slot = self.__find(high, low)
+        return self.__rows[slot] or None
+
+    def update_hash(self, high: int, low: int, row_number: int) -> Optional[int]:
+        """Store a row number by a hashed key"""
+        slot = self.__find(high, low)
+        match = self.__rows[slot] or None
+        if match is None:
+            self.__high[slot] = high
+            self.__low[slot] = low
+            self.__count += 1
+        self.__rows[slot] = row_number
+        if self.__count * 2 > self.__capacity:
+            self.__resize(self.__capacity * 2)
+        return match
+
+    def items(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate over the hashed keys and their row numbers"""
+        for slot, row_number in enumerate(self.__rows):
+            if row_number:
+                yield self.__high[slot], self.__low[slot], row_number
+
+    def clear(self) -> None:
+        """Remove all the keys"""
+        self.__create(1024)
+
+    def save(self, path: str) -> None:
+        """Save the index as a sorted file to be opened by `MappedIndex`"""
+        with open(path, "wb") as file:
+            for item in sorted(self.items()):
+                file.write(RECORD.pack(*item))
+
+    # Internal
+
+    def __create(self, capacity: int):
+        self.__capacity = capacity
+        self.__mask = capacity - 1
+        self.__count = 0
+        self.__high = array("Q", bytes(8 * capacity))
+        self.__low = array("Q", bytes(8 * capacity))
+        self.__rows = array("q", bytes(8 * capacity))
+
+    def __find(self, high: int, low: int) -> int:
+        slot = low & self.__mask
+        while self.__rows[slot]:
+            if self.__low[slot] == low and self.__high[slot] == high:
+                break
+            slot = (slot + 1) & self.__mask
+        return slot
+
+    def __resize(self, capacity: int):
+        items = list(self.items())
+        self.__create(capacity)
+        for high, low, row_number in items:
+            slot = self.__find(high, low)
+            self.__high[slot] = high
+            self.__low[slot] = low
+            self.__rows[slot] = row_number
+        self.__count = len(items)
+
+
+class DiskIndex(IntegrityIndex):
+    """Integrity index spilling hashed keys to a SQLite database
+
+    The keys are kept in a compact index until it reaches
+    the memory budget; then they are moved to a temporary database.
+    The database is removed on closing the index or, if it's not closed
+    (e.g. a validation stopped at an error limit), on its garbage collection.
+
+    Parameters:
+        memory (int): memory budget in MB
+    """
+
+    def __init__(self, *, memory: int = settings.DEFAULT_LIMIT_MEMORY):
+        self.__buffer = CompactIndex()
+        self.__limit = memory * 1000000
+        self.__directory: Optional[str] = None
+        self.__database: Optional[sqlite3.Connection] = None
+        self.__finalizer: Optional[weakref.finalize] = None
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Returns:
+            bool: whether the keys have been moved to the disk
+        """
+        return self.__database is not None
+
+    def get(self, key: Any) -> Optional[int]:
+        high, low = hash_key(key)
+        match = self.__buffer.get_hash(high, low)
+        if match is None and self.__database is not None:
+            match = self.__select(high, low)
+        return match
+
+    def contains_many(self, keys: List[Any]) -> List[bool]:
+        hashes = [hash_key(key) for key in keys]
+        result = [self.__buffer.get_hash(*hash) is not None for hash in hashes]
+        if self.__database is not None:
+            # Keys not found in memory are probed in batches
+            blobs = [to_blob(*hash) for hash, found in zip(hashes, result) if not found]
+            found_blobs: Set[bytes] = set()
+            for start in range(0, len(blobs), PROBE_SIZE):
+                found_blobs.update(self.__select_many(blobs[start : start + PROBE_SIZE]))
+            for position, hash in enumerate(hashes):
+                if not result[position]:
+                    result[position] = to_blob(*hash) in found_blobs
+        return result
+
+    def update(self, key: Any, row_number: int) -> Optional[int]:
+        return self.update_hash(*hash_key(key), row_number)
+
+    def update_hash(self, high: int, low: int, row_number: int) -> Optional[int]:
+        match = self.__buffer.get_hash(high, low)
+        if match is None and self.__database is not None:
+            match = self.__select(high, low)
+        self.insert_hash(high, low, row_number)
+        return match
+
+    def insert_hash(self, high: int, low: int, row_number: int) -> None:
+        # The database is not queried as the key is known to be new
+        self.__buffer.update_hash(high, low, row_number)
+        if self.__buffer.nbytes > self.__limit:
+            self.__spill()
+
+    def close(self) -> None:
+        if self.__finalizer is not None:
+            self.__finalizer()
+            self.__finalizer = None
+        self.__database = None
+        self.__directory = None
+
+    # Internal
+
+    def __select(self, high: int, low: int) -> Optional[int]:
+        assert self.__database is not None
+        query = "SELECT row_number FROM keys WHERE key = ?"
+        result = self.__database.execute(query, (to_blob(high, low),)).fetchone()
+        return result[0] if result else None
+
+    def __select_many(self, blobs: List[bytes]) -> List[bytes]:
+        assert self.__database is not None
+        marks = ", ".join("?" * len(blobs))
+        query = f"SELECT key FROM keys WHERE key IN ({marks})"
+        return [row[0] for row in self.__database.execute(query, blobs)]
+
+    def __spill(self):
+        if self.__database is None:
+            self.__directory = tempfile.mkdtemp()
+            path = os.path.join(self.__directory, "index.db")
+            self.__database = sqlite3.connect(path)
+            self.__database.execute("PRAGMA journal_mode = OFF")
+            self.__database.execute("PRAGMA synchronous = OFF")
+            self.__database.execute(
+                "CREATE TABLE keys (key BLOB PRIMARY KEY, row_number INTEGER) "
+                "WITHOUT ROWID"
+            )
+            self.__finalizer = weakref.finalize(
+                self, remove_database, self.__database, self.__directory
+            )
+        query = "INSERT OR REPLACE INTO keys VALUES (?, ?)"
+        items = self.__buffer.items()
+        records = ((to_blob(high, low), row) for high, low, row in items)
+        with self.__database:
+            self.__database.executemany(query, records)
+        self.__buffer.clear()
+
+
+class MappedIndex(IntegrityIndex):
+    """Read-only integrity index memory-mapping a file saved by `CompactIndex`
+
+    The keys are found by a binary search on the sorted hashed keys
+    so the file can be shared by many processes without loading it.
+
+    Parameters:
+        path (str): path to the index file
+    """
+
+    def __init__(self, path: str):
+        self.__file = open(path, "rb")
+        self.__count = os.path.getsize(path) // RECORD.size
+        self.__buffer = None
+        if self.__count:
+            self.__buffer = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return self.__count
+
+    def get(self, key: Any) -> Optional[int]:
+        if self.__buffer is None:
+            return None
+        blob = to_blob(*hash_key(key))
+        lower, upper = 0, self.__count
+        while lower < upper:
+            middle = (lower + upper) // 2
+            offset = middle * RECORD.size
+            current = self.__buffer[offset : offset + 16]
+            if current == blob:
+                return RECORD.unpack_from(self.__buffer, offset)[2]
+            if current < blob:
+                lower = middle + 1
+            else:
+                upper = middle
+        return None
+
+    def close(self) -> None:
+        if self.__buffer is not None:
+            self.__buffer.close()
+            self.__buffer = None
+        self.__file.close()
+
+
+class BloomFilter:
+    """Probabilistic set of hashed keys (see `hash_key`)
+
+    It has no false negatives so a key not found in the filter is new
+    and the exact index doesn't need to be queried for it.
+
+    Parameters:
+        memory (int): size of the filter in MB
+        hashes (int): number of bits per key
+    """
+
+    def __init__(self, *, memory: int, hashes: int = 4):
+        self.__size = max(memory * 8000000, 1024)
+        self.__bits = bytearray(self.__size // 8)
+        self.__hashes = hashes
+
+    def add_hash(self, high: int, low: int) -> bool:
+        """Add a hashed key
+
+        Returns:
+            bool: whether the key might have been added before
+        """
+        found = True
+        for number in range(self.__hashes):
+            position = (high + number * low) % self.__size
+            mask = 1 << (position & 7)
+            if not self.__bits[position >> 3] & mask:
+                self.__bits[position >> 3] |= mask
+                found = False
+        return found
+
+
+def create_integrity_index(
+    type: str, *, memory: int = settings.DEFAULT_LIMIT_MEMORY
+) -> IntegrityIndex:
+    """Create an integrity index
+
+    Parameters:
+        type (str): "memory", "compact" or "disk"
+        memory (int): memory budget in MB (for the "disk" index)
+
+    Returns:
+        IntegrityIndex: integrity index
+    """
+    if type == "memory":
+        return MemoryIndex()
+    if type == "compact":
+        return CompactIndex()
+    if type == "disk":
+        return DiskIndex(memory=memory)
+    note = f'integrity index "{type}" is not supported'
+    raise FrictionlessException(errors.DetectorError(note=note))
+
+
+# Internal
+
+
+def hash_key(key: Any) -> Tuple[int, int]:
+    """Hash a key to two unsigned 64-bit integers"""
+    text = repr(normalize_key(key)).encode("utf-8")
+    digest = hashlib.blake2b(text, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big")
+
+
+def normalize_key(key: Any) -> Any:
+    """Normalize a key so equal values have the same representation"""
+    if isinstance(key, tuple):
+        return tuple(normalize_key(item) for item in key)  # type: ignore
+    if isinstance(key, bool):
+        return int(key)
+    if isinstance(key, decimal.Decimal) and key.is_finite():
+        if key == key.to_integral_value():
+            return int(key)
+        return float(key) if float(key) == key else key.normalize()
+    if isinstance(key, float):
+        if key.is_integer():
+            return int(key)
+        return key
+    return key
+
+
+def to_blob(high: int, low: int) -> bytes:
+    return high.to_bytes(8, "big") + low.to_bytes(8, "big")
+
+
+def remove_database(database: sqlite3.Connection, directory: str) -> None:
+    # A finalizer can be called from another thread
+    try:
+        database.close()
+    except sqlite3.ProgrammingError:
+        pass
+    shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .. import settings
+from .sorter import (
+    BLOCK_SIZE,
+    SAMPLE_SIZE,
+    ExternalSorter,
+    measure_row,
+    read_run_file,
+    write_block,
+)
+
+# NOTE:
+# The build side is indexed as a dict mapping a key to a tuple of values (or to a
+# list of tuples for duplicated keys) to keep the index compact. If it exceeds the
+# memory budget, both sides are partitioned to temporary files by the key's hash
+# (grace hash join) and every pair of partitions is joined the same way
+
+PARTITIONS = 64
+MAX_LEVEL = 4
+ENTRY_SIZE = 100
+
+IKeyedRows = Iterable[Tuple[Tuple[Any, ...], Sequence[Any]]]
+
+
+class HashJoiner:
+    """Hash join of rows
+
+    > Constructor of this object is not Public API
+
+    The rows of the right table (build side) are indexed by their keys and
+    the rows of the left table (probe side) are streamed against the index.
+    If the index doesn't fit the memory budget, both sides are partitioned
+    to temporary files and joined partition by partition. An output row is
+    the left row extended by the right row's values (the non-key cells).
+
+    Parameters:
+        indexes (int[]): indexes of the key cells in the left rows
+        width (int): number of cells in the left rows
+        extra (int): number of values in the right rows
+        mode (str): join mode (inner/left/right/outer/negate)
+        ordered (bool): emit the rows in key order (as a sort-merge join)
+        memory (int): memory budget in MB
+    """
+
+    def __init__(
+        self,
+        indexes: List[int],
+        *,
+        width: int,
+        extra: int,
+        mode: str = "inner",
+        ordered: bool = False,
+        memory: int = settings.DEFAULT_LIMIT_MEMORY,
+    ):
+        self.indexes = indexes
+        self.width = width
+        self.extra = extra
+        self.mode = mode
+        self.ordered = ordered
+        self.memory = memory
+
+    def join(self, left: IKeyedRows, right: IKeyedRows) -> Iterator[List[Any]]:
+        """Join rows
+
+        Parameters:
+            left (tuple[]): pairs of a key and the left row's cells
+            right (tuple[]): pairs of a key and the right row's values (a tuple)
+
+        Returns:
+            any[][]: joined rows
+        """
+        memory = max(self.memory // 2, 1) if self.ordered else self.memory
+        limit = max(memory * 1000000, 1)
+        rows = self.__join(iter(left), iter(right), level=0, limit=limit)
+        if not self.ordered:
+            yield from (cells for _, cells in rows)
+            return
+
+        # Order rows
+        size = len(self.indexes)
+        sorter = ExternalSorter(list(range(size)), memory=memory)
+        for cells in sorter.sort([*key, *cells] for key, cells in rows):
+            yield list(cells[size:])
+
+    # Internal
+
+    def __join(
+        self,
+        left: Iterator[Any],
+        right: Iterator[Any],
+        *,
+        level: int,
+        limit: int,
+    ) -> Iterator[Tuple[Any, List[Any]]]:
+        # A partition still exceeding the budget is split again unless
+        # its rows share a key (then the partitioning doesn't help)
+        index, rest = self.__build(right, limit=limit if level < MAX_LEVEL else None)
+        if rest is None:
+            yield from self.__probe(left, index)
+            return
+
+        # Spill partitions
+        directory = tempfile.mkdtemp()
+        try:
+            rows = chain(iterate_index(index), rest)
+            right_paths = self.__partition(
+                rows, level=level, path=directory, name="right"
+            )
+            index.clear()
+            left_paths = self.__partition(left, level=level, path=directory, name="left")
+            for left_path, right_path in zip(left_paths, right_paths):
+                yield from self.__join(
+                    read_run_file(left_path),
+                    read_run_file(right_path),
+                    level=level + 1,
+                    limit=limit,
+                )
+                os.remove(left_path)
+                os.remove(right_path)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def __build(
+        self, rows: Iterator[Any], *, limit: Optional[int]
+    ) -> Tuple[Dict[Any, Any], Optional[Iterator[Any]]]:
+        index: Dict[Any, Any] = {}
+        count = 0
+        size = 0
+        capacity = None
+        for key, values in rows:
+            entry = index.get(key)
+            if entry is None:
+                index[key] = values
+            elif isinstance(entry, list):
+                entry.append(values)  # type: ignore
+            else:
+                index[key] = [entry, values]
+            count += 1
+
+            # The size of the index is estimated by a sample
+            if capacity is None:
+                if limit is not None:
+                    size += measure_row(key) + measure_row(values) + ENTRY_SIZE
+                    if count == SAMPLE_SIZE:
+                        capacity = max(int(limit / (size / count)), SAMPLE_SIZE)
+            elif count >= capacity:
+                following = next(rows, None)
+                if following is None:
+                    break
+                return index, chain([following], rows)
+
+        return index, None
+
+    def __probe(
+        self, rows: Iterator[Any], index: Dict[Any, Any]
+    ) -> Iterator[Tuple[Any, List[Any]]]:
+        matched = set() if self.mode in ["right", "outer"] else None
+        for key, cells in rows:
+            entry = index.get(key)
+            if self.mode == "negate":
+                if entry is None:
+                    yield key, list(cells)
+                continue
+            if entry is None:
+                if self.mode in ["left", "outer"]:
+                    yield key, self.__create_left(cells) + [None] * self.extra
+                continue
+            if matched is not None:
+                matched.add(key)
+            for values in iterate_entry(entry):
+                yield key, self.__create_left(cells) + list(values)
+
+        # Unmatched right rows
+        if matched is not None:
+            for key, entry in index.items():
+                if key not in matched:
+                    for values in iterate_entry(entry):
+                        yield key, self.__create_right(key) + list(values)
+
+    def __partition(
+        self, rows: Iterator[Any], *, level: int, path: str, name: str
+    ) -> List[str]:
+        paths = [os.path.join(path, f"{name}-{number}") for number in range(PARTITIONS)]
+        blocks: List[List[Any]] = [[] for _ in paths]
+        files = [open(path, "wb") for path in paths]
+        try:
+            for key, cells in rows:
+                number = hash((level, key)) % PARTITIONS
+                block = blocks[number]
+                block.append((key, cells))
+                if len(block) >= BLOCK_SIZE:
+                    write_block(block, file=files[number])
+                    block.clear()
+            for block, file in zip(blocks, files):
+                if block:
+                    write_block(block, file=file)
+        finally:
+            for file in files:
+                file.close()
+        return paths
+
+    def __create_left(self, cells: Sequence[Any]) -> List[Any]:
+        result = list(cells[: self.width])
+        if len(result) < self.width:
+            result.extend([None] * (self.width - len(result)))
+        return result
+
+    def __create_right(self, key: Tuple[Any, ...]) -> List[Any]:
+        result: List[Any] = [None] * self.width
+        for index, cell in zip(self.indexes, key):
+            result[index] = cell
+        return result
+
+
+# Internal
+
+
+def iterate_entry(entry: Any) -> List[Tuple[Any, ...]]:
+    return entry if isinstance(entry, list) else [entry]
+
+
+def iterate_index(index: Dict[Any, Any]) -> Iterator[Tuple[Any, Any]]:
+    for key, entry in index.items():
+        for values in iterate_entry(entry):
+            yield key, values
@@ -1,5 +1,163 @@
-from typing import Any, Dict
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+import attrs
+
+if TYPE_CHECKING:
+    from ..resource import Resource
+    from ..resources import TableResource
+    from .index import IntegrityIndex
 
 
 class Lookup(Dict[str, Any]):
     pass
+
+
+class ReferenceCache:
+    """Cache of the reference indexes shared by the resources of a package
+
+    > Constructor of this object is not Public API
+
+    A reference index contains the keys of a resource referenced by
+    foreign keys. It's built only once for every resource and key and
+    it's rebuilt if the resource changes (see `create_fingerprint`).
+    An index stored without a fingerprint is pinned: it's always used
+    (e.g. an index built by the parent process of a parallel validation).
+    Replaced and removed indexes are not closed as an open resource
+    might still use them; they are freed (e.g. a disk index removes its
+    database) when they are not referenced anymore.
+    """
+
+    def __init__(self):
+        self.__items: Dict[
+            Tuple[str, Tuple[str, ...]], Tuple[Optional[str], IntegrityIndex]
+        ] = {}
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        return iter(list(self.__items))
+
+    def get(
+        self, name: str, key: Tuple[str, ...], *, fingerprint: Optional[str]
+    ) -> Optional[IntegrityIndex]:
+        """Get a reference index if it's up-to-date
+
+        Parameters:
+            name (str): resource name
+            key (str[]): referenced field names
+            fingerprint (str?): resource fingerprint
+
+        Returns:
+            IntegrityIndex?: reference index
+        """
+        item = self.__items.get((name, key))
+        if item and (item[0] is None or item[0] == fingerprint):
+            return item[1]
+
+    def set(
+        self,
+        name: str,
+        key: Tuple[str, ...],
+        index: IntegrityIndex,
+        *,
+        fingerprint: Optional[str],
+    ) -> None:
+        """Store a reference index replacing an outdated one
+
+        Parameters:
+            name (str): resource name
+            key (str[]): referenced field names
+            index (IntegrityIndex): reference index
+            fingerprint (str?): resource fingerprint or None to pin the index
+        """
+        self.__items[(name, key)] = (fingerprint, index)
+
+    def remove(self, name: str, key: Tuple[str, ...]) -> None:
+        """Remove a reference index
+
+        Parameters:
+            name (str): resource name
+            key (str[]): referenced field names
+        """
+        self.__items.pop((name, key), None)
+
+    def clear(self) -> None:
+        """Remove all the reference indexes"""
+        for _, index in self.__items.values():
+            index.close()
+        self.__items = {}
+
+
+def create_fingerprint(resource: Resource) -> Optional[str]:
+    """Create a fingerprint of a resource's data
+
+    It's based on the modification time and size of the resource's local files
+    or on the resource's hash for remote files. The resource's descriptor
+    is taken into account as well as it affects how the data is read.
+
+    Parameters:
+        resource (Resource): resource
+
+    Returns:
+        str?: fingerprint or None if the resource can't be fingerprinted
+    """
+    if resource.memory:
+        return None
+    if resource.remote and not resource.hash:
+        return None
+    descriptor = resource.to_descriptor()
+    descriptor.pop("stats", None)
+    state: Dict[str, Any] = {"descriptor": descriptor}
+    if not resource.remote:
+        files = []
+        for path in resource.normpaths:
+            if not os.path.isfile(path):
+                return None
+            stat = os.stat(path)
+            files.append([path, stat.st_mtime_ns, stat.st_size])
+        state["files"] = files
+    return json.dumps(state, sort_keys=True, default=str)
+
+
+def copy_reference_source(resource: Resource) -> Resource:
+    """Copy a resource to be read as a foreign key reference
+
+    A copy is needed as the resource is closed after reading the keys.
+    Otherwise, this would cause issues in case of circular references.
+
+    Parameters:
+        resource (Resource): referenced resource
+
+    Returns:
+        Resource: copy without foreign keys and hashing
+    """
+    source = resource.to_copy()
+    if source.schema:
+        source.schema.foreign_keys = []
+
+    # Stats of the lookup's source are not used
+    source.detector = attrs.evolve(source.detector, hashing=[])
+    return source
+
+
+def read_reference_index(
+    source: TableResource, key: Tuple[str, ...], index: IntegrityIndex
+) -> None:
+    """Store the keys of a reference resource in an index
+
+    Parameters:
+        source (TableResource): resource created by `copy_reference_source`
+        key (str[]): referenced field names
+        index (IntegrityIndex): index to update
+    """
+    with source:
+        for row in source.row_stream:
+            cells = tuple(row.get(field_name) for field_name in key)
+            if set(cells) == {None}:
+                continue
+            index.update(cells, row.row_number)
@@ -2,12 +2,25 @@ from __future__ import annotations
 
 from functools import cached_property
 from itertools import zip_longest
-from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
 from .. import errors, helpers
+from ..error import ErrorRecord
 from ..platform import platform
 from ..schema import Field
 
+if TYPE_CHECKING:
+    from .batch import RowBatch
+
 # NOTE:
 # Currently dict.update/setdefault/pop/popitem/clear is not disabled (can be confusing)
 # We can consider adding row.header property to provide more comprehensive API
@@ -18,6 +31,7 @@ class _CellHandler(NamedTuple):
     field_number: int
     reader: Callable[..., Any]
     writer: Callable[..., Any]
+    column_reader: Callable[..., Any]
 
 
 def create_cell_handlers(fields: List[Field]) -> Dict[str, _CellHandler]:
@@ -37,6 +51,7 @@ def create_cell_handlers(fields: List[Field]) -> Dict[str, _CellHandler]:
             field_number=field_number,
             reader=field.create_cell_reader(),
             writer=field.create_cell_writer(),
+            column_reader=field.create_column_reader(),
         )
     return handlers
 
@@ -60,6 +75,8 @@ class Row(Dict[str, Any]):
         handlers (dict): cell handlers shared by every row of the stream,
             built once via `create_cell_handlers`
         row_number (int): row number from 1
+        batch (RowBatch): batch already processed the row (the row is its view)
+        batch_index (int): position of the row in the batch
     """
 
     def __init__(
@@ -68,14 +85,18 @@ class Row(Dict[str, Any]):
         *,
         handlers: Dict[str, _CellHandler],
         row_number: int,
+        batch: Optional[RowBatch] = None,
+        batch_index: int = 0,
     ):
         self.__cells = cells
         self.__handlers = handlers
         self.__row_number = row_number
+        self.__batch = batch
+        self.__batch_index = batch_index
         self.__processed: bool = False
         self.__blank_cells: Dict[str, Any] = {}
         self.__error_cells: Dict[str, Any] = {}
-        self.__errors: list[errors.RowError] = []
+        self.__errors: list[Union[errors.RowError, ErrorRecord]] = []
 
     def __eq__(self, other: object):
         self.__process()
@@ -197,6 +218,8 @@ class Row(Dict[str, Any]):
     @cached_property
     def errors(self):
         """
+        Cell and blank row errors are compact records (see `ErrorRecord`)
+
         Returns:
             Error[]: row errors
         """
@@ -303,9 +326,12 @@ class Row(Dict[str, Any]):
         if self.__processed:
             return
 
+        # Read from batch
+        if self.__batch is not None:
+            return self.__process_batch(self.__batch, key)
+
         # Prepare context
         cells = self.__cells
-        to_str = lambda v: str(v) if v is not None else ""  # type: ignore
         handlers = self.__handlers
         is_empty = not bool(super().__len__())
         if key:
@@ -341,13 +367,14 @@ class Row(Dict[str, Any]):
             if type_note:
                 self.__error_cells[field.name] = source
                 self.__errors.append(
-                    errors.TypeError(
+                    ErrorRecord(
+                        errors.TypeError,
                         note=type_note,
-                        cells=list(map(to_str, cells)),  # type: ignore
+                        cells=cells,
                         row_number=self.__row_number,
-                        cell=str(source),
-                        field_name=field.name,
                         field_number=handler.field_number,
+                        field_name=field.name,
+                        source=source,
                     )
                 )
 
@@ -355,13 +382,14 @@ class Row(Dict[str, Any]):
             if notes:
                 for note in notes.values():
                     self.__errors.append(
-                        errors.ConstraintError(
+                        ErrorRecord(
+                            errors.ConstraintError,
                             note=note,
-                            cells=list(map(to_str, cells)),  # type: ignore
+                            cells=cells,
                             row_number=self.__row_number,
-                            cell=str(source),
-                            field_name=field.name,
                             field_number=handler.field_number,
+                            field_name=field.name,
+                            source=source,
                         )
                     )
 
@@ -376,13 +404,14 @@ class Row(Dict[str, Any]):
             start = n_fields + 1
             for field_number, cell in enumerate(cells[n_fields:], start=start):
                 self.__errors.append(
-                    errors.ExtraCellError(
+                    ErrorRecord(
+                        errors.ExtraCellError,
                         note="",
-                        cells=list(map(to_str, cells)),  # type: ignore
+                        cells=cells,
                         row_number=self.__row_number,
-                        cell=str(cell),
-                        field_name="",
                         field_number=field_number,
+                        field_name="",
+                        source=cell,
                     )
                 )
 
@@ -391,25 +420,48 @@ class Row(Dict[str, Any]):
             missing_handlers = list(handlers.values())[len(cells) :]
             for handler in missing_handlers:
                 self.__errors.append(
-                    errors.MissingCellError(
+                    ErrorRecord(
+                        errors.MissingCellError,
                         note="",
-                        cells=list(map(to_str, cells)),  # type: ignore
+                        cells=cells,
                         row_number=self.__row_number,
-                        cell="",
-                        field_name=handler.field.name,
                         field_number=handler.field_number,
+                        field_name=handler.field.name,
+                        source="",
                     )
                 )
 
         # Blank row
         if n_fields == len(self.__blank_cells):
             self.__errors = [
-                errors.BlankRowError(
+                ErrorRecord(
+                    errors.BlankRowError,
                     note="",
-                    cells=list(map(to_str, cells)),  # type: ignore
+                    cells=cells,
                     row_number=self.__row_number,
                 )
             ]
 
         # Set processed
         self.__processed = True
+
+    def __process_batch(self, batch: RowBatch, key: Optional[str] = None):
+        index = self.__batch_index
+        if key and key not in self.__handlers:
+            raise KeyError(f"Row does not have a field {key}")
+
+        # Copy values
+        is_empty = not bool(super().__len__())
+        for name, column in batch.columns.items():
+            if is_empty or not super().__contains__(name):
+                super().__setitem__(name, column[index])
+
+        # Copy state
+        self.__blank_cells = batch.get_blank_cells(index)
+        self.__error_cells = batch.get_error_cells(index)
+        self.__errors = batch.get_errors(index)
+
+        # Set processed
+        self.__processed = True
+        if key:
+            return super().__getitem__(key)
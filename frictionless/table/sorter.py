@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import heapq
+import marshal
+import os
+import pickle
+import shutil
+import struct
+import sys
+import tempfile
+from itertools import chain, islice
+from multiprocessing import Pool
+from typing import Any, BinaryIO, Iterable, Iterator, List, Sequence, Tuple
+
+from .. import settings
+from ..platform import platform
+
+# NOTE:
+# The runs are written as blocks of rows serialized with marshal (it's fast and
+# compact but only supports the builtin types) or with pickle if a block has
+# other values like dates or decimals. Cells keep their types in both cases
+
+BLOCK_SIZE = 1000
+MERGE_SIZE = 256
+SAMPLE_SIZE = 100
+BLOCK_HEADER = struct.Struct(">cI")
+NUMERIC_TYPES = (bool, int, float, decimal.Decimal)
+NATIVE_TYPES = (str, bytes, datetime.date, datetime.time, datetime.timedelta)
+
+
+class ExternalSorter:
+    """External merge sort of rows
+
+    > Constructor of this object is not Public API
+
+    The rows are sorted in memory in runs fitting the memory budget. If there
+    is more than one run, the sorted runs are spilled to temporary files and
+    merged with a k-way heap. The runs can be sorted and written in parallel
+    by worker processes. The order is the same as PETL's sort: None is the
+    smallest value, then numbers, then other values by type and value.
+
+    Parameters:
+        indexes (int[]): indexes of the cells to sort by
+        reverse (bool): sort in descending order
+        memory (int): memory budget in MB
+        parallel (bool): sort the runs in worker processes
+    """
+
+    def __init__(
+        self,
+        indexes: List[int],
+        *,
+        reverse: bool = False,
+        memory: int = settings.DEFAULT_LIMIT_MEMORY,
+        parallel: bool = False,
+    ):
+        self.key = SortKey(indexes)
+        self.reverse = reverse
+        self.memory = memory
+        self.parallel = parallel
+
+    def sort(self, rows: Iterable[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        """Sort rows
+
+        Parameters:
+            rows (any[][]): rows (without a header)
+
+        Returns:
+            any[][]: sorted rows
+        """
+        rows = iter(rows)
+        processes = (os.cpu_count() or 1) if self.parallel else 0
+
+        # Every worker and the reader hold a run so they share the budget
+        limit = max(self.memory * 1000000 // (processes + 1), 1)
+
+        # Fits in memory
+        run = read_run(rows, limit=limit)
+        following = next(rows, None)
+        if following is None:
+            run.sort(key=self.key, reverse=self.reverse)
+            yield from run
+            return
+        rows = chain([following], rows)
+
+        # Spill runs
+        directory = tempfile.mkdtemp()
+        try:
+            paths: List[str] = []
+            pool = Pool(processes) if processes else None
+            try:
+                pending: List[Any] = []
+                while run:
+                    path = os.path.join(directory, f"run-{len(paths)}")
+                    options = dict(key=self.key, reverse=self.reverse, path=path)
+                    if pool:
+                        pending.append(
+                            pool.apply_async(write_sorted_run, (run,), options)
+                        )
+                        if len(pending) >= processes:
+                            pending.pop(0).get()
+                    else:
+                        write_sorted_run(run, **options)  # type: ignore
+                    paths.append(path)
+                    run = read_run(rows, limit=limit)
+                for result in pending:
+                    result.get()
+            finally:
+                if pool:
+                    pool.close()
+                    pool.join()
+            paths = self.__reduce(paths, directory=directory)
+            yield from self.__merge(paths)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    # Internal
+
+    def __reduce(self, paths: List[str], *, directory: str) -> List[str]:
+        # The runs are merged in groups (keeping their order for a stable sort)
+        # until they can be merged at once to limit the number of open files
+        while len(paths) > MERGE_SIZE:
+            groups = [paths[i : i + MERGE_SIZE] for i in range(0, len(paths), MERGE_SIZE)]
+            paths = []
+            for group in groups:
+                path = os.path.join(directory, f"merge-{os.path.basename(group[0])}")
+                write_run(self.__merge(group), path=path)
+                for item in group:
+                    os.remove(item)
+                paths.append(path)
+        return paths
+
+    def __merge(self, paths: List[str]) -> Iterator[Sequence[Any]]:
+        runs = [read_run_file(path) for path in paths]
+        yield from heapq.merge(*runs, key=self.key, reverse=self.reverse)
+
+
+class SortKey:
+    """Sort key of a row (see `ExternalSorter`)
+
+    > Constructor of this object is not Public API
+
+    It's a class (not a closure) to be passed to worker processes.
+    """
+
+    def __init__(self, indexes: List[int]):
+        self.indexes = indexes
+
+    def __call__(self, cells: Sequence[Any]) -> Tuple[Any, ...]:
+        size = len(cells)
+        key: List[Any] = []
+        for index in self.indexes:
+            cell = cells[index] if index < size else None
+            if cell is None:
+                key.append((0,))
+            elif isinstance(cell, NUMERIC_TYPES):
+                key.append((1, "", cell))
+            elif isinstance(cell, NATIVE_TYPES):
+                key.append((2, type_name(cell), cell))
+            else:
+                Comparable = platform.petl.comparison.Comparable
+                key.append((2, type_name(cell), Comparable(cell)))
+        return tuple(key)
+
+
+# Internal
+
+
+def read_run(rows: Iterator[Sequence[Any]], *, limit: int) -> List[Sequence[Any]]:
+    """Read rows fitting the memory limit (the size is estimated by a sample)"""
+    run = list(islice(rows, SAMPLE_SIZE))
+    if len(run) == SAMPLE_SIZE:
+        size = sum(measure_row(cells) for cells in run) / SAMPLE_SIZE
+        capacity = max(int(limit / size), SAMPLE_SIZE)
+        run.extend(islice(rows, capacity - SAMPLE_SIZE))
+    return run
+
+
+def measure_row(cells: Sequence[Any]) -> int:
+    return sys.getsizeof(cells) + sum(sys.getsizeof(cell) for cell in cells)
+
+
+def type_name(value: Any) -> str:
+    # The same type order as PETL's Comparable (bytes < str)
+    if isinstance(value, bytes):
+        return "str"
+    if isinstance(value, str):
+        return "unicode"
+    return type(value).__name__
+
+
+def write_sorted_run(
+    rows: List[Sequence[Any]], *, key: SortKey, reverse: bool, path: str
+) -> None:
+    rows.sort(key=key, reverse=reverse)
+    write_run(rows, path=path)
+
+
+def write_run(rows: Iterable[Sequence[Any]], *, path: str) -> None:
+    rows = iter(rows)
+    with open(path, "wb") as file:
+        while True:
+            block = list(islice(rows, BLOCK_SIZE))
+            if not block:
+                break
+            write_block(block, file=file)
+
+
+def write_block(block: List[Any], *, file: BinaryIO) -> None:
+    try:
+        codec, data = b"m", marshal.dumps(block)
+    except ValueError:
+        codec, data = b"p", pickle.dumps(block, protocol=pickle.HIGHEST_PROTOCOL)
+    file.write(BLOCK_HEADER.pack(codec, len(data)))
+    file.write(data)
+
+
+def read_run_file(path: str) -> Iterator[Sequence[Any]]:
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(BLOCK_HEADER.size)
+            if not header:
+                break
+            codec, size = BLOCK_HEADER.unpack(header)
+            data = file.read(size)
+            yield from marshal.loads(data) if codec == b"m" else pickle.loads(data)
@@ -0,0 +1,120 @@
+import pytest
+
+from frictionless import FrictionlessException, Pipeline, Step, steps
+from frictionless.resources import TableResource
+from frictionless.transformer.transformer import FusedData
+
+# General
+
+
+def test_resource_transform_fused():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.table_normalize(),
+            steps.row_filter(formula="id > 1"),
+            steps.field_add(name="note", value="x", position=2),
+            steps.cell_convert(field_name="name", function=str.upper),
+            steps.field_remove(names=["population"]),
+            steps.table_normalize(),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert isinstance(target.data.data, FusedData)
+    assert len(target.data.data.chain) == 6
+    assert target.schema.to_descriptor() == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "note", "type": "any"},
+            {"name": "name", "type": "string"},
+        ]
+    }
+    assert target.read_rows() == [
+        {"id": 2, "note": "x", "name": "FRANCE"},
+        {"id": 3, "note": "x", "name": "SPAIN"},
+    ]
+
+
+def test_resource_transform_fused_with_regular_step():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.table_normalize(),
+            steps.cell_convert(field_name="name", function=str.upper),
+            steps.row_subset(subset="distinct", field_name="name"),
+            steps.row_slice(head=2),
+            steps.field_filter(names=["name"]),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert len(target.data.data.chain) == 2
+    assert target.read_rows() == [
+        {"name": "FRANCE"},
+        {"name": "GERMANY"},
+    ]
+
+
+def test_resource_transform_fused_the_same_as_regular(monkeypatch):
+    def transform():
+        source = TableResource(path="data/transform.csv")
+        pipeline = Pipeline(
+            steps=[
+                steps.cell_set(field_name="population", value="100"),
+                steps.table_normalize(),
+                steps.field_update(name="population", formula="population * id"),
+                steps.field_move(name="population", position=1),
+                steps.row_search(regex="^s", field_name="name", negate=True),
+            ],
+        )
+        target = source.transform(pipeline)
+        cells = [list(cells) for cells in target.read_cells()]
+        return target.schema.to_descriptor(), cells
+
+    fused = transform()
+    for Class in Step.__subclasses__():
+        monkeypatch.setattr(Class, "transform_rows", Step.transform_rows)
+    assert transform() == fused
+    assert fused[1] == [
+        ["population", "id", "name"],
+        [100, 1, "germany"],
+        [200, 2, "france"],
+    ]
+
+
+# Problems
+
+
+def test_resource_transform_fused_step_error():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.table_normalize(),
+            steps.row_filter(function=lambda row: row["bad"]),
+            steps.cell_set(field_name="name", value="x"),
+        ],
+    )
+    target = source.transform(pipeline)
+    with pytest.raises(FrictionlessException) as excinfo:
+        target.read_rows()
+    error = excinfo.value.error
+    assert error.type == "step-error"
+    assert error.note.startswith('"row_filter" raises')
+
+
+@pytest.mark.parametrize(
+    "step",
+    [
+        steps.cell_set(field_name="nope", value="x"),
+        steps.cell_convert(field_name="nope", value="x"),
+        steps.row_sort(field_names=["nope"]),
+    ],
+)
+def test_resource_transform_fused_field_not_found(step):
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(steps=[step, steps.cell_set(field_name="name", value="x")])
+    target = source.transform(pipeline)
+    with pytest.raises(FrictionlessException) as excinfo:
+        target.read_rows()
+    error = excinfo.value.error
+    assert error.type == "step-error"
+    assert "selection is not a field or valid field index: 'nope'" in error.note
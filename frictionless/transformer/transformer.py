@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import itertools
+from typing import TYPE_CHECKING, Any, List, Tuple
 
-from .. import errors
+from .. import errors, helpers
 from ..dialect import Dialect
 from ..exception import FrictionlessException
 from ..helpers import get_name
@@ -10,7 +11,7 @@ from ..pipeline import Pipeline
 
 if TYPE_CHECKING:
     from ..package import Package
-    from ..pipeline import Step
+    from ..pipeline import IRows, IRowsProcessor, Step
     from ..resources import TableResource
 
 
@@ -37,12 +38,23 @@ class Transformer:
         pipeline = pipeline or Pipeline()
 
         # Run transforms
+        # The consecutive row-wise steps are fused to read the data only once
+        view: Any = None
+        chain: List[Tuple[Step, IRowsProcessor]] = []
         for step in pipeline.steps:
             data = resource.data
 
             # Transform
             try:
-                step.transform_resource(resource)
+                if not chain:
+                    view = resource.to_petl()
+                processor = step.transform_rows(resource)
+                if processor:
+                    chain.append((step, processor))
+                    resource.data = FusedData(view, chain=list(chain))
+                else:
+                    chain = []
+                    step.transform_resource(resource)
             except Exception as exception:
                 error = errors.StepError(note=f'"{get_name(step)}" raises "{exception}"')
                 raise FrictionlessException(error) from exception
@@ -60,8 +72,7 @@ class Transformer:
                 resource.extrapaths = []
                 resource.innerpath = None
                 resource.dialect = Dialect()
-                resource.stats.md5 = None
-                resource.stats.sha256 = None
+                resource.stats.set_hashes({})
                 resource.stats.bytes = None
                 resource.stats.fields = None
                 resource.stats.rows = None
@@ -72,6 +83,31 @@ class Transformer:
 # Internal
 
 
+class FusedData:
+    def __init__(self, view: Any, *, chain: List[Tuple[Step, IRowsProcessor]]):
+        self.view = view
+        self.chain = chain
+
+    def __repr__(self):
+        return "<transformed-data>"
+
+    def __iter__(self):  # type: ignore
+        rows: IRows = self.view
+        for step, processor in self.chain:
+            rows = read_fused_rows(rows, processor=processor)
+            rows = DataWithErrorHandling(rows, step=step)
+        yield from rows
+
+
+def read_fused_rows(rows: IRows, *, processor: IRowsProcessor):
+    # The header is read by the next step as resource's labels
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is not None:
+        rows = itertools.chain([helpers.stringify_label(header)], rows)  # type: ignore
+    yield from processor(rows)
+
+
 # TODO: do we need error handling here?
 class DataWithErrorHandling:
     def __init__(self, data: Any, *, step: Step):